@@ -11,6 +11,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from aws_embedded_metrics import constants
+from aws_embedded_metrics.validation_mode import ValidationMode
 from importlib.metadata import version as get_version
 import logging
 from typing import Optional
@@ -31,6 +33,12 @@ class Configuration:
         namespace: str = None,
         disable_metric_extraction: bool = False,
         environment: Optional[str] = None,
+        json_encoder: Optional[str] = None,
+        max_event_size: Optional[int] = None,
+        compress_values: bool = False,
+        validation: Optional[str] = None,
+        aggregation_flush_interval: Optional[int] = None,
+        aggregation_socket: Optional[str] = None,
     ):
         self.debug_logging_enabled = debug_logging_enabled
         self.service_name = service_name
@@ -43,6 +51,22 @@ class Configuration:
         self.disable_metric_extraction = disable_metric_extraction
         self.default_flush_on_yield = Configuration._get_default_flush_on_yield()
         self.environment = environment
+        self.json_encoder = json_encoder
+        self.max_event_size = max_event_size or constants.MAX_EVENT_SIZE_BYTES
+        self.compress_values = compress_values
+        self.validation_mode = Configuration._get_validation_mode(validation)
+        self.aggregation_flush_interval = aggregation_flush_interval or constants.DEFAULT_AGGREGATION_FLUSH_INTERVAL
+        self.aggregation_socket = aggregation_socket
+
+    @staticmethod
+    def _get_validation_mode(validation: Optional[str]) -> ValidationMode:
+        if not validation:
+            return ValidationMode.STRICT
+        try:
+            return ValidationMode(validation.lower())
+        except ValueError:
+            log.warning("Unknown validation mode %s, defaulting to %s", validation, ValidationMode.STRICT.value)
+            return ValidationMode.STRICT
 
     @staticmethod
     def _get_default_flush_on_yield() -> bool:
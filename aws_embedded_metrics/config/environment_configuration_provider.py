@@ -11,8 +11,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import logging
 import os
 from aws_embedded_metrics.config.configuration import Configuration
+from typing import Optional
+
+log = logging.getLogger(__name__)
 
 ENV_VAR_PREFIX = "AWS_EMF"
 
@@ -26,6 +30,12 @@ EC2_METADATA_ENDPOINT = "EC2_METADATA_ENDPOINT"
 NAMESPACE = "NAMESPACE"
 DISABLE_METRIC_EXTRACTION = "DISABLE_METRIC_EXTRACTION"
 ENVIRONMENT_OVERRIDE = "ENVIRONMENT"
+JSON_ENCODER = "JSON_ENCODER"
+MAX_EVENT_SIZE = "MAX_EVENT_SIZE"
+COMPRESS_VALUES = "COMPRESS_VALUES"
+VALIDATION = "VALIDATION"
+AGGREGATION_FLUSH_INTERVAL = "AGGREGATION_FLUSH_INTERVAL"
+AGGREGATION_SOCKET = "AGGREGATION_SOCKET"
 
 
 class EnvironmentConfigurationProvider:
@@ -45,6 +55,12 @@ class EnvironmentConfigurationProvider:
             self.__get_env_var(NAMESPACE),
             self.__get_bool_env_var(DISABLE_METRIC_EXTRACTION),
             self.__get_env_var(ENVIRONMENT_OVERRIDE),
+            self.__get_env_var(JSON_ENCODER),
+            self.__get_int_env_var(MAX_EVENT_SIZE),
+            self.__get_bool_env_var(COMPRESS_VALUES),
+            self.__get_env_var(VALIDATION),
+            self.__get_int_env_var(AGGREGATION_FLUSH_INTERVAL),
+            self.__get_env_var(AGGREGATION_SOCKET),
         )
 
     @staticmethod
@@ -60,3 +76,14 @@ class EnvironmentConfigurationProvider:
         if value is None:
             return False
         return value.lower() == "true"
+
+    @staticmethod
+    def __get_int_env_var(key: str) -> Optional[int]:
+        value = os.environ.get(f"{ENV_VAR_PREFIX}_{key}")
+        if value is None:
+            return None
+        try:
+            return int(value)
+        except ValueError:
+            log.warning("Ignoring %s_%s, expected an integer but got: %s", ENV_VAR_PREFIX, key, value)
+            return None
@@ -14,6 +14,11 @@
 DEFAULT_NAMESPACE = "aws-embedded-metrics"
 MAX_METRICS_PER_EVENT = 100
 MAX_DATAPOINTS_PER_METRIC = 100
+MAX_EVENT_SIZE_BYTES = 256 * 1024  # CloudWatch Logs event size limit
+DEFAULT_AGGREGATION_FLUSH_INTERVAL = 60  # seconds
+DEFAULT_SCHEDULED_FLUSH_INTERVAL = 60  # seconds
+DEFAULT_SCHEDULED_FLUSH_DATAPOINTS = 10000
+HISTOGRAM_RELATIVE_ERROR = 0.01
 MAX_DIMENSION_SET_SIZE = 30
 MAX_DIMENSION_NAME_LENGTH = 250
 MAX_DIMENSION_VALUE_LENGTH = 1024
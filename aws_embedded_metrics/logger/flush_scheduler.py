@@ -0,0 +1,288 @@
+# Copyright 2019 Amazon.com, Inc. or its affiliates.
+# Licensed under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from aws_embedded_metrics.constants import DEFAULT_SCHEDULED_FLUSH_DATAPOINTS, DEFAULT_SCHEDULED_FLUSH_INTERVAL
+from aws_embedded_metrics.environment import Environment
+from aws_embedded_metrics.logger.metrics_logger import MetricsLogger
+from aws_embedded_metrics.logger.metrics_logger_factory import create_metrics_logger
+from aws_embedded_metrics.storage_resolution import StorageResolution
+from aws_embedded_metrics.aggregation_type import AggregationType
+from typing import Any, Callable, Iterable, Mapping, Optional, TypeVar, TYPE_CHECKING, cast
+import abc
+import asyncio
+import functools
+import logging
+import threading
+
+if TYPE_CHECKING:
+    from aws_embedded_metrics.logger.metric_registry import MetricHandle
+
+log = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def synchronized(method: F) -> F:
+    @functools.wraps(method)
+    def wrapper(self: "ScheduledMetricsLogger", *args: Any, **kwargs: Any) -> Any:
+        with self.lock:
+            return method(self, *args, **kwargs)
+    return cast(F, wrapper)
+
+
+class ScheduledMetricsLogger(MetricsLogger):
+    """
+    A MetricsLogger flushed by a FlushScheduler. Its methods hold a lock, so
+    the scheduler can flush it while it is used from another thread. The lock
+    is only held to swap in a new context when it is flushed, so a slow sink
+    does not block the logger's callers. It also counts the datapoints added
+    since the last flush so the scheduler can flush it early once they cross
+    its threshold.
+    """
+
+    def __init__(self, logger: MetricsLogger, scheduler: "FlushScheduler"):
+        super().__init__(logger.resolve_environment, logger.context)
+        self.flush_preserve_dimensions = logger.flush_preserve_dimensions
+        self.scheduler = scheduler
+        self.lock = threading.Lock()
+        self.datapoints = 0
+
+    def put_metric(
+        self,
+        key: str,
+        value: float,
+        unit: str = "None",
+        storage_resolution: StorageResolution = StorageResolution.STANDARD,
+        aggregation_type: AggregationType = None,
+    ) -> "MetricsLogger":
+        with self.lock:
+            self.context.put_metric(key, value, unit, storage_resolution, aggregation_type)
+            self.datapoints += 1
+        self.__check_datapoints()
+        return self
+
+    def record(self, handle: "MetricHandle", value: float) -> "MetricsLogger":
+        with self.lock:
+            self.context.record(handle, value)
+            self.datapoints += 1
+        self.__check_datapoints()
+        return self
+
+    def put_metrics(
+        self,
+        metrics: Mapping[str, float],
+        unit: str = "None",
+        storage_resolution: StorageResolution = StorageResolution.STANDARD,
+        aggregation_type: AggregationType = None,
+    ) -> "MetricsLogger":
+        with self.lock:
+            self.context.put_metrics(metrics, unit, storage_resolution, aggregation_type)
+            self.datapoints += len(metrics)
+        self.__check_datapoints()
+        return self
+
+    def put_metric_values(
+        self,
+        key: str,
+        values: Iterable[float],
+        unit: str = "None",
+        storage_resolution: StorageResolution = StorageResolution.STANDARD,
+        aggregation_type: AggregationType = None,
+    ) -> "MetricsLogger":
+        if not hasattr(values, "__len__"):
+            values = list(values)
+        with self.lock:
+            self.context.put_metric_values(key, values, unit, storage_resolution, aggregation_type)
+            self.datapoints += len(values)  # type: ignore
+        self.__check_datapoints()
+        return self
+
+    def __check_datapoints(self) -> None:
+        if self.datapoints >= self.scheduler.max_datapoints:
+            self.scheduler.request_flush()
+
+    def _flush_with_environment(self, environment: Environment) -> None:
+        with self.lock:
+            context = self.context
+            self.context = context.create_copy_with_context(self.flush_preserve_dimensions)
+            self.datapoints = 0
+        # nothing else can reach the old context, so it is sent without holding the lock
+        self._send_context(context, environment)
+
+    set_property = synchronized(MetricsLogger.set_property)
+    put_dimensions = synchronized(MetricsLogger.put_dimensions)
+    set_dimensions = synchronized(MetricsLogger.set_dimensions)
+    reset_dimensions = synchronized(MetricsLogger.reset_dimensions)
+    set_namespace = synchronized(MetricsLogger.set_namespace)
+    set_default_aggregation_type = synchronized(MetricsLogger.set_default_aggregation_type)
+    set_timestamp = synchronized(MetricsLogger.set_timestamp)
+    new = synchronized(MetricsLogger.new)
+
+
+class FlushScheduler(abc.ABC):
+    """
+    Flushes a long-lived logger every interval seconds, and as soon as
+    max_datapoints have been added to it since it was last flushed.
+    The logger is created by create_metrics_logger unless one is given,
+    and must be used through the scheduler's logger attribute.
+    """
+
+    def __init__(
+        self,
+        logger: MetricsLogger = None,
+        interval: float = DEFAULT_SCHEDULED_FLUSH_INTERVAL,
+        max_datapoints: int = DEFAULT_SCHEDULED_FLUSH_DATAPOINTS,
+    ):
+        self.interval = interval
+        self.max_datapoints = max_datapoints
+        self.logger = ScheduledMetricsLogger(logger or create_metrics_logger(), self)
+        self.flush_requested = False
+
+    @abc.abstractmethod
+    def request_flush(self) -> None:
+        """Asks the scheduler to flush the logger before the interval has elapsed."""
+
+    def _should_flush(self) -> bool:
+        self.flush_requested = False
+        # idle intervals do not produce empty events
+        return bool(self.logger.context.metrics)
+
+
+class ThreadFlushScheduler(FlushScheduler):
+    """
+    Flushes the logger from a daemon thread, so the logger can keep being
+    used from the application's threads while it is flushed.
+    ```
+    scheduler = ThreadFlushScheduler(interval=10).start()
+    scheduler.logger.put_metric("MessagesProcessed", 1, "Count")
+    scheduler.stop()
+    ```
+    """
+
+    def __init__(
+        self,
+        logger: MetricsLogger = None,
+        interval: float = DEFAULT_SCHEDULED_FLUSH_INTERVAL,
+        max_datapoints: int = DEFAULT_SCHEDULED_FLUSH_DATAPOINTS,
+    ):
+        super().__init__(logger, interval, max_datapoints)
+        self.__wakeup = threading.Event()
+        self.__stopped = False
+        self.__thread: Optional[threading.Thread] = None
+
+    def start(self) -> "ThreadFlushScheduler":
+        if self.__thread is None:
+            self.__stopped = False
+            self.__thread = threading.Thread(target=self.__run, name="aws-embedded-metrics-flush", daemon=True)
+            self.__thread.start()
+        return self
+
+    def request_flush(self) -> None:
+        if not self.flush_requested:
+            self.flush_requested = True
+            self.__wakeup.set()
+
+    def stop(self) -> None:
+        """
+        Stops the thread and flushes the metrics added since the last flush.
+        """
+        thread = self.__thread
+        if thread is not None:
+            self.__stopped = True
+            self.__wakeup.set()
+            thread.join()
+            self.__thread = None
+        if self._should_flush():
+            self.logger.flush_sync()
+
+    def __run(self) -> None:
+        while True:
+            self.__wakeup.wait(self.interval)
+            self.__wakeup.clear()
+            if self.__stopped:
+                return
+            try:
+                if self._should_flush():
+                    self.logger.flush_sync()
+            except Exception:
+                log.exception("Failed to flush scheduled metrics")
+
+
+class AsyncFlushScheduler(FlushScheduler):
+    """
+    Flushes the logger from a task on the running event loop. The logger
+    is meant to be used from coroutines running on the same loop.
+    ```
+    scheduler = AsyncFlushScheduler(interval=10).start()
+    scheduler.logger.put_metric("MessagesProcessed", 1, "Count")
+    await scheduler.stop()
+    ```
+    """
+
+    def __init__(
+        self,
+        logger: MetricsLogger = None,
+        interval: float = DEFAULT_SCHEDULED_FLUSH_INTERVAL,
+        max_datapoints: int = DEFAULT_SCHEDULED_FLUSH_DATAPOINTS,
+    ):
+        super().__init__(logger, interval, max_datapoints)
+        self.__loop: Optional[asyncio.AbstractEventLoop] = None
+        self.__wakeup: Optional[asyncio.Event] = None
+        self.__stopped = False
+        self.__task: Optional[asyncio.Task] = None
+
+    def start(self) -> "AsyncFlushScheduler":
+        """
+        Starts the flush task on the running event loop.
+        """
+        if self.__task is None:
+            self.__loop = asyncio.get_running_loop()
+            self.__wakeup = asyncio.Event()
+            self.__stopped = False
+            self.__task = self.__loop.create_task(self.__run())
+        return self
+
+    def request_flush(self) -> None:
+        if not self.flush_requested and self.__loop is not None and self.__wakeup is not None:
+            self.flush_requested = True
+            # datapoints may be added from a thread other than the loop's
+            self.__loop.call_soon_threadsafe(self.__wakeup.set)
+
+    async def stop(self) -> None:
+        """
+        Stops the task and flushes the metrics added since the last flush.
+        """
+        task = self.__task
+        if task is not None and self.__wakeup is not None:
+            self.__stopped = True
+            self.__wakeup.set()
+            await task
+            self.__task = None
+        if self._should_flush():
+            await self.logger.flush()
+
+    async def __run(self) -> None:
+        wakeup = cast(asyncio.Event, self.__wakeup)
+        while True:
+            try:
+                await asyncio.wait_for(wakeup.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
+            wakeup.clear()
+            if self.__stopped:
+                return
+            try:
+                if self._should_flush():
+                    await self.logger.flush()
+            except Exception:
+                log.exception("Failed to flush scheduled metrics")
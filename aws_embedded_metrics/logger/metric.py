@@ -10,14 +10,183 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from array import array
+from aws_embedded_metrics.aggregation_type import AggregationType
+from aws_embedded_metrics.constants import HISTOGRAM_RELATIVE_ERROR
 from aws_embedded_metrics.storage_resolution import StorageResolution
+from typing import Dict, Iterable, List, Optional, Tuple, Type
+import math
+
+# Bucket i of a histogram counts the values in (GAMMA ** (i - 1), GAMMA ** i]. Representing
+# the bucket by 2 * GAMMA ** i / (GAMMA + 1) keeps it within the relative error of each value.
+HISTOGRAM_GAMMA = (1 + HISTOGRAM_RELATIVE_ERROR) / (1 - HISTOGRAM_RELATIVE_ERROR)
+HISTOGRAM_INDEX_MULTIPLIER = 1 / math.log(HISTOGRAM_GAMMA)
+HISTOGRAM_VALUE_MULTIPLIER = 2 / (HISTOGRAM_GAMMA + 1)
+
+STORAGE_RESOLUTIONS: Dict[int, StorageResolution] = {resolution.value: resolution for resolution in StorageResolution}
+
+
+def as_storage_resolution(storage_resolution: object) -> StorageResolution:
+    """
+    Returns the StorageResolution member of a storage resolution, which may
+    also be given as its int value, so metrics can compare resolutions by identity.
+    """
+    if type(storage_resolution) is StorageResolution:
+        return storage_resolution
+    if isinstance(storage_resolution, int):
+        # values the validator rejects are only kept with validation off, and were always emitted at standard resolution
+        return STORAGE_RESOLUTIONS.get(storage_resolution, StorageResolution.STANDARD)
+    return StorageResolution.STANDARD
 
 
 class Metric(object):
+    """
+    The values recorded for a metric, stored unboxed as an array of doubles.
+    """
+
+    __slots__ = ("values", "unit", "storage_resolution")
+
     def __init__(self, value: float, unit: str = None, storage_resolution: StorageResolution = StorageResolution.STANDARD):
-        self.values = [value]
+        self.values = array("d", (value,))
         self.unit = unit or "None"
-        self.storage_resolution = storage_resolution or StorageResolution.STANDARD
+        self.storage_resolution = as_storage_resolution(storage_resolution)
 
     def add_value(self, value: float) -> None:
         self.values.append(value)
+
+    def add_values(self, values: Iterable[float]) -> None:
+        self.values.extend(values)
+
+    def merge(self, other: "Metric") -> None:
+        self.values.extend(other.values)
+
+
+class StatisticSetMetric(Metric):
+    """
+    A metric that keeps only the Min, Max, Sum and Count of its values.
+    The raw values are not retained, so memory use does not grow with
+    the number of recorded values.
+    """
+
+    __slots__ = ("min", "max", "sum", "count")
+
+    def __init__(self, value: float, unit: str = None, storage_resolution: StorageResolution = StorageResolution.STANDARD):
+        self.values = array("d")
+        self.unit = unit or "None"
+        self.storage_resolution = as_storage_resolution(storage_resolution)
+        self.min = value
+        self.max = value
+        self.sum = value
+        self.count = 1
+
+    def add_value(self, value: float) -> None:
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.sum += value
+        self.count += 1
+
+    def add_values(self, values: Iterable[float]) -> None:
+        values = array("d", values)
+        if not values:
+            return
+        self.min = min(self.min, min(values))
+        self.max = max(self.max, max(values))
+        self.sum += sum(values)
+        self.count += len(values)
+
+    def merge(self, other: Metric) -> None:
+        if not isinstance(other, StatisticSetMetric):
+            self.add_values(other.values)
+            return
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.sum += other.sum
+        self.count += other.count
+
+    def get_statistic_set(self) -> Dict[str, float]:
+        return {"Max": self.max, "Min": self.min, "Count": self.count, "Sum": self.sum}
+
+
+class HistogramMetric(StatisticSetMetric):
+    """
+    A metric that counts its values in log-linear buckets. Memory use is
+    bounded by the number of buckets rather than the number of values, and
+    each bucket is represented by a value within HISTOGRAM_RELATIVE_ERROR of
+    every value counted in it. The Min, Max, Sum and Count are exact.
+    """
+
+    __slots__ = ("positive_buckets", "negative_buckets", "zero_count")
+
+    def __init__(self, value: float, unit: str = None, storage_resolution: StorageResolution = StorageResolution.STANDARD):
+        super().__init__(value, unit, storage_resolution)
+        self.positive_buckets: Dict[int, int] = {}
+        self.negative_buckets: Dict[int, int] = {}
+        self.zero_count = 0
+        self.__count(value)
+
+    def add_value(self, value: float) -> None:
+        StatisticSetMetric.add_value(self, value)
+        self.__count(value)
+
+    def add_values(self, values: Iterable[float]) -> None:
+        values = array("d", values)
+        StatisticSetMetric.add_values(self, values)
+        for value in values:
+            self.__count(value)
+
+    def __count(self, value: float) -> None:
+        if value > 0:
+            buckets = self.positive_buckets
+        elif value < 0:
+            buckets = self.negative_buckets
+            value = -value
+        else:
+            self.zero_count += 1
+            return
+        index = math.ceil(math.log(value) * HISTOGRAM_INDEX_MULTIPLIER)
+        buckets[index] = buckets.get(index, 0) + 1
+
+    def merge(self, other: Metric) -> None:
+        if not isinstance(other, HistogramMetric):
+            self.add_values(other.values)
+            return
+        StatisticSetMetric.merge(self, other)
+        for buckets, other_buckets in ((self.positive_buckets, other.positive_buckets),
+                                       (self.negative_buckets, other.negative_buckets)):
+            for index, count in other_buckets.items():
+                buckets[index] = buckets.get(index, 0) + count
+        self.zero_count += other.zero_count
+
+    def get_buckets(self) -> Tuple[List[float], List[int]]:
+        """
+        Returns the value representing each non-empty bucket, in ascending
+        order, and the number of values counted in each bucket.
+        """
+        values: List[float] = []
+        counts: List[int] = []
+        for index in sorted(self.negative_buckets, reverse=True):
+            values.append(-HISTOGRAM_VALUE_MULTIPLIER * HISTOGRAM_GAMMA ** index)
+            counts.append(self.negative_buckets[index])
+        if self.zero_count:
+            values.append(0.0)
+            counts.append(self.zero_count)
+        for index in sorted(self.positive_buckets):
+            values.append(HISTOGRAM_VALUE_MULTIPLIER * HISTOGRAM_GAMMA ** index)
+            counts.append(self.positive_buckets[index])
+        return values, counts
+
+
+metric_types: Dict[AggregationType, Type[Metric]] = {
+    AggregationType.LIST: Metric,
+    AggregationType.STATISTIC_SET: StatisticSetMetric,
+    AggregationType.HISTOGRAM: HistogramMetric,
+}
+
+
+def create_metric(
+    value: float, unit: Optional[str], storage_resolution: StorageResolution, aggregation_type: AggregationType
+) -> Metric:
+    """Creates a metric holding a first value, keeping its values as the aggregation type requires."""
+    return metric_types[aggregation_type](value, unit, storage_resolution)
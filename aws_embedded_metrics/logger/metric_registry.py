@@ -0,0 +1,100 @@
+# Copyright 2019 Amazon.com, Inc. or its affiliates.
+# Licensed under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from aws_embedded_metrics.aggregation_type import AggregationType
+from aws_embedded_metrics.exceptions import InvalidMetricError
+from aws_embedded_metrics.logger.metric import Metric, as_storage_resolution, create_metric
+from aws_embedded_metrics.logger.metrics_logger import MetricsLogger
+from aws_embedded_metrics.storage_resolution import StorageResolution
+from aws_embedded_metrics.validator import validate_metric_definition
+from typing import Dict, Optional
+
+
+class MetricHandle(object):
+    """
+    A metric declared through a MetricRegistry. Its name, unit and storage
+    resolution were validated when it was declared, so recording a value
+    only checks the value itself.
+    """
+
+    __slots__ = ("name", "unit", "storage_resolution", "aggregation_type", "registry")
+
+    def __init__(
+        self,
+        registry: "MetricRegistry",
+        name: str,
+        unit: Optional[str],
+        storage_resolution: StorageResolution,
+        aggregation_type: Optional[AggregationType],
+    ):
+        self.registry = registry
+        self.name = name
+        self.unit = unit or "None"
+        self.storage_resolution = as_storage_resolution(storage_resolution)
+        self.aggregation_type = aggregation_type
+
+    def record(self, value: float) -> None:
+        """
+        Records a value through the logger of the registry the metric was declared on.
+        ```
+        latency.record(100)
+        ```
+        """
+        logger = self.registry.logger
+        if logger is None:
+            raise ValueError(f"Metric {self.name} cannot be recorded, its registry has no logger")
+        logger.record(self, value)
+
+    def create_metric(self, value: float, default_aggregation_type: AggregationType) -> Metric:
+        return create_metric(value, self.unit, self.storage_resolution, self.aggregation_type or default_aggregation_type)
+
+
+class MetricRegistry(object):
+    """
+    Declares metrics once so they can be recorded without validating their
+    name, unit and storage resolution on every call.
+    ```
+    registry = MetricRegistry(logger)
+    latency = registry.declare("Latency", "Milliseconds")
+    latency.record(100)
+    ```
+    Handles can also be recorded through any other logger with MetricsLogger.record.
+    """
+
+    def __init__(self, logger: MetricsLogger = None):
+        self.logger = logger
+        self.handles: Dict[str, MetricHandle] = {}
+
+    def declare(
+        self,
+        name: str,
+        unit: str = None,
+        storage_resolution: StorageResolution = StorageResolution.STANDARD,
+        aggregation_type: AggregationType = None,
+    ) -> MetricHandle:
+        """
+        Validates and declares a metric, returning the handle used to record it.
+        Declaring a metric again with the same definition returns the same handle.
+        """
+        validate_metric_definition(name, unit, storage_resolution, {})
+        storage_resolution = as_storage_resolution(storage_resolution)
+
+        handle = self.handles.get(name)
+        if handle is not None:
+            if (handle.unit, handle.storage_resolution, handle.aggregation_type) != (unit or "None", storage_resolution, aggregation_type):
+                raise InvalidMetricError(f"Metric {name} is already declared with a different definition")
+            return handle
+
+        handle = MetricHandle(self, name, unit, storage_resolution, aggregation_type)
+        self.handles[name] = handle
+        return handle
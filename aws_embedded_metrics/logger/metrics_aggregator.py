@@ -0,0 +1,258 @@
+# Copyright 2019 Amazon.com, Inc. or its affiliates.
+# Licensed under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from aws_embedded_metrics.aggregation_type import AggregationType
+from aws_embedded_metrics.config import get_config
+from aws_embedded_metrics.environment import Environment
+from aws_embedded_metrics.environment.environment_detector import resolve_environment
+from aws_embedded_metrics.logger.metrics_context import MetricsContext
+from aws_embedded_metrics.logger.metrics_logger import MetricsLogger
+from aws_embedded_metrics.logger.process_aggregation import ContextKey, ProcessAggregation
+from aws_embedded_metrics.storage_resolution import StorageResolution
+from aws_embedded_metrics.validator import validate_namespace
+from typing import Awaitable, Callable, Dict, List, Optional, TYPE_CHECKING
+import atexit
+import logging
+import os
+import threading
+
+if TYPE_CHECKING:
+    from aws_embedded_metrics.logger.metric_registry import MetricHandle
+
+log = logging.getLogger(__name__)
+
+Config = get_config()
+
+
+class AggregatorShard(object):
+    """
+    The contexts a MetricsAggregator merges metrics into, along with the lock
+    guarding them. The lock is only contended when the shard is shared
+    between threads or is being drained by a flush.
+    """
+
+    __slots__ = ("contexts", "lock", "thread")
+
+    def __init__(self, thread: Optional[threading.Thread] = None):
+        self.contexts: Dict[ContextKey, MetricsContext] = {}
+        self.lock = threading.Lock()
+        # the thread that owns the shard, or None when the shard is shared by all threads
+        self.thread = thread
+
+    def drain(self) -> Dict[ContextKey, MetricsContext]:
+        with self.lock:
+            contexts = self.contexts
+            self.contexts = {}
+        return contexts
+
+
+class MetricsAggregator:
+    """
+    Merges metrics put from any thread by namespace, dimension set and metric
+    name, and flushes them through the environment's sink on an interval.
+    Each interval produces one event per namespace and dimension set, rather
+    than one per request.
+
+    By default all threads put metrics into one set of contexts behind a
+    single lock. With shard_by_thread, each thread puts metrics into its own
+    shard instead, so threads never wait on each other, and the shards are
+    merged when the aggregator flushes.
+
+    With a socket_path, the aggregators of all processes sharing the path
+    elect one of them to flush the metrics of all of them, see ProcessAggregation.
+    """
+
+    def __init__(
+        self,
+        resolve_environment: Callable[..., Awaitable[Environment]] = resolve_environment,
+        flush_interval: float = None,
+        aggregation_type: AggregationType = AggregationType.LIST,
+        shard_by_thread: bool = False,
+        socket_path: str = None,
+    ):
+        self.resolve_environment = resolve_environment
+        self.flush_interval = flush_interval or Config.aggregation_flush_interval
+        self.aggregation_type = aggregation_type
+        self.shard_by_thread = shard_by_thread
+        self.__shared_shard = AggregatorShard()
+        self.__shards: List[AggregatorShard] = [self.__shared_shard]
+        self.__shards_lock = threading.Lock()
+        self.__local = threading.local()
+        self.__stopped = threading.Event()
+        self.__thread: Optional[threading.Thread] = None
+        self.process_aggregation = ProcessAggregation(socket_path, self.__receive) if socket_path else None
+
+    def put_metric(
+        self,
+        key: str,
+        value: float,
+        unit: str = "None",
+        storage_resolution: StorageResolution = StorageResolution.STANDARD,
+        aggregation_type: AggregationType = None,
+        dimensions: Dict[str, str] = None,
+        namespace: str = None,
+    ) -> "MetricsAggregator":
+        """
+        Adds a value to the metric with the given name in the given namespace
+        and dimension set. When no dimensions are given, the metric is only
+        dimensioned by the default dimensions.
+        """
+        shard = self.__get_shard()
+        with shard.lock:
+            self.__get_context(shard, namespace, dimensions).put_metric(key, value, unit, storage_resolution, aggregation_type)
+        return self
+
+    def record(
+        self, handle: "MetricHandle", value: float, dimensions: Dict[str, str] = None, namespace: str = None
+    ) -> "MetricsAggregator":
+        shard = self.__get_shard()
+        with shard.lock:
+            self.__get_context(shard, namespace, dimensions).record(handle, value)
+        return self
+
+    def __get_shard(self) -> AggregatorShard:
+        if not self.shard_by_thread:
+            return self.__shared_shard
+        try:
+            shard: AggregatorShard = self.__local.shard
+            return shard
+        except AttributeError:
+            shard = AggregatorShard(threading.current_thread())
+            with self.__shards_lock:
+                self.__shards.append(shard)
+            self.__local.shard = shard
+            return shard
+
+    def __get_context(
+        self, shard: AggregatorShard, namespace: Optional[str], dimensions: Optional[Dict[str, str]]
+    ) -> MetricsContext:
+        key = (namespace, frozenset(dimensions.items()) if dimensions else frozenset())
+        context = shard.contexts.get(key)
+        if context is None:
+            context = MetricsContext.empty()
+            if namespace is not None:
+                validate_namespace(namespace)
+                context.namespace = namespace
+            if dimensions:
+                context.put_dimensions(dimensions)
+            context.set_default_aggregation_type(self.aggregation_type)
+            shard.contexts[key] = context
+        return context
+
+    def flush(self) -> None:
+        """
+        Sends the metrics aggregated since the last flush to the environment's sink.
+        """
+        with self.__shards_lock:
+            shards = list(self.__shards)
+
+        contexts: Dict[ContextKey, MetricsContext] = {}
+        for shard in shards:
+            # checked before draining, so a thread cannot add metrics to its shard after it was drained
+            finished = shard.thread is not None and not shard.thread.is_alive()
+            for key, context in shard.drain().items():
+                merged = contexts.get(key)
+                if merged is None:
+                    contexts[key] = context
+                else:
+                    merged.merge_metrics(context)
+
+            if finished:
+                with self.__shards_lock:
+                    self.__shards.remove(shard)
+
+        if not contexts:
+            return
+        if self.process_aggregation is not None and self.process_aggregation.forward(contexts):
+            return
+
+        for context in contexts.values():
+            MetricsLogger(self.resolve_environment, context).flush_sync()
+
+    def __receive(self, namespace: Optional[str], dimensions: Dict[str, str], context: MetricsContext) -> None:
+        shard = self.__shared_shard
+        with shard.lock:
+            self.__get_context(shard, namespace, dimensions).merge_metrics(context)
+
+    def start(self) -> "MetricsAggregator":
+        """
+        Starts a daemon thread that flushes the aggregated metrics every flush_interval seconds.
+        When aggregating across processes, this process also stands for election.
+        """
+        if self.process_aggregation is not None:
+            self.process_aggregation.elect()
+        if self.__thread is None:
+            self.__stopped.clear()
+            self.__thread = threading.Thread(target=self.__run, name="aws-embedded-metrics-aggregator", daemon=True)
+            self.__thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stops the flush thread and flushes the metrics aggregated since the last flush.
+        """
+        thread = self.__thread
+        if thread is not None:
+            self.__stopped.set()
+            thread.join()
+            self.__thread = None
+        if self.process_aggregation is not None:
+            # metrics received until now are flushed below, later ones go to the next elected process
+            self.process_aggregation.close()
+        self.flush()
+
+    def reset_after_fork(self) -> None:
+        """
+        Called in a child process after a fork. The metrics inherited from the
+        parent are dropped, since the parent flushes them, and the flush
+        thread is restarted if it was running in the parent.
+        """
+        was_started = self.__thread is not None
+        self.__shared_shard = AggregatorShard()
+        self.__shards = [self.__shared_shard]
+        self.__shards_lock = threading.Lock()
+        self.__local = threading.local()
+        self.__stopped = threading.Event()
+        self.__thread = None
+        if self.process_aggregation is not None:
+            self.process_aggregation.reset_after_fork()
+        if was_started:
+            self.start()
+
+    def __run(self) -> None:
+        while not self.__stopped.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception:
+                log.exception("Failed to flush aggregated metrics")
+
+
+aggregator: Optional[MetricsAggregator] = None
+aggregator_lock = threading.Lock()
+
+
+def get_metrics_aggregator() -> MetricsAggregator:
+    """
+    Gets the process-wide aggregator, starting it on first use.
+    It is shared by every thread, so each thread puts metrics into its own shard.
+    When AGGREGATION_SOCKET is configured, it aggregates across the processes sharing the socket.
+    Its remaining metrics are flushed when the interpreter exits.
+    """
+    global aggregator
+    with aggregator_lock:
+        if aggregator is None:
+            aggregator = MetricsAggregator(shard_by_thread=True, socket_path=Config.aggregation_socket or None).start()
+            atexit.register(aggregator.stop)
+            if hasattr(os, "register_at_fork"):
+                os.register_at_fork(after_in_child=aggregator.reset_after_fork)
+        return aggregator
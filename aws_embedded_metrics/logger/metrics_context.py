@@ -12,13 +12,56 @@
 # limitations under the License.
 
 
+import logging
+import math
+from array import array
 from datetime import datetime
 from aws_embedded_metrics import constants, utils, validator
 from aws_embedded_metrics.config import get_config
-from aws_embedded_metrics.logger.metric import Metric
-from aws_embedded_metrics.validator import validate_dimension_set, validate_metric
+from aws_embedded_metrics.aggregation_type import AggregationType
+from aws_embedded_metrics.logger.metric import Metric, StatisticSetMetric, create_metric
+from aws_embedded_metrics.exceptions import DimensionSetExceededError, InvalidDimensionError, InvalidMetricError
+from aws_embedded_metrics.validation_mode import ValidationMode
+from aws_embedded_metrics.validator import (
+    is_finite_number, validate_dimension_set, validate_metric, validate_metric_definition, validate_metric_values,
+    validate_metrics
+)
 from aws_embedded_metrics.storage_resolution import StorageResolution
-from typing import List, Dict, Any, Set
+from typing import List, Dict, Any, Collection, FrozenSet, Iterable, Mapping, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from aws_embedded_metrics.logger.metric_registry import MetricHandle
+
+log = logging.getLogger(__name__)
+
+
+def to_double_array(values: Any) -> array:
+    """
+    Converts a batch of values to an array of doubles. NumPy arrays are
+    copied as raw doubles rather than boxing every element.
+    """
+    numpy = utils.get_numpy_module(values)
+    if numpy is not None and values.dtype.kind in utils.NUMPY_NUMERIC_KINDS:
+        doubles = array("d")
+        doubles.frombytes(memoryview(numpy.ascontiguousarray(values, dtype="d")).cast("B"))
+        return doubles
+    return array("d", values.tolist() if hasattr(values, "tolist") else values)
+
+
+class ReadOnlyList(list):
+    """
+    A list that raises TypeError when it is modified. It is returned where
+    changes to a list would otherwise be silently lost. Copies are plain lists.
+    """
+
+    def __read_only(self, *args: Any, **kwargs: Any) -> Any:
+        raise TypeError(f"{type(self).__name__} cannot be modified, modify a copy of it instead")
+
+    append = extend = insert = remove = pop = clear = sort = reverse = __read_only  # type: ignore
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = __read_only  # type: ignore
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        return list, (list(self),)
 
 
 class MetricsContext(object):
@@ -35,31 +78,185 @@ class MetricsContext(object):
     ):
 
         self.namespace: str = namespace or get_config().namespace or constants.DEFAULT_NAMESPACE
-        self.properties: Dict[str, Any] = properties or {}
-        self.dimensions: List[Dict[str, str]] = dimensions or []
-        self.default_dimensions: Dict[str, str] = default_dimensions or {}
+        self.__properties: Dict[str, Any] = properties or {}
+        self.__properties_shared = False
+        self.__default_dimensions: Dict[str, str] = default_dimensions or {}
+        self.__default_dimensions_shared = False
+        self.dimensions = dimensions or []
         self.metrics: Dict[str, Metric] = {}
         self.should_use_default_dimensions = True
         self.meta: Dict[str, Any] = {constants.TIMESTAMP: utils.now()}
-        self.metric_name_and_resolution_map: Dict[str, StorageResolution] = {}
+        self.default_aggregation_type = AggregationType.LIST
+        self.validation_mode: ValidationMode = get_config().validation_mode
+        # the number of values and dimension sets dropped by lenient validation
+        self.invalid_count = 0
 
-    def put_metric(self, key: str, value: float, unit: str = None, storage_resolution: StorageResolution = StorageResolution.STANDARD) -> None:
+    def put_metric(
+        self,
+        key: str,
+        value: float,
+        unit: str = None,
+        storage_resolution: StorageResolution = StorageResolution.STANDARD,
+        aggregation_type: AggregationType = None,
+    ) -> None:
         """
         Adds a metric measurement to the context.
         Multiple calls using the same key will be stored as an
-        array of scalar values.
+        array of scalar values, or as a statistic set when the metric
+        uses AggregationType.STATISTIC_SET.
+        If no aggregation type is provided, the context default is used.
         ```
         context.put_metric("Latency", 100, "Milliseconds")
         ```
         """
-        validate_metric(key, value, unit, storage_resolution, self.metric_name_and_resolution_map)
+        if self.validation_mode is not ValidationMode.OFF:
+            try:
+                validate_metric(key, value, unit, storage_resolution, self.metrics)
+            except InvalidMetricError as e:
+                if self.validation_mode is ValidationMode.STRICT:
+                    raise
+                self.__drop_invalid(e)
+                return
+
         metric = self.metrics.get(key)
         if metric:
             # TODO: we should log a warning if the unit has been changed
             metric.add_value(value)
         else:
-            self.metrics[key] = Metric(value, unit, storage_resolution)
-        self.metric_name_and_resolution_map[key] = storage_resolution
+            self.metrics[key] = create_metric(value, unit, storage_resolution, aggregation_type or self.default_aggregation_type)
+
+    def record(self, handle: "MetricHandle", value: float) -> None:
+        """
+        Adds a measurement for a metric declared through a MetricRegistry.
+        The name, unit and storage resolution were validated when the metric
+        was declared, so only the value and the resolution of an existing
+        metric with the same name are checked.
+        ```
+        context.record(latency, 100)
+        ```
+        """
+        try:
+            is_finite = math.isfinite(value)
+        except TypeError:
+            is_finite = False
+        if is_finite:
+            metric = self.metrics.get(handle.name)
+            if metric is None:
+                self.metrics[handle.name] = handle.create_metric(value, self.default_aggregation_type)
+                return
+            if metric.storage_resolution is handle.storage_resolution:
+                metric.add_value(value)
+                return
+
+        # invalid values and conflicting resolutions are raised, dropped or added according to the validation mode
+        self.put_metric(handle.name, value, handle.unit, handle.storage_resolution, handle.aggregation_type)
+
+    def put_metrics(
+        self,
+        metrics: Mapping[str, float],
+        unit: str = None,
+        storage_resolution: StorageResolution = StorageResolution.STANDARD,
+        aggregation_type: AggregationType = None,
+    ) -> None:
+        """
+        Adds a measurement for each of several metrics sharing a unit and
+        storage resolution. All metrics are validated before any are added.
+        ```
+        context.put_metrics({"DbLatency": 12, "CacheLatency": 3}, "Milliseconds")
+        ```
+        """
+        if self.validation_mode is not ValidationMode.OFF:
+            try:
+                validate_metrics(metrics, unit, storage_resolution, self.metrics)
+            except InvalidMetricError:
+                if self.validation_mode is ValidationMode.STRICT:
+                    raise
+                # put_metric drops and counts the invalid metrics one at a time
+                for key, value in metrics.items():
+                    self.put_metric(key, value, unit, storage_resolution, aggregation_type)
+                return
+
+        aggregation_type = aggregation_type or self.default_aggregation_type
+        for key, value in metrics.items():
+            metric = self.metrics.get(key)
+            if metric:
+                metric.add_value(value)
+            else:
+                self.metrics[key] = create_metric(value, unit, storage_resolution, aggregation_type)
+
+    def put_metric_values(
+        self,
+        key: str,
+        values: Iterable[float],
+        unit: str = None,
+        storage_resolution: StorageResolution = StorageResolution.STANDARD,
+        aggregation_type: AggregationType = None,
+    ) -> None:
+        """
+        Adds a batch of metric measurements to the context. This is equivalent
+        to calling put_metric for each value, but the metric is validated once
+        and array.array or NumPy arrays are converted in a single call.
+        ```
+        context.put_metric_values("Latency", array("d", [100, 120, 95]), "Milliseconds")
+        ```
+        """
+        if not hasattr(values, "tolist"):
+            if not isinstance(values, Collection):
+                values = list(values)
+            try:
+                values = array("d", values)
+            except TypeError:
+                # values that are not numbers are left for the validator to reject
+                pass
+        if self.validation_mode is not ValidationMode.OFF:
+            try:
+                validate_metric_values(key, values, unit, storage_resolution, self.metrics)
+            except InvalidMetricError as e:
+                if self.validation_mode is ValidationMode.STRICT:
+                    raise
+                values = self.__drop_invalid_values(key, values, unit, storage_resolution, e)
+        if not isinstance(values, array) or values.typecode != "d":
+            values = to_double_array(values)
+        if not values:
+            return
+
+        metric = self.metrics.get(key)
+        if metric:
+            metric.add_values(values)
+        else:
+            metric = create_metric(values[0], unit, storage_resolution, aggregation_type or self.default_aggregation_type)
+            metric.add_values(values[1:])
+            self.metrics[key] = metric
+
+    def merge_metrics(self, other: "MetricsContext") -> None:
+        """
+        Adds the metrics of another context to the metrics of this context.
+        Metrics are moved rather than copied, so the other context must not
+        be used afterwards.
+        ```
+        context.merge_metrics(other_context)
+        ```
+        """
+        for key, metric in other.metrics.items():
+            existing = self.metrics.get(key)
+            if existing is None:
+                self.metrics[key] = metric
+            elif type(existing) is StatisticSetMetric or type(existing) is type(metric) or not isinstance(metric, StatisticSetMetric):
+                existing.merge(metric)
+            else:
+                # the metric keeping less detail absorbs the other, since values cannot be recovered from statistics
+                metric.merge(existing)
+                self.metrics[key] = metric
+        self.invalid_count += other.invalid_count
+
+    def set_default_aggregation_type(self, aggregation_type: AggregationType) -> None:
+        """
+        Sets the aggregation type of metrics that are added without one.
+        ```
+        context.set_default_aggregation_type(AggregationType.STATISTIC_SET)
+        ```
+        """
+        self.default_aggregation_type = aggregation_type
 
     def put_dimensions(self, dimension_set: Dict[str, str]) -> None:
         """
@@ -72,15 +269,41 @@ class MetricsContext(object):
             # TODO add ability to define failure strategy
             return
 
-        validate_dimension_set(dimension_set)
+        if self.validation_mode is ValidationMode.STRICT:
+            validate_dimension_set(dimension_set)
+        elif self.validation_mode is ValidationMode.LENIENT and not self.__is_valid_dimension_set(dimension_set):
+            return
 
         # Duplicate dimension sets are removed before being added to the end of the collection.
         # This ensures only latest dimension value is used as a target member on the root EMF node.
-        # This operation is O(n^2), but acceptable given sets are capped at 30 dimensions
-        incoming_keys: Set = set(dimension_set.keys())
-        self.dimensions = list(filter(lambda dim: (set(dim.keys()) != incoming_keys), self.dimensions))
+        keys = frozenset(dimension_set)
+        self.__dimension_sets.pop(keys, None)
+        self.__dimension_sets[keys] = dimension_set
+        self.__invalidate_dimensions()
 
-        self.dimensions.append(dimension_set)
+    @property
+    def dimensions(self) -> List[Dict[str, str]]:
+        """
+        The custom dimension sets, in the order they were added. The list is
+        read-only, dimension sets are changed with put_dimensions, set_dimensions
+        and reset_dimensions, or by assigning a new list.
+        """
+        return ReadOnlyList(self.__dimension_sets.values())
+
+    @dimensions.setter
+    def dimensions(self, dimension_sets: List[Dict[str, str]]) -> None:
+        # dimension sets are indexed by their keys, so a set replacing one with the same keys
+        # is found in constant time. Dicts preserve insertion order, so the latest set is last.
+        self.__dimension_sets: Dict[FrozenSet[str], Dict[str, str]] = {}
+        for dimension_set in dimension_sets:
+            keys = frozenset(dimension_set)
+            self.__dimension_sets.pop(keys, None)
+            self.__dimension_sets[keys] = dimension_set
+        self.__invalidate_dimensions()
+
+    def __invalidate_dimensions(self) -> None:
+        self.__merged_dimensions: Optional[List[Dict[str, str]]] = None
+        self.__dimension_properties: Optional[Dict[str, str]] = None
 
     def set_dimensions(self, dimension_sets: List[Dict[str, str]], use_default: bool = False) -> None:
         """
@@ -93,11 +316,46 @@ class MetricsContext(object):
         """
         self.should_use_default_dimensions = use_default
 
-        for dimension_set in dimension_sets:
-            validate_dimension_set(dimension_set)
+        if self.validation_mode is ValidationMode.STRICT:
+            for dimension_set in dimension_sets:
+                validate_dimension_set(dimension_set)
+        elif self.validation_mode is ValidationMode.LENIENT:
+            dimension_sets = [dimension_set for dimension_set in dimension_sets if self.__is_valid_dimension_set(dimension_set)]
 
         self.dimensions = dimension_sets
 
+    def __is_valid_dimension_set(self, dimension_set: Dict[str, str]) -> bool:
+        try:
+            validate_dimension_set(dimension_set)
+        except (InvalidDimensionError, DimensionSetExceededError) as e:
+            self.__drop_invalid(e)
+            return False
+        return True
+
+    def __drop_invalid_values(
+        self,
+        key: str,
+        values: Iterable[float],
+        unit: Optional[str],
+        storage_resolution: StorageResolution,
+        error: InvalidMetricError,
+    ) -> array:
+        """Keeps the finite values of a valid metric and drops everything else."""
+        values = values.tolist() if hasattr(values, "tolist") else list(values)
+        try:
+            validate_metric_definition(key, unit, storage_resolution, self.metrics)
+        except InvalidMetricError as e:
+            self.__drop_invalid(e, len(values))
+            return array("d")
+
+        finite_values = array("d", filter(is_finite_number, values))
+        self.__drop_invalid(error, len(values) - len(finite_values))
+        return finite_values
+
+    def __drop_invalid(self, error: Exception, count: int = 1) -> None:
+        self.invalid_count += count
+        log.debug("Dropped %d invalid value(s) or dimension set(s): %s", count, error)
+
     def set_default_dimensions(self, default_dimensions: Dict) -> None:
         """
         Sets default dimensions for all other dimensions that get added
@@ -107,7 +365,9 @@ class MetricsContext(object):
         If custom dimensions are specified, they will be prepended with
         the default dimensions.
         """
-        self.default_dimensions = default_dimensions
+        # environments set the same defaults on every flush, which should not discard the cached dimensions
+        if default_dimensions != self.__default_dimensions:
+            self.default_dimensions = default_dimensions
 
     def reset_dimensions(self, use_default: bool) -> None:
         """
@@ -115,17 +375,80 @@ class MetricsContext(object):
         be used can be configured by the input parameter.
         :param use_default: indicates whether default dimensions should be used
         """
+        self.should_use_default_dimensions = use_default
         new_dimensions: List[Dict] = []
         self.dimensions = new_dimensions
-        self.should_use_default_dimensions = use_default
 
     def set_property(self, key: str, value: Any) -> None:
-        self.properties[key] = value
+        properties = self.__properties
+        if self.__properties_shared:
+            # environments set the same properties on every flush, which should not copy shared properties
+            current = properties.get(key, properties)
+            if current is value or (type(current) is str and type(value) is str and current == value):
+                return
+            properties = self.properties
+        properties[key] = value
+
+    # Properties and default dimensions are shared with copies of the context
+    # until one of them changes them. The public attributes may be used to
+    # change them in place, so reading them takes a private copy of a shared
+    # dict. Internal reads use the shared dict directly.
+
+    @property
+    def properties(self) -> Dict[str, Any]:
+        if self.__properties_shared:
+            self.__properties = dict(self.__properties)
+            self.__properties_shared = False
+        return self.__properties
+
+    @properties.setter
+    def properties(self, properties: Dict[str, Any]) -> None:
+        self.__properties = properties
+        self.__properties_shared = False
+
+    def get_properties(self) -> Mapping[str, Any]:
+        """
+        Returns the properties of the context without copying them.
+        The result must not be modified.
+        """
+        return self.__properties
+
+    @property
+    def default_dimensions(self) -> Dict[str, str]:
+        if self.__default_dimensions_shared:
+            self.__default_dimensions = dict(self.__default_dimensions)
+            self.__default_dimensions_shared = False
+        return self.__default_dimensions
+
+    @default_dimensions.setter
+    def default_dimensions(self, default_dimensions: Dict[str, str]) -> None:
+        self.__default_dimensions = default_dimensions
+        self.__default_dimensions_shared = False
+        self.__invalidate_dimensions()
 
     def get_dimensions(self) -> List[Dict]:
         """
-        Returns the current dimensions on the context
+        Returns the current dimensions on the context. The result is cached
+        until the dimensions change and must not be modified.
+        """
+        if self.__merged_dimensions is None:
+            self.__merged_dimensions = self.__merge_dimensions()
+        return self.__merged_dimensions
+
+    def get_dimension_properties(self) -> Dict[str, str]:
+        """
+        Returns the values of all dimensions, with later dimension sets taking
+        precedence. The result is cached until the dimensions change and must
+        not be modified.
         """
+        if self.__dimension_properties is None:
+            dimension_properties: Dict[str, str] = {}
+            for dimension_set in self.get_dimensions():
+                dimension_properties.update(dimension_set)
+            self.__dimension_properties = dimension_properties
+        return self.__dimension_properties
+
+    def __merge_dimensions(self) -> List[Dict]:
         # user has directly called set_dimensions
         if not self.should_use_default_dimensions:
             return self.dimensions
@@ -133,28 +456,26 @@ class MetricsContext(object):
         if not self.__has_default_dimensions():
             return self.dimensions
 
-        if len(self.dimensions) == 0:
-            return [self.default_dimensions]
+        if not self.__dimension_sets:
+            return [self.__default_dimensions]
 
         # we have to merge dimensions on the read path
         # because defaults won't actually get set until the flush
         # method is called. This allows us to not block the user
         # code while we're detecting the environment
         return list(
-            map(lambda custom: {**self.default_dimensions, **custom}, self.dimensions)
+            map(lambda custom: {**self.__default_dimensions, **custom}, self.__dimension_sets.values())
         )
 
     def __has_default_dimensions(self) -> bool:
-        return self.default_dimensions is not None and len(self.default_dimensions) > 0
+        return self.__default_dimensions is not None and len(self.__default_dimensions) > 0
 
     def create_copy_with_context(self, preserve_dimensions: bool = False) -> "MetricsContext":
         """
-        Creates a deep copy of the context excluding metrics.
+        Creates a copy of the context excluding metrics.
         Custom dimensions are NOT preserved by default unless preserve_dimensions parameter is set.
+        Properties and default dimensions are shared by both contexts until either one changes them.
         """
-        new_properties: Dict = {}
-        new_properties.update(self.properties)
-
         # custom dimensions will not be copied.
         # the reason for this is so that you can flush the same scope multiple
         # times without stacking new dimensions. Example:
@@ -167,12 +488,39 @@ class MetricsContext(object):
         # my_func()
         new_dimensions: List[Dict] = [] if not preserve_dimensions else self.dimensions
 
-        new_default_dimensions: Dict = {}
-        new_default_dimensions.update(self.default_dimensions)
+        new_context = MetricsContext(self.namespace, dimensions=new_dimensions)
+        new_context.__properties = self.__properties
+        new_context.__default_dimensions = self.__default_dimensions
+        new_context.__properties_shared = self.__properties_shared = True
+        new_context.__default_dimensions_shared = self.__default_dimensions_shared = True
+        new_context.default_aggregation_type = self.default_aggregation_type
+        return new_context
 
-        return MetricsContext(
-            self.namespace, new_properties, new_dimensions, new_default_dimensions
-        )
+    def reset(self, preserve_dimensions: bool = False) -> None:
+        """
+        Resets the context in place to the state create_copy_with_context would
+        produce, without allocating a new context. Only safe once nothing else
+        holds a reference to the context or its metrics.
+        """
+        self.metrics.clear()
+        self.meta.clear()
+        self.meta[constants.TIMESTAMP] = utils.now()
+        self.should_use_default_dimensions = True
+        if not preserve_dimensions:
+            self.__dimension_sets.clear()
+        self.__invalidate_dimensions()
+        self.validation_mode = get_config().validation_mode
+        self.invalid_count = 0
+
+    def clear(self) -> None:
+        """
+        Resets the context in place to the state of a new, empty context.
+        """
+        self.reset()
+        self.namespace = get_config().namespace or constants.DEFAULT_NAMESPACE
+        self.properties = {}
+        self.default_dimensions = {}
+        self.default_aggregation_type = AggregationType.LIST
 
     @staticmethod
     def empty() -> "MetricsContext":
@@ -19,10 +19,17 @@ from aws_embedded_metrics.validator import validate_namespace
 from aws_embedded_metrics.utils import _await
 from aws_embedded_metrics.config import get_config
 from aws_embedded_metrics.storage_resolution import StorageResolution
-from typing import Any, Awaitable, Callable, Dict, Tuple
+from aws_embedded_metrics.aggregation_type import AggregationType
+from typing import Any, Awaitable, Callable, Dict, Iterable, Mapping, Tuple, TYPE_CHECKING
+import logging
 import sys
 import traceback
 
+if TYPE_CHECKING:
+    from aws_embedded_metrics.logger.metric_registry import MetricHandle
+
+log = logging.getLogger(__name__)
+
 Config = get_config()
 
 
@@ -38,7 +45,7 @@ class MetricsLogger:
 
     def flush_sync(self) -> None:
         environment = resolve_environment_sync(lambda: _await(self.resolve_environment()))
-        self.__flush_with_environment(environment)
+        self._flush_with_environment(environment)
 
     async def flush(self) -> None:
         # resolve the environment and get the sink
@@ -46,15 +53,21 @@ class MetricsLogger:
         # This only runs asynchronously if executing for the
         # first time in a non-lambda environment
         environment = await self.resolve_environment()
-        self.__flush_with_environment(environment)
+        self._flush_with_environment(environment)
 
-    def __flush_with_environment(self, environment: Environment) -> None:
-        self.__configure_context_for_environment(environment)
-        sink = environment.get_sink()
-        sink.accept(self.context)
+    def _flush_with_environment(self, environment: Environment) -> None:
+        self._send_context(self.context, environment)
         self.context = self.context.create_copy_with_context(self.flush_preserve_dimensions)
 
-    def __configure_context_for_environment(self, env: Environment) -> None:
+    def _send_context(self, context: MetricsContext, environment: Environment) -> None:
+        if context.invalid_count:
+            log.warning("Dropped %d invalid metric values or dimension sets", context.invalid_count)
+        self.__configure_context_for_environment(context, environment)
+        sink = environment.get_sink()
+        sink.accept(context)
+
+    @staticmethod
+    def __configure_context_for_environment(context: MetricsContext, env: Environment) -> None:
         default_dimensions = {
             # LogGroup name will entirely depend on the environment since there
             # are some cases where the LogGroup cannot be configured (e.g. Lambda)
@@ -62,8 +75,8 @@ class MetricsLogger:
             "ServiceName": Config.service_name or env.get_name(),
             "ServiceType": Config.service_type or env.get_type(),
         }
-        self.context.set_default_dimensions(default_dimensions)
-        env.configure_context(self.context)
+        context.set_default_dimensions(default_dimensions)
+        env.configure_context(context)
 
     def set_property(self, key: str, value: Any) -> "MetricsLogger":
         self.context.set_property(key, value)
@@ -87,9 +100,43 @@ class MetricsLogger:
         return self
 
     def put_metric(
-        self, key: str, value: float, unit: str = "None", storage_resolution: StorageResolution = StorageResolution.STANDARD
+        self,
+        key: str,
+        value: float,
+        unit: str = "None",
+        storage_resolution: StorageResolution = StorageResolution.STANDARD,
+        aggregation_type: AggregationType = None,
+    ) -> "MetricsLogger":
+        self.context.put_metric(key, value, unit, storage_resolution, aggregation_type)
+        return self
+
+    def record(self, handle: "MetricHandle", value: float) -> "MetricsLogger":
+        self.context.record(handle, value)
+        return self
+
+    def put_metrics(
+        self,
+        metrics: Mapping[str, float],
+        unit: str = "None",
+        storage_resolution: StorageResolution = StorageResolution.STANDARD,
+        aggregation_type: AggregationType = None,
     ) -> "MetricsLogger":
-        self.context.put_metric(key, value, unit, storage_resolution)
+        self.context.put_metrics(metrics, unit, storage_resolution, aggregation_type)
+        return self
+
+    def put_metric_values(
+        self,
+        key: str,
+        values: Iterable[float],
+        unit: str = "None",
+        storage_resolution: StorageResolution = StorageResolution.STANDARD,
+        aggregation_type: AggregationType = None,
+    ) -> "MetricsLogger":
+        self.context.put_metric_values(key, values, unit, storage_resolution, aggregation_type)
+        return self
+
+    def set_default_aggregation_type(self, aggregation_type: AggregationType) -> "MetricsLogger":
+        self.context.set_default_aggregation_type(aggregation_type)
         return self
 
     def add_stack_trace(self, key: str, details: Any = None, exc_info: Tuple = None) -> "MetricsLogger":
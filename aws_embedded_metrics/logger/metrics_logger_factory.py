@@ -14,9 +14,34 @@
 from aws_embedded_metrics.logger.metrics_context import MetricsContext
 from aws_embedded_metrics.logger.metrics_logger import MetricsLogger
 from aws_embedded_metrics.environment.environment_detector import resolve_environment
+from typing import List
+
+# The maximum number of released loggers kept for reuse by create_metrics_logger.
+LOGGER_POOL_SIZE = 32
+
+# list.append and list.pop are atomic, so the pool needs no lock.
+# The size check is not, which may let the pool briefly exceed its size.
+logger_pool: List[MetricsLogger] = []
 
 
 def create_metrics_logger() -> MetricsLogger:
-    context = MetricsContext.empty()
-    logger = MetricsLogger(resolve_environment, context)
+    try:
+        logger = logger_pool.pop()
+    except IndexError:
+        context = MetricsContext.empty()
+        logger = MetricsLogger(resolve_environment, context)
+        return logger
+
+    # cleared when reused rather than when released, so the context is timestamped now
+    logger.context.clear()
+    logger.flush_preserve_dimensions = False
     return logger
+
+
+def release_metrics_logger(logger: MetricsLogger) -> None:
+    """
+    Returns a flushed logger to the pool used by create_metrics_logger.
+    The logger must not be used by the caller afterwards.
+    """
+    if len(logger_pool) < LOGGER_POOL_SIZE and logger.resolve_environment is resolve_environment:
+        logger_pool.append(logger)
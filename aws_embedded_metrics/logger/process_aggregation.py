@@ -0,0 +1,296 @@
+# Copyright 2019 Amazon.com, Inc. or its affiliates.
+# Licensed under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from aws_embedded_metrics.config import get_config
+from aws_embedded_metrics.logger.metric import HistogramMetric, Metric, StatisticSetMetric
+from aws_embedded_metrics.logger.metrics_context import MetricsContext
+from aws_embedded_metrics.serializers.json_encoder import get_json_encoder
+from aws_embedded_metrics.storage_resolution import StorageResolution
+from typing import Any, Callable, Dict, FrozenSet, IO, Iterator, Optional, Tuple
+import json
+import logging
+import os
+import selectors
+import socket
+import threading
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # type: ignore
+
+log = logging.getLogger(__name__)
+
+# (namespace, dimension set) that the metrics of a context are aggregated by
+ContextKey = Tuple[Optional[str], FrozenSet[Tuple[str, str]]]
+
+# Seconds a process waits on the elected process to accept forwarded metrics before flushing them itself
+SEND_TIMEOUT = 1.0
+# Seconds between checks of whether the elected process is stopping
+SELECT_TIMEOUT = 0.5
+RECEIVE_BUFFER_SIZE = 64 * 1024
+
+
+class ProcessAggregation:
+    """
+    Elects one of the processes sharing a socket path, such as the workers of
+    a pre-fork server, to aggregate the metrics of all of them. The other
+    processes forward their aggregated metrics to it over a Unix socket
+    instead of flushing them, so only the elected process sends events and
+    connects to the agent.
+
+    The process holding an exclusive lock on <socket_path>.lock is elected.
+    The lock is released when that process exits, and the next process that
+    fails to forward its metrics takes over.
+    """
+
+    def __init__(self, socket_path: str, receive: Callable[[Optional[str], Dict[str, str], MetricsContext], None]):
+        if fcntl is None or not hasattr(socket, "AF_UNIX"):
+            raise OSError("Aggregating metrics across processes requires Unix domain sockets")
+        self.socket_path = socket_path
+        self.lock_path = socket_path + ".lock"
+        self.receive = receive
+        self.__mutex = threading.Lock()
+        self.__stopped = threading.Event()
+        self.__closed = False
+        self.__lock_file: Optional[IO[str]] = None
+        self.__server: Optional[socket.socket] = None
+        self.__client: Optional[socket.socket] = None
+        self.__thread: Optional[threading.Thread] = None
+
+    @property
+    def is_elected(self) -> bool:
+        return self.__server is not None
+
+    def elect(self) -> bool:
+        """
+        Tries to become the process that aggregates the metrics of the others.
+        """
+        with self.__mutex:
+            return self.__elect()
+
+    def forward(self, contexts: Dict[ContextKey, MetricsContext]) -> bool:
+        """
+        Sends the contexts to the elected process. Returns False if this process
+        is elected, or no process could be reached, in which case the caller
+        flushes the contexts itself.
+        """
+        with self.__mutex:
+            if self.__server is not None:
+                return False
+            payload = encode_contexts(contexts)
+            if self.__send(payload):
+                return True
+            # the elected process has exited, or none was elected yet
+            if not self.__closed and self.__elect():
+                return False
+            return self.__send(payload)
+
+    def close(self) -> None:
+        """
+        Stops receiving metrics from other processes and gives up the election.
+        Contexts forwarded afterwards are still sent to any other elected process.
+        """
+        with self.__mutex:
+            self.__closed = True
+            thread = self.__thread
+            if thread is not None:
+                self.__stopped.set()
+                thread.join()
+                self.__thread = None
+            if self.__server is not None:
+                self.__server.close()
+                self.__server = None
+                try:
+                    os.unlink(self.socket_path)
+                except OSError:
+                    pass
+            if self.__lock_file is not None:
+                self.__lock_file.close()
+                self.__lock_file = None
+            self.__close_client()
+
+    def reset_after_fork(self) -> None:
+        """
+        Drops the election state inherited from the parent process. The socket
+        and lock stay owned by the parent, so they are closed without being released.
+        """
+        for resource in (self.__server, self.__client, self.__lock_file):
+            if resource is not None:
+                resource.close()
+        self.__server = None
+        self.__client = None
+        self.__lock_file = None
+        self.__thread = None
+        self.__mutex = threading.Lock()
+        self.__stopped = threading.Event()
+
+    def __elect(self) -> bool:
+        if self.__server is not None:
+            return True
+        if self.__closed:
+            return False
+
+        lock_file = open(self.lock_path, "a")
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+
+        # the socket of a previously elected process that has exited may remain
+        try:
+            os.unlink(self.socket_path)
+        except FileNotFoundError:
+            pass
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            server.bind(self.socket_path)
+            server.listen()
+        except OSError:
+            server.close()
+            lock_file.close()
+            log.exception("Failed to listen for metrics of other processes on %s", self.socket_path)
+            return False
+
+        self.__lock_file = lock_file
+        self.__server = server
+        self.__stopped.clear()
+        self.__thread = threading.Thread(target=self.__serve, args=(server,), name="aws-embedded-metrics-receiver", daemon=True)
+        self.__thread.start()
+        log.info("Elected to aggregate the metrics of processes sharing %s", self.socket_path)
+        return True
+
+    def __send(self, payload: bytes) -> bool:
+        try:
+            if self.__client is None:
+                client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                client.settimeout(SEND_TIMEOUT)
+                try:
+                    client.connect(self.socket_path)
+                except OSError:
+                    client.close()
+                    raise
+                self.__client = client
+            self.__client.sendall(payload)
+            return True
+        except OSError:
+            self.__close_client()
+            return False
+
+    def __close_client(self) -> None:
+        if self.__client is not None:
+            self.__client.close()
+            self.__client = None
+
+    def __serve(self, server: socket.socket) -> None:
+        buffers: Dict[socket.socket, bytearray] = {}
+        with selectors.DefaultSelector() as selector:
+            selector.register(server, selectors.EVENT_READ)
+            while not self.__stopped.is_set():
+                for key, _ in selector.select(SELECT_TIMEOUT):
+                    if key.fileobj is server:
+                        connection, _ = server.accept()
+                        connection.setblocking(False)
+                        selector.register(connection, selectors.EVENT_READ)
+                        buffers[connection] = bytearray()
+                        continue
+
+                    connection = key.fileobj  # type: ignore
+                    try:
+                        data = connection.recv(RECEIVE_BUFFER_SIZE)
+                    except BlockingIOError:
+                        continue
+                    except OSError:
+                        data = b""
+                    if not data:
+                        # an incomplete payload left by a process that exited mid-send is discarded
+                        selector.unregister(connection)
+                        connection.close()
+                        del buffers[connection]
+                        continue
+                    self.__receive(buffers[connection], data)
+
+            for connection in buffers:
+                connection.close()
+
+    def __receive(self, buffer: bytearray, data: bytes) -> None:
+        buffer += data
+        while True:
+            end = buffer.find(b"\n")
+            if end < 0:
+                return
+            payload = bytes(buffer[:end])
+            del buffer[:end + 1]
+            try:
+                for namespace, dimensions, context in decode_contexts(payload):
+                    self.receive(namespace, dimensions, context)
+            except Exception:
+                log.exception("Ignoring metrics forwarded by another process that could not be aggregated")
+
+
+def encode_contexts(contexts: Dict[ContextKey, MetricsContext]) -> bytes:
+    """Encodes the metrics of the contexts as one newline-terminated JSON payload."""
+    encoder = get_json_encoder(get_config().json_encoder)
+    body = [
+        {
+            "Namespace": namespace,
+            "Dimensions": dict(dimensions),
+            "Metrics": {name: encode_metric(metric) for name, metric in context.metrics.items()},
+        }
+        for (namespace, dimensions), context in contexts.items()
+    ]
+    return encoder.encode(body).encode("utf-8") + b"\n"
+
+
+def decode_contexts(payload: bytes) -> Iterator[Tuple[Optional[str], Dict[str, str], MetricsContext]]:
+    for body in json.loads(payload):
+        context = MetricsContext.empty()
+        context.metrics = {name: decode_metric(metric) for name, metric in body["Metrics"].items()}
+        yield body["Namespace"], body["Dimensions"], context
+
+
+def encode_metric(metric: Metric) -> Dict[str, Any]:
+    body: Dict[str, Any] = {"Unit": metric.unit, "StorageResolution": metric.storage_resolution.value}
+    if isinstance(metric, StatisticSetMetric):
+        body["Statistics"] = metric.get_statistic_set()
+    else:
+        body["Values"] = metric.values.tolist()
+    if isinstance(metric, HistogramMetric):
+        body["Buckets"] = list(metric.positive_buckets.items())
+        body["NegativeBuckets"] = list(metric.negative_buckets.items())
+        body["ZeroCount"] = metric.zero_count
+    return body
+
+
+def decode_metric(body: Dict[str, Any]) -> Metric:
+    unit = body["Unit"]
+    storage_resolution = StorageResolution(body["StorageResolution"])
+    if "Values" in body:
+        values = body["Values"]
+        metric = Metric(values[0], unit, storage_resolution)
+        metric.add_values(values[1:])
+        return metric
+
+    statistics = body["Statistics"]
+    if "Buckets" in body:
+        metric = HistogramMetric(statistics["Min"], unit, storage_resolution)
+        metric.positive_buckets = dict(body["Buckets"])
+        metric.negative_buckets = dict(body["NegativeBuckets"])
+        metric.zero_count = body["ZeroCount"]
+    else:
+        metric = StatisticSetMetric(statistics["Min"], unit, storage_resolution)
+    metric.max = statistics["Max"]
+    metric.sum = statistics["Sum"]
+    metric.count = statistics["Count"]
+    return metric
@@ -12,7 +12,7 @@
 # limitations under the License.
 
 from typing import Any, Callable, Optional, TypeVar, cast
-from aws_embedded_metrics.logger.metrics_logger_factory import create_metrics_logger
+from aws_embedded_metrics.logger.metrics_logger_factory import create_metrics_logger, release_metrics_logger
 from aws_embedded_metrics.config import get_config
 import inspect
 import asyncio
@@ -21,7 +21,7 @@ from functools import wraps
 F = TypeVar('F', bound=Callable[..., Any])
 
 
-def _build_decorator(fn: F, flush_on_yield: bool) -> F:
+def _build_decorator(fn: F, flush_on_yield: bool, reuse_logger: bool) -> F:
     if inspect.isasyncgenfunction(fn):
         @wraps(fn)
         async def async_gen_wrapper(*args, **kwargs):  # type: ignore
@@ -36,6 +36,8 @@ def _build_decorator(fn: F, flush_on_yield: bool) -> F:
                     yield result
             finally:
                 await logger.flush()
+                if reuse_logger:
+                    release_metrics_logger(logger)
 
         return cast(F, async_gen_wrapper)
 
@@ -53,6 +55,8 @@ def _build_decorator(fn: F, flush_on_yield: bool) -> F:
                     yield result
             finally:
                 logger.flush_sync()
+                if reuse_logger:
+                    release_metrics_logger(logger)
 
         return cast(F, gen_wrapper)
 
@@ -67,6 +71,8 @@ def _build_decorator(fn: F, flush_on_yield: bool) -> F:
                 return await fn(*args, **kwargs)
             finally:
                 await logger.flush()
+                if reuse_logger:
+                    release_metrics_logger(logger)
 
         return cast(F, async_wrapper)
 
@@ -81,16 +87,20 @@ def _build_decorator(fn: F, flush_on_yield: bool) -> F:
                 return fn(*args, **kwargs)
             finally:
                 logger.flush_sync()
+                if reuse_logger:
+                    release_metrics_logger(logger)
 
         return cast(F, wrapper)
 
 
-def metric_scope(fn: Optional[F] = None, *, flush_on_yield: Optional[bool] = None) -> F:
+def metric_scope(fn: Optional[F] = None, *, flush_on_yield: Optional[bool] = None, reuse_logger: bool = False) -> F:
     # fn is Optional to support both @metric_scope and @metric_scope(flush_on_yield=False).
     # The former passes fn directly, the latter calls metric_scope() first and returns a decorator.
+    # With reuse_logger, the logger is returned to a pool once its metrics have been flushed,
+    # so the decorated function must not keep it after returning.
     if flush_on_yield is None:
         flush_on_yield = get_config().default_flush_on_yield
 
     if fn is not None:
-        return _build_decorator(fn, flush_on_yield)
-    return cast(F, lambda x: _build_decorator(x, flush_on_yield))
+        return _build_decorator(fn, flush_on_yield, reuse_logger)
+    return cast(F, lambda x: _build_decorator(x, flush_on_yield, reuse_logger))
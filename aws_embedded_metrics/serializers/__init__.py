@@ -13,7 +13,7 @@
 
 import abc
 from aws_embedded_metrics.logger.metrics_context import MetricsContext
-from typing import List
+from typing import Iterator, List
 
 
 class Serializer(abc.ABC):
@@ -21,3 +21,21 @@ class Serializer(abc.ABC):
     @abc.abstractmethod
     def serialize(context: MetricsContext) -> List[str]:
         """Flushes the metrics context to the sink."""
+
+    def serialize_iter(self, context: MetricsContext) -> Iterator[str]:
+        """
+        Yields serialized events one at a time.
+        Serializers that can produce events incrementally should override this
+        so sinks can write each event before the next one is built.
+        """
+        return iter(self.serialize(context))
+
+    def serialize_to_bytes(self, context: MetricsContext) -> Iterator[bytes]:
+        """Yields serialized events as newline-terminated UTF-8 payloads."""
+        for event in self.serialize_iter(context):
+            yield (event + "\n").encode("utf-8")
+
+    def serialize_into(self, context: MetricsContext, buffer: bytearray) -> None:
+        """Appends newline-terminated UTF-8 serialized events to the buffer."""
+        for event in self.serialize_to_bytes(context):
+            buffer += event
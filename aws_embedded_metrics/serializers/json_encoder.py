@@ -0,0 +1,113 @@
+# Copyright 2019 Amazon.com, Inc. or its affiliates.
+# Licensed under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import abc
+import json
+import logging
+from typing import Any, Dict, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+log = logging.getLogger(__name__)
+
+AUTO = "auto"
+
+
+class JsonEncoder(abc.ABC):
+    """Encodes serialized events as JSON text."""
+
+    # Separators used by encode(), so that pre-encoded fragments
+    # can be joined into output identical to encoding the whole object.
+    item_separator = ", "
+    key_separator = ": "
+
+    @staticmethod
+    @abc.abstractmethod
+    def name() -> str:
+        """The name used to select the encoder through configuration."""
+
+    @abc.abstractmethod
+    def encode(self, obj: Any) -> str:
+        """Encodes the object as a JSON string."""
+
+    def encode_bytes(self, obj: Any) -> bytes:
+        """Encodes the object as UTF-8 JSON."""
+        return self.encode(obj).encode("utf-8")
+
+    def encode_line(self, obj: Any) -> bytes:
+        """Encodes the object as UTF-8 JSON followed by a newline."""
+        return self.encode_bytes(obj) + b"\n"
+
+
+class StdlibJsonEncoder(JsonEncoder):
+    def encode(self, obj: Any) -> str:
+        return json.dumps(obj)
+
+    @staticmethod
+    def name() -> str:
+        return "json"
+
+
+class OrjsonEncoder(JsonEncoder):
+    item_separator = ","
+    key_separator = ":"
+
+    def encode(self, obj: Any) -> str:
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except TypeError:
+            # orjson rejects some objects the standard library accepts,
+            # such as non-string keys and integers wider than 64 bits
+            return json.dumps(obj, separators=(self.item_separator, self.key_separator))
+
+    def encode_bytes(self, obj: Any) -> bytes:
+        # orjson produces UTF-8 natively, so this skips the decode done by encode()
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            return super().encode_bytes(obj)
+
+    def encode_line(self, obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            return super().encode_line(obj)
+
+    @staticmethod
+    def name() -> str:
+        return "orjson"
+
+
+encoders: Dict[str, JsonEncoder] = {StdlibJsonEncoder.name(): StdlibJsonEncoder()}
+if orjson is not None:
+    encoders[OrjsonEncoder.name()] = OrjsonEncoder()
+
+
+def get_json_encoder(name: Optional[str] = None) -> JsonEncoder:
+    """
+    Gets the encoder with the given name. When no name or "auto" is given,
+    the fastest installed encoder is used. Unknown or unavailable encoders
+    fall back to the standard library json module.
+    """
+    if not name or name.lower() == AUTO:
+        return encoders.get(OrjsonEncoder.name()) or encoders[StdlibJsonEncoder.name()]
+
+    encoder = encoders.get(name.lower())
+    if encoder is None:
+        log.warning("JSON encoder %s is not available, falling back to %s", name, StdlibJsonEncoder.name())
+        encoder = encoders[StdlibJsonEncoder.name()]
+        encoders[name.lower()] = encoder
+    return encoder
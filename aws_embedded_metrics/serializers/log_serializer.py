@@ -12,24 +12,87 @@
 # limitations under the License.
 
 from aws_embedded_metrics.config import get_config
+from aws_embedded_metrics.logger.metric import HistogramMetric, Metric, StatisticSetMetric
 from aws_embedded_metrics.logger.metrics_context import MetricsContext
 from aws_embedded_metrics.serializers import Serializer
+from aws_embedded_metrics.serializers.json_encoder import JsonEncoder, get_json_encoder
 from aws_embedded_metrics.constants import (
     MAX_DIMENSION_SET_SIZE, MAX_METRICS_PER_EVENT, MAX_DATAPOINTS_PER_METRIC
 )
 from aws_embedded_metrics.exceptions import DimensionSetExceededError
 from aws_embedded_metrics.storage_resolution import StorageResolution
-import json
-from typing import Any, Dict, List
+from array import array
+from collections import Counter
+import functools
+import logging
+import operator
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+log = logging.getLogger(__name__)
+
+NEWLINE = b"\n"
+
+# Number of distinct envelope schemas whose encoded directive is kept around
+ENVELOPE_CACHE_SIZE = 256
 
 
 class LogSerializer(Serializer):
     @staticmethod
     def serialize(context: MetricsContext) -> List[str]:
+        return list(LogSerializer.serialize_iter(context))
+
+    @staticmethod
+    def serialize_iter(context: MetricsContext) -> Iterator[str]:
+        """
+        Yields each serialized event as soon as it is complete, so only
+        one event needs to be held in memory at a time.
+        """
+        return LogSerializer.__encode_events(context, False)
+
+    @staticmethod
+    def serialize_to_bytes(context: MetricsContext) -> Iterator[bytes]:
+        """
+        Yields each serialized event as a newline-terminated UTF-8 payload
+        that can be written to a socket as-is. Events are assembled from the
+        encoder's bytes output, so encoders that produce bytes natively are
+        never round-tripped through text.
+        """
+        return LogSerializer.__encode_events(context, True)
+
+    @staticmethod
+    def serialize_into(context: MetricsContext, buffer: bytearray) -> None:
+        """
+        Appends each serialized event, terminated by a newline, to a
+        caller-supplied buffer, so that all the events of a flush can be
+        written to a socket at once.
+        """
+        for event in LogSerializer.__encode_events(context, True):
+            buffer += event
+
+    @staticmethod
+    def __encode_events(context: MetricsContext, binary: bool) -> Iterator[Any]:
+        # Events are str, or newline-terminated bytes when binary is set.
+        # Literals are converted once up front so both share the code below.
         config = get_config()
+        encoder = get_json_encoder(config.json_encoder)
+        max_event_size = config.max_event_size
+        if binary:
+            encode: Callable[[Any], Any] = encoder.encode_bytes
+            encode_body: Callable[[Any], Any] = encoder.encode_line
+            literal: Callable[[str], Any] = str.encode
+            get_size: Callable[[Any], int] = len
+            terminator: Any = NEWLINE
+        else:
+            encode = encode_body = encoder.encode
+            literal = str
+            get_size = get_encoded_size
+            terminator = ""
+        item_separator = literal(encoder.item_separator)
+
+        def get_event_size(event: Any) -> int:
+            return get_size(event) - len(terminator)
 
         dimension_keys = []
-        dimensions_properties: Dict[str, str] = {}
 
         for dimension_set in context.get_dimensions():
             keys = list(dimension_set.keys())
@@ -38,77 +101,301 @@ class LogSerializer(Serializer):
                            f"Account for default dimensions if not using set_dimensions.")
                 raise DimensionSetExceededError(err_msg)
             dimension_keys.append(keys)
-            dimensions_properties = {**dimensions_properties, **dimension_set}
 
-        def create_body() -> Dict[str, Any]:
-            body: Dict[str, Any] = {
-                **dimensions_properties,
-                **context.properties,
-            }
+        root: Dict[str, Any] = {
+            **context.get_dimension_properties(),
+            **context.get_properties(),
+        }
+
+        def create_body(batch: List[MetricSlice], values: Dict[str, Any]) -> Dict[str, Any]:
+            body: Dict[str, Any] = {**root}
             if not config.disable_metric_extraction:
                 body["_aws"] = {
                     **context.meta,
                     "CloudWatchMetrics": [
                         {
                             "Dimensions": dimension_keys,
-                            "Metrics": [],
+                            "Metrics": [create_metric_definition(*schema) for schema in get_metric_schema(batch)],
                             "Namespace": context.namespace,
                         },
                     ],
                 }
+            body.update(values)
             return body
 
-        current_body: Dict[str, Any] = {}
-        event_batches: List[str] = []
-        num_metrics_in_current_body = 0
-
-        # Track if any given metric has data remaining to be serialized
-        remaining_data = True
-
-        # Track batch number to know where to slice metric data
-        i = 0
-        complete_metrics = set()
-        while remaining_data:
-            remaining_data = False
-            current_body = create_body()
-
-            for metric_name, metric in context.metrics.items():
-                # ensure we don't add duplicates of metrics we already completed
-                if metric_name in complete_metrics:
-                    continue
-
-                if len(metric.values) == 1:
-                    current_body[metric_name] = metric.values[0]
-                    complete_metrics.add(metric_name)
-                else:
-                    # Slice metric data as each batch cannot contain more than
-                    # MAX_DATAPOINTS_PER_METRIC entries for a given metric
-                    start_index = i * MAX_DATAPOINTS_PER_METRIC
-                    end_index = (i + 1) * MAX_DATAPOINTS_PER_METRIC
-                    current_body[metric_name] = metric.values[start_index:end_index]
-
-                    # Make sure to consume remaining values if we sliced before the end
-                    # of the metric value list
-                    if len(metric.values) > end_index:
-                        remaining_data = True
-                    else:
-                        complete_metrics.add(metric_name)
-
-                metric_body = {"Name": metric_name, "Unit": metric.unit}
-                if metric.storage_resolution == StorageResolution.HIGH:
-                    metric_body["StorageResolution"] = metric.storage_resolution.value  # type: ignore
+        # The directive is spliced in from the envelope cache unless a property or
+        # metric shadows one of its keys, in which case the body is encoded as a whole.
+        use_envelope_cache = (
+            not config.disable_metric_extraction
+            and "_aws" not in root
+            and "CloudWatchMetrics" not in context.meta
+        )
+        if use_envelope_cache:
+            dimension_schema = tuple(tuple(keys) for keys in dimension_keys)
+            # everything up to the directive: '{<root>, "_aws": {<meta>, '
+            prefix = encode(root)[:-1]
+            if root:
+                prefix += item_separator
+            prefix += literal('"_aws"' + encoder.key_separator) + encode(context.meta)[:-1]
+            if context.meta:
+                prefix += item_separator
+            close_empty = literal("}}") + terminator
+            close_directive = literal("}") + item_separator
+            close_values = literal("}") + terminator
+
+        def encode_event(batch: List[MetricSlice], values: Dict[str, Any], encoded_values: Any = None) -> Any:
+            if use_envelope_cache and root.keys().isdisjoint(values):
+                directive = encode_metric_directive(
+                    encoder, context.namespace, dimension_schema, get_metric_schema(batch), binary
+                )
+                if not values:
+                    return prefix + directive + close_empty
+                if encoded_values is None:
+                    encoded_values = encode(values)[1:-1]
+                return prefix + directive + close_directive + encoded_values + close_values
+            return encode_body(create_body(batch, values))
+
+        def split_event(batch: List[MetricSlice], values: Dict[str, Any]) -> Iterator[Tuple[List[MetricSlice], Dict[str, Any], Any]]:
+            # Yields each sub-batch with its values and encoded event. Each metric adds its encoded value and, unless extraction is disabled,
+            # its definition plus one separator for each. This slightly overestimates
+            # the size so the resulting events always stay within the budget.
+            separator_size = len(item_separator)
+            base_size = get_event_size(encode_event([], {}))
+
+            sub_batch: List[MetricSlice] = []
+            sub_values: Dict[str, Any] = {}
+            fragments: List[Any] = []
+            size = base_size
+            for metric_slice in batch:
+                metric_name = metric_slice.name
+                fragment = encode({metric_name: values[metric_name]})[1:-1]
+                slice_size = get_size(fragment) + separator_size
                 if not config.disable_metric_extraction:
-                    current_body["_aws"]["CloudWatchMetrics"][0]["Metrics"].append(metric_body)
-                num_metrics_in_current_body += 1
+                    definition = create_metric_definition(*get_metric_schema([metric_slice])[0])
+                    slice_size += get_size(encode(definition)) + separator_size
+
+                if sub_batch and size + slice_size > max_event_size:
+                    yield sub_batch, sub_values, encode_event(sub_batch, sub_values, item_separator.join(fragments))
+                    sub_batch, sub_values, fragments = [], {}, []
+                    size = base_size
+
+                sub_batch.append(metric_slice)
+                sub_values[metric_name] = values[metric_name]
+                fragments.append(fragment)
+                size += slice_size
+
+            yield sub_batch, sub_values, encode_event(sub_batch, sub_values, item_separator.join(fragments))
+
+        def split_datapoints(batch: List[MetricSlice], values: Dict[str, Any], event: Any) -> Iterator[Any]:
+            # An event that still exceeds the budget holds a single metric, whose
+            # datapoints are halved until each half fits or cannot be split further.
+            event_size = get_event_size(event)
+            if event_size <= max_event_size:
+                yield event
+                return
+
+            halves = split_slice(batch[0]) if len(batch) == 1 else None
+            if halves is None or get_event_size(encode_event([], {})) > max_event_size:
+                log.warning("Serialized event of %d bytes exceeds the maximum event size of %d bytes", event_size, max_event_size)
+                yield event
+                return
+
+            for half in halves:
+                half_values = {half.name: get_slice_value(half)}
+                yield from split_datapoints([half], half_values, encode_event([half], half_values))
+
+        metrics = context.metrics
+        if config.compress_values or any(type(metric) is HistogramMetric for metric in metrics.values()):
+            metrics = {metric_name: prepare_metric(metric, config.compress_values) for metric_name, metric in metrics.items()}
+
+        for batch in plan_batches(metrics):
+            values = {metric_slice.name: get_slice_value(metric_slice) for metric_slice in batch}
+
+            event = encode_event(batch, values)
+            if get_event_size(event) <= max_event_size:
+                yield event
+                continue
+
+            for sub_batch, sub_values, event in split_event(batch, values) if len(batch) > 1 else [(batch, values, event)]:
+                yield from split_datapoints(sub_batch, sub_values, event)
+
+
+def get_slice_value(metric_slice: "MetricSlice") -> Any:
+    """Returns the value serialized for a slice of a metric's datapoints."""
+    _, metric, start_index, end_index = metric_slice
+    if isinstance(metric, StatisticSetMetric):
+        return metric.get_statistic_set()
+    if isinstance(metric, ValuesAndCounts):
+        return metric.get_values_and_counts(start_index, end_index)
+    if len(metric.values) == 1:
+        return metric.values[0]
+    # slicing the array copies the unboxed doubles, only the slice is boxed
+    return metric.values[start_index:end_index].tolist()
+
+
+def split_slice(metric_slice: "MetricSlice") -> Optional[Tuple["MetricSlice", "MetricSlice"]]:
+    """
+    Splits a slice of a metric's datapoints in two halves, or returns None
+    when the slice is a statistic set or a single value.
+    """
+    name, metric, start_index, end_index = metric_slice
+    end_index = min(end_index, len(metric.values))
+    if isinstance(metric, StatisticSetMetric) or end_index - start_index < 2:
+        return None
+    middle = (start_index + end_index) // 2
+    return _make_slice((name, metric, start_index, middle)), _make_slice((name, metric, middle, end_index))
+
+
+def get_encoded_size(text: str) -> int:
+    """Returns the size of the text once encoded as UTF-8."""
+    return len(text) if text.isascii() else len(text.encode("utf-8"))
+
+
+# (name, unit, is high resolution) of each metric in an event
+MetricSchema = Tuple[str, str, bool]
+
+
+def get_metric_schema(batch: List["MetricSlice"]) -> Tuple[MetricSchema, ...]:
+    return tuple(
+        (metric_name, metric.unit, metric.storage_resolution is StorageResolution.HIGH)
+        for metric_name, metric, _, _ in batch
+    )
+
+
+def create_metric_definition(name: str, unit: str, is_high_resolution: bool) -> Dict[str, Any]:
+    metric_body: Dict[str, Any] = {"Name": name, "Unit": unit}
+    if is_high_resolution:
+        metric_body["StorageResolution"] = StorageResolution.HIGH.value
+    return metric_body
+
+
+@functools.lru_cache(maxsize=ENVELOPE_CACHE_SIZE)
+def encode_metric_directive(
+    encoder: JsonEncoder,
+    namespace: str,
+    dimension_keys: Tuple[Tuple[str, ...], ...],
+    metrics: Tuple[MetricSchema, ...],
+    binary: bool = False,
+) -> Union[str, bytes]:
+    """
+    Encodes the "CloudWatchMetrics" member of the "_aws" envelope, as UTF-8 when binary is set.
+    Contexts flushed repeatedly with the same namespace, dimension keys and
+    metric definitions reuse the encoded fragment instead of rebuilding it.
+    """
+    directive = [
+        {
+            "Dimensions": dimension_keys,
+            "Metrics": [create_metric_definition(*schema) for schema in metrics],
+            "Namespace": namespace,
+        },
+    ]
+    key = '"CloudWatchMetrics"' + encoder.key_separator
+    if binary:
+        return key.encode("utf-8") + encoder.encode_bytes(directive)
+    return key + encoder.encode(directive)
+
+
+class ValuesAndCounts(Metric):
+    """
+    The datapoints of a metric with repeated values collapsed into
+    distinct values and the number of times each one was recorded.
+    """
+
+    __slots__ = ("counts", "statistics")
+
+    def __init__(
+        self, metric: Metric, values: Iterable[float], counts: List[int], statistics: Optional[Dict[str, float]] = None
+    ):
+        self.values = array("d", values)
+        self.counts = counts
+        self.unit = metric.unit
+        self.storage_resolution = metric.storage_resolution
+        # exact statistics of all the datapoints, used when they fit in a single event
+        self.statistics = statistics
+
+    def get_values_and_counts(self, start: int, end: int) -> Dict[str, Any]:
+        values = self.values[start:end].tolist()
+        counts = self.counts[start:end]
+        if self.statistics is not None and start == 0 and end >= len(self.values):
+            return {"Values": values, "Counts": counts, **self.statistics}
+        return {
+            "Values": values,
+            "Counts": counts,
+            "Max": max(values),
+            "Min": min(values),
+            "Count": sum(counts),
+            "Sum": sum(map(operator.mul, values, counts)),
+        }
+
+
+def compress_metric(metric: Metric) -> Metric:
+    """Collapses repeated values of a metric, leaving metrics without duplicates untouched."""
+    if len(metric.values) <= 1:
+        return metric
+    counter = Counter(metric.values)
+    if len(counter) == len(metric.values):
+        return metric
+    return ValuesAndCounts(metric, counter.keys(), list(counter.values()))
+
+
+def prepare_metric(metric: Metric, compress_values: bool) -> Metric:
+    """Lays out histograms as values and counts and, if enabled, collapses repeated values of other metrics."""
+    if type(metric) is HistogramMetric:
+        values, counts = metric.get_buckets()
+        return ValuesAndCounts(metric, values, counts, metric.get_statistic_set())
+    if compress_values:
+        return compress_metric(metric)
+    return metric
+
+
+class MetricSlice(NamedTuple):
+    name: str
+    metric: Metric
+    start: int
+    end: int
+
+
+# skips the generated keyword-aware __new__, which dominates planning small contexts
+_make_slice = functools.partial(tuple.__new__, MetricSlice)
+
+
+def plan_batches(metrics: Dict[str, Metric]) -> Iterator[List[MetricSlice]]:
+    """
+    Lays out the metric data of a context into events.
+
+    Each metric contributes one slice of at most MAX_DATAPOINTS_PER_METRIC values
+    per pass, and a pass only visits the metrics that still have data left, so
+    the cost grows with the number of slices rather than passes x metrics.
+    An event is closed once it holds MAX_METRICS_PER_EVENT slices or a pass ends.
+    A context without metrics still produces a single empty batch.
+    """
+    active = list(metrics.items())
+    batch: List[MetricSlice] = []
+    has_emitted_batches = False
+
+    # The slice count is intentionally not reset at the end of a pass, which
+    # keeps the event layout identical to previous releases.
+    num_slices_in_batch = 0
+    start_index = 0
+    while active or not has_emitted_batches:
+        end_index = start_index + MAX_DATAPOINTS_PER_METRIC
+        remaining = []
+        for metric_name, metric in active:
+            batch.append(_make_slice((metric_name, metric, start_index, end_index)))
+            if len(metric.values) > end_index:
+                remaining.append((metric_name, metric))
 
-                if (num_metrics_in_current_body == MAX_METRICS_PER_EVENT):
-                    event_batches.append(json.dumps(current_body))
-                    current_body = create_body()
-                    num_metrics_in_current_body = 0
+            num_slices_in_batch += 1
+            if num_slices_in_batch == MAX_METRICS_PER_EVENT:
+                yield batch
+                has_emitted_batches = True
+                batch = []
+                num_slices_in_batch = 0
 
-            # iter over missing datapoints
-            i += 1
-            if not event_batches or num_metrics_in_current_body > 0:
-                event_batches.append(json.dumps(current_body))
+        if not has_emitted_batches or num_slices_in_batch > 0:
+            yield batch
+            has_emitted_batches = True
+            batch = []
 
-        return event_batches
+        active = remaining
+        start_index = end_index
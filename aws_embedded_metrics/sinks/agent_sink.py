@@ -72,9 +72,10 @@ class AgentSink(Sink):
             self.endpoint.hostname,
             self.endpoint.port,
         )
-        for serialized_content in self.serializer.serialize(context):
-            message = serialized_content + "\n"
-            self.client.send_message(message.encode('utf-8'))
+        # events are sent one at a time, so only one is held in memory and a
+        # retried send cannot repeat events that were already written
+        for message in self.serializer.serialize_to_bytes(context):
+            self.client.send_message(message)
 
     @staticmethod
     def name() -> str:
@@ -23,7 +23,7 @@ class StdoutSink(Sink):
         self.serializer = serializer
 
     def accept(self, context: MetricsContext) -> None:
-        for serialized_content in self.serializer.serialize(context):
+        for serialized_content in self.serializer.serialize_iter(context):
             if serialized_content:
                 sys.stdout.write(serialized_content + "\n")
 
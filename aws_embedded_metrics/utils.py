@@ -11,14 +11,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import sys
 import time
 from collections.abc import Awaitable
 from datetime import datetime
-from typing import TypeVar
+from typing import Any, TypeVar
 
 
 T = TypeVar("T")
 
+# dtype kinds of NumPy arrays holding real numbers: booleans, signed and unsigned integers, and floats
+NUMPY_NUMERIC_KINDS = "biuf"
+
 
 def now() -> int: return int(round(time.time() * 1000))
 
@@ -32,3 +36,14 @@ def convert_to_milliseconds(dt: datetime) -> int:
 
 async def _await(awaitable: Awaitable[T]) -> T:
     return await awaitable
+
+
+def get_numpy_module(values: Any) -> Any:
+    """
+    Returns the numpy module if values is a NumPy array, or None otherwise.
+    numpy is never imported here, an array can only be passed in if the caller already did.
+    """
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and isinstance(values, numpy.ndarray):
+        return numpy
+    return None
@@ -11,9 +11,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import math
 import re
-from typing import Dict, Optional
+from typing import Any, Collection, Dict, FrozenSet, Iterable, Mapping, Optional, Tuple, Union
+from aws_embedded_metrics.logger.metric import Metric, as_storage_resolution
 from aws_embedded_metrics.unit import Unit
 from aws_embedded_metrics.storage_resolution import StorageResolution
 from aws_embedded_metrics.exceptions import DimensionSetExceededError, InvalidDimensionError, InvalidMetricError, InvalidNamespaceError
@@ -21,10 +23,21 @@ from aws_embedded_metrics.exceptions import InvalidTimestampError
 from datetime import datetime
 from aws_embedded_metrics import constants, utils
 
+# Only valid names and dimension sets are cached, invalid ones raise and are checked again every time.
+VALIDATION_CACHE_SIZE = 1024
+
+# Enum membership tests go through EnumMeta and construct a member on every call,
+# so units and storage resolutions given as values are looked up in plain sets instead.
+# Members are accepted by type, since hashing an Enum member calls back into Python.
+VALID_UNITS: FrozenSet[object] = frozenset(unit.value for unit in Unit)
+VALID_STORAGE_RESOLUTIONS: FrozenSet[object] = frozenset(resolution.value for resolution in StorageResolution)
+VALID_NAMESPACE_PATTERN = re.compile(constants.VALID_NAMESPACE_REGEX)
+
 
 def validate_dimension_set(dimension_set: Dict[str, str]) -> None:
     """
-    Validates a dimension set
+    Validates a dimension set. Valid dimension sets are remembered, so
+    validating the same set again costs a single cache lookup.
 
         Parameters:
             dimension_set (Dict[str, str]): The dimension set to validate
@@ -37,7 +50,21 @@ def validate_dimension_set(dimension_set: Dict[str, str]) -> None:
         raise DimensionSetExceededError(
             f"Maximum number of dimensions per dimension set allowed are {constants.MAX_DIMENSION_SET_SIZE}")
 
-    for name, value in dimension_set.items():
+    try:
+        dimensions = frozenset(dimension_set.items())
+    except TypeError:
+        # unhashable names or values cannot be cached, they are rejected uncached instead
+        validate_dimensions.__wrapped__(tuple(dimension_set.items()))
+    else:
+        validate_dimensions(dimensions)
+
+
+@functools.lru_cache(maxsize=VALIDATION_CACHE_SIZE)
+def validate_dimensions(dimensions: Collection[Tuple[str, str]]) -> None:
+    for name, value in dimensions:
+        if not isinstance(name, str) or not isinstance(value, str):
+            raise InvalidDimensionError(f"Dimension names and values must be strings: {name!r}: {value!r}")
+
         if not name or len(name.strip()) == 0:
             raise InvalidDimensionError("Dimension name must include at least one non-whitespace character")
 
@@ -64,7 +91,7 @@ def validate_metric(name: str,
                     value: float,
                     unit: Optional[str],
                     storage_resolution: StorageResolution,
-                    metric_name_and_resolution_map: dict) -> None:
+                    metrics: Dict[str, Metric]) -> None:
     """
     Validates a metric
 
@@ -73,27 +100,155 @@ def validate_metric(name: str,
             value (float): The value of the metric
             unit (Optional[str]): The unit of the metric
             storage_resolution (Optional[int]): The storage resolution of metric
-            metric_name_and_resolution_map (dict): The map used for validating metric
+            metrics (Dict[str, Metric]): The metrics already in the context
 
         Raises:
             InvalidMetricError: If the metric is invalid
     """
+    validate_metric_definition(name, unit, storage_resolution, metrics)
+
+    try:
+        is_finite = math.isfinite(value)
+    except TypeError:
+        raise InvalidMetricError(f"Metric value must be a number: {value!r}") from None
+    if not is_finite:
+        raise InvalidMetricError("Metric value must be finite")
+
+
+def validate_metric_values(name: str,
+                           values: Iterable[float],
+                           unit: Optional[str],
+                           storage_resolution: StorageResolution,
+                           metrics: Dict[str, Metric]) -> None:
+    """
+    Validates a batch of values for a metric. The name, unit and storage
+    resolution are checked once and NumPy arrays are checked in a single
+    vectorized pass.
+
+        Parameters:
+            name (str): The name of the metric
+            values (Iterable[float]): The values of the metric
+            unit (Optional[str]): The unit of the metric
+            storage_resolution (Optional[int]): The storage resolution of metric
+            metrics (Dict[str, Metric]): The metrics already in the context
+
+        Raises:
+            InvalidMetricError: If the metric or any of its values is invalid
+    """
+    validate_metric_definition(name, unit, storage_resolution, metrics)
+
+    numpy = utils.get_numpy_module(values)
+    try:
+        if numpy is not None:
+            # complex values pass isfinite, and would then be cut to their real part
+            if values.dtype.kind not in utils.NUMPY_NUMERIC_KINDS:  # type: ignore
+                raise InvalidMetricError(f"Metric values must be real numbers: {values.dtype}")  # type: ignore
+            is_finite = bool(numpy.isfinite(values).all())
+        else:
+            is_finite = all(map(math.isfinite, values))
+    except TypeError:
+        raise InvalidMetricError("Metric values must be numbers") from None
+
+    if not is_finite:
+        raise InvalidMetricError("Metric value must be finite")
+
+
+def validate_metrics(values: Mapping[str, float],
+                     unit: Optional[str],
+                     storage_resolution: StorageResolution,
+                     metrics: Dict[str, Metric]) -> None:
+    """
+    Validates a batch of metrics sharing a unit and storage resolution.
+    The unit and storage resolution are checked once and the values in a
+    single pass.
+
+        Parameters:
+            values (Mapping[str, float]): The values of the metrics by name
+            unit (Optional[str]): The unit of the metrics
+            storage_resolution (Optional[int]): The storage resolution of the metrics
+            metrics (Dict[str, Metric]): The metrics already in the context
+
+        Raises:
+            InvalidMetricError: If any of the metrics is invalid
+    """
+    validate_metric_unit_and_resolution(unit, storage_resolution)
+
+    for name in values:
+        validate_metric_name(name)
+        validate_metric_resolution_is_unchanged(name, storage_resolution, metrics)
+
+    try:
+        is_finite = all(map(math.isfinite, values.values()))
+    except TypeError:
+        raise InvalidMetricError("Metric values must be numbers") from None
+    if not is_finite:
+        raise InvalidMetricError("Metric value must be finite")
+
+
+def validate_metric_definition(name: str,
+                               unit: Optional[str],
+                               storage_resolution: StorageResolution,
+                               metrics: Dict[str, Metric]) -> None:
+    """
+    Validates the name, unit and storage resolution of a metric
+
+        Parameters:
+            name (str): The name of the metric
+            unit (Optional[str]): The unit of the metric
+            storage_resolution (Optional[int]): The storage resolution of metric
+            metrics (Dict[str, Metric]): The metrics already in the context
+
+        Raises:
+            InvalidMetricError: If the metric is invalid
+    """
+    validate_metric_name(name)
+    validate_metric_unit_and_resolution(unit, storage_resolution)
+    validate_metric_resolution_is_unchanged(name, storage_resolution, metrics)
+
+
+def is_finite_number(value: Any) -> bool:
+    """Returns whether the value is a finite number, rather than raising for values that are not numbers."""
+    try:
+        return math.isfinite(value)
+    except TypeError:
+        return False
+
+
+def validate_metric_name(name: str) -> None:
+    # checked before the cache lookup, which would raise TypeError for unhashable names
+    if not isinstance(name, str):
+        raise InvalidMetricError(f"Metric name must be a string: {name!r}")
+
+    validate_metric_name_string(name)
+
+
+@functools.lru_cache(maxsize=VALIDATION_CACHE_SIZE)
+def validate_metric_name_string(name: str) -> None:
     if not name or len(name.strip()) == 0:
         raise InvalidMetricError("Metric name must include at least one non-whitespace character")
 
     if len(name) > constants.MAX_DIMENSION_NAME_LENGTH:
         raise InvalidMetricError(f"Metric name cannot be longer than {constants.MAX_DIMENSION_NAME_LENGTH} characters")
 
-    if not math.isfinite(value):
-        raise InvalidMetricError("Metric value must be finite")
 
-    if unit is not None and unit not in Unit:
+def validate_metric_unit_and_resolution(unit: Union[str, Unit, None], storage_resolution: StorageResolution) -> None:
+    # the types are checked before the set lookups, which would raise TypeError for unhashable values
+    if unit is not None and type(unit) is not Unit and (not isinstance(unit, str) or unit not in VALID_UNITS):
         raise InvalidMetricError(f"Metric unit is not valid: {unit}")
 
-    if storage_resolution is None or storage_resolution not in StorageResolution:
+    if type(storage_resolution) is not StorageResolution and (
+        not isinstance(storage_resolution, int) or storage_resolution not in VALID_STORAGE_RESOLUTIONS
+    ):
         raise InvalidMetricError(f"Metric storage resolution is not valid: {storage_resolution}")
 
-    if name in metric_name_and_resolution_map and metric_name_and_resolution_map.get(name) is not storage_resolution:
+
+def validate_metric_resolution_is_unchanged(name: str, storage_resolution: StorageResolution, metrics: Dict[str, Metric]) -> None:
+    metric = metrics.get(name)
+    if (
+        metric is not None
+        and metric.storage_resolution is not storage_resolution
+        and metric.storage_resolution is not as_storage_resolution(storage_resolution)
+    ):
         raise InvalidMetricError(
             f"Resolution for metrics {name} is already set. A single log event cannot have a metric with two different resolutions.")
 
@@ -114,7 +269,7 @@ def validate_namespace(namespace: str) -> None:
     if len(namespace) > constants.MAX_NAMESPACE_LENGTH:
         raise InvalidNamespaceError(f"Namespace cannot be longer than {constants.MAX_NAMESPACE_LENGTH} characters")
 
-    if not re.match(constants.VALID_NAMESPACE_REGEX, namespace):
+    if not VALID_NAMESPACE_PATTERN.match(namespace):
         raise InvalidNamespaceError(f"Namespace contains invalid characters: {namespace}")
 
 
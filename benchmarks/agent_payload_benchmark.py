@@ -0,0 +1,109 @@
+"""
+Benchmarks building the payload the agent sink writes to its socket on each
+flush, with every installed JSON encoder:
+
+    encode text     serialized events encoded to UTF-8 and newline-terminated one by one
+    to_bytes        LogSerializer.serialize_to_bytes, one payload per event
+    into buffer     LogSerializer.serialize_into, all events in one buffer
+
+and then writing it to a local stream socket one event at a time, from text
+events as before or from serialize_to_bytes as the agent sink does.
+
+Usage:
+    python benchmarks/agent_payload_benchmark.py [--repeat 5] [--number 200]
+"""
+import argparse
+import socket
+import threading
+import timeit
+
+from aws_embedded_metrics.config import get_config
+from aws_embedded_metrics.logger.metrics_context import MetricsContext
+from aws_embedded_metrics.serializers import json_encoder
+from aws_embedded_metrics.serializers.log_serializer import LogSerializer
+
+
+def create_context(metrics: int, datapoints: int) -> MetricsContext:
+    context = MetricsContext.empty()
+    context.put_dimensions({"Operation": "GetItem", "Region": "us-west-2"})
+    context.set_property("RequestId", "8a3f0c4e-2b1d-4e6f-9a7c-5d8e1f2a3b4c")
+    for index in range(metrics):
+        for i in range(datapoints):
+            context.put_metric(f"Metric-{index}", i * 1.5, "Milliseconds")
+    return context
+
+
+def encode_text(context: MetricsContext) -> int:
+    return sum(len(event.encode("utf-8") + b"\n") for event in LogSerializer.serialize_iter(context))
+
+
+def to_bytes(context: MetricsContext) -> int:
+    return sum(len(message) for message in LogSerializer.serialize_to_bytes(context))
+
+
+def into_buffer(context: MetricsContext) -> int:
+    buffer = bytearray()
+    LogSerializer.serialize_into(context, buffer)
+    return len(buffer)
+
+
+def send_text(context: MetricsContext, sock: socket.socket) -> None:
+    for event in LogSerializer.serialize_iter(context):
+        sock.sendall(event.encode("utf-8") + b"\n")
+
+
+def send_bytes(context: MetricsContext, sock: socket.socket) -> None:
+    for message in LogSerializer.serialize_to_bytes(context):
+        sock.sendall(message)
+
+
+def drain(sock: socket.socket) -> None:
+    while sock.recv(1 << 20):
+        pass
+
+
+WORKLOADS = {
+    "10 metrics x 1": (10, 1),
+    "400 metrics x 1": (400, 1),
+    "10 metrics x 1000": (10, 1000),
+}
+
+CASES = {
+    "encode text": encode_text,
+    "to_bytes": to_bytes,
+    "into buffer": into_buffer,
+}
+
+
+def run(repeat: int, number: int) -> None:
+    config = get_config()
+    previous_encoder = config.json_encoder
+    writer, reader = socket.socketpair()
+    threading.Thread(target=drain, args=(reader,), daemon=True).start()
+    sends = {"send text": send_text, "send bytes": send_bytes}
+    try:
+        for encoder in json_encoder.encoders:
+            config.json_encoder = encoder
+            print(f"encoder: {encoder}")
+            for workload, (metrics, datapoints) in WORKLOADS.items():
+                context = create_context(metrics, datapoints)
+                sizes = {name: fn(context) for name, fn in CASES.items()}
+                assert len(set(sizes.values())) == 1, sizes
+                print(f"  {workload} ({sizes['into buffer']} bytes)")
+                for name, fn in CASES.items():
+                    best = min(timeit.repeat(lambda: fn(context), repeat=repeat, number=number)) / number
+                    print(f"  {name:>14}: {best * 1e6:10.1f} us/op")
+                for name, send in sends.items():
+                    best = min(timeit.repeat(lambda: send(context, writer), repeat=repeat, number=number)) / number
+                    print(f"  {name:>14}: {best * 1e6:10.1f} us/op")
+    finally:
+        config.json_encoder = previous_encoder
+        writer.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+    run(args.repeat, args.number)
@@ -0,0 +1,120 @@
+"""
+Benchmarks MetricsAggregator.put_metric from 1, 4, 16 and 64 threads, with
+every thread sharing one lock and with each thread putting metrics into its
+own shard. A logger per thread is reported for reference, since that is the
+alternative to sharing an aggregator.
+
+Every thread puts the same number of values, so the throughput of each mode
+can be compared as the number of threads grows. The flush that merges the
+shards is timed separately.
+
+Usage:
+    python benchmarks/contention_benchmark.py [--values 20000]
+"""
+import argparse
+import threading
+import time
+from typing import Callable
+
+from aws_embedded_metrics.environment import Environment
+from aws_embedded_metrics.logger.metrics_aggregator import MetricsAggregator
+from aws_embedded_metrics.logger.metrics_context import MetricsContext
+from aws_embedded_metrics.sinks import Sink
+
+THREADS = [1, 4, 16, 64]
+DIMENSIONS = [{"Operation": f"Operation-{index}"} for index in range(4)]
+
+
+class NullSink(Sink):
+    def accept(self, context: MetricsContext) -> None:
+        pass
+
+    @staticmethod
+    def name() -> str:
+        return "NullSink"
+
+
+class NullEnvironment(Environment):
+    def __init__(self) -> None:
+        self.sink = NullSink()
+
+    async def probe(self) -> bool:
+        return True
+
+    def get_name(self) -> str:
+        return "Benchmark"
+
+    def get_type(self) -> str:
+        return "Benchmark"
+
+    def get_log_group_name(self) -> str:
+        return "Benchmark-metrics"
+
+    def configure_context(self, context: MetricsContext) -> None:
+        pass
+
+    def get_sink(self) -> Sink:
+        return self.sink
+
+
+environment = NullEnvironment()
+
+
+async def resolve_environment() -> Environment:
+    return environment
+
+
+def run_threads(threads: int, work: Callable[[], None]) -> float:
+    """Runs work on each thread, starting them together, and returns the elapsed seconds."""
+    barrier = threading.Barrier(threads + 1)
+
+    def run() -> None:
+        barrier.wait()
+        work()
+
+    workers = [threading.Thread(target=run) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start
+
+
+def bench_aggregator(threads: int, values: int, shard_by_thread: bool) -> None:
+    aggregator = MetricsAggregator(resolve_environment, shard_by_thread=shard_by_thread)
+
+    def work() -> None:
+        for i in range(values):
+            aggregator.put_metric("Latency", i, "Milliseconds", dimensions=DIMENSIONS[i % len(DIMENSIONS)])
+
+    elapsed = run_threads(threads, work)
+    start = time.perf_counter()
+    aggregator.flush()
+    flush = time.perf_counter() - start
+    report("sharded" if shard_by_thread else "locked", threads, values, elapsed, flush)
+
+
+def bench_context_per_thread(threads: int, values: int) -> None:
+    def work() -> None:
+        context = MetricsContext.empty()
+        for i in range(values):
+            context.put_metric("Latency", i, "Milliseconds")
+
+    report("context per thread", threads, values, run_threads(threads, work), None)
+
+
+def report(mode: str, threads: int, values: int, elapsed: float, flush: float = None) -> None:
+    flush_text = f"{flush * 1e3:8.2f} ms flush" if flush is not None else ""
+    print(f"{mode:>18} {threads:3d} threads: {threads * values / elapsed:12,.0f} values/s {flush_text}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--values", type=int, default=20000, help="values put by each thread")
+    args = parser.parse_args()
+    for threads in THREADS:
+        bench_aggregator(threads, args.values, shard_by_thread=False)
+        bench_aggregator(threads, args.values, shard_by_thread=True)
+        bench_context_per_thread(threads, args.values)
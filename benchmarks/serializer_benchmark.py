@@ -0,0 +1,154 @@
+"""
+Benchmarks LogSerializer.serialize on a skewed workload: a single metric with
+many datapoints recorded next to many single-value metrics.
+
+The loop that previous releases used to lay out events, which rescans every
+metric on each pass over the datapoints, is timed alongside as a reference.
+
+Usage:
+    python benchmarks/serializer_benchmark.py [--datapoints 10000] [--metrics 99]
+"""
+import argparse
+import json
+import timeit
+from typing import Any, Dict, Iterator, List
+
+from aws_embedded_metrics.config import get_config
+from aws_embedded_metrics.constants import MAX_DATAPOINTS_PER_METRIC, MAX_METRICS_PER_EVENT
+from aws_embedded_metrics.logger.metric import Metric
+from aws_embedded_metrics.logger.metrics_context import MetricsContext
+from aws_embedded_metrics.serializers.log_serializer import LogSerializer, MetricSlice, plan_batches
+from aws_embedded_metrics.storage_resolution import StorageResolution
+
+
+def create_skewed_context(datapoints: int, metrics: int) -> MetricsContext:
+    context = MetricsContext.empty()
+    for i in range(datapoints):
+        context.put_metric("Skewed", i)
+    for index in range(metrics):
+        context.put_metric(f"Metric-{index}", index)
+    return context
+
+
+def rescan_plan_batches(metrics: Dict[str, Metric]) -> Iterator[List[MetricSlice]]:
+    """The batch layout of previous releases, which visits every metric on each pass."""
+    batch: List[MetricSlice] = []
+    has_emitted_batches = False
+    num_slices_in_batch = 0
+    remaining_data = True
+    i = 0
+    complete_metrics = set()
+    while remaining_data:
+        remaining_data = False
+        start_index = i * MAX_DATAPOINTS_PER_METRIC
+        end_index = (i + 1) * MAX_DATAPOINTS_PER_METRIC
+        for metric_name, metric in metrics.items():
+            if metric_name in complete_metrics:
+                continue
+            batch.append(MetricSlice(metric_name, metric, start_index, end_index))
+            if len(metric.values) > end_index:
+                remaining_data = True
+            else:
+                complete_metrics.add(metric_name)
+
+            num_slices_in_batch += 1
+            if num_slices_in_batch == MAX_METRICS_PER_EVENT:
+                yield batch
+                has_emitted_batches = True
+                batch = []
+                num_slices_in_batch = 0
+
+        i += 1
+        if not has_emitted_batches or num_slices_in_batch > 0:
+            yield batch
+            has_emitted_batches = True
+            batch = []
+
+
+def rescan_serialize(context: MetricsContext) -> List[str]:
+    """LogSerializer.serialize as of previous releases, building and encoding each event body in full."""
+    config = get_config()
+    dimension_keys = []
+    dimensions_properties: Dict[str, str] = {}
+    for dimension_set in context.get_dimensions():
+        dimension_keys.append(list(dimension_set.keys()))
+        dimensions_properties = {**dimensions_properties, **dimension_set}
+
+    def create_body() -> Dict[str, Any]:
+        body: Dict[str, Any] = {**dimensions_properties, **context.properties}
+        if not config.disable_metric_extraction:
+            body["_aws"] = {
+                **context.meta,
+                "CloudWatchMetrics": [{"Dimensions": dimension_keys, "Metrics": [], "Namespace": context.namespace}],
+            }
+        return body
+
+    event_batches: List[str] = []
+    num_metrics_in_current_body = 0
+    remaining_data = True
+    i = 0
+    complete_metrics = set()
+    while remaining_data:
+        remaining_data = False
+        current_body = create_body()
+        for metric_name, metric in context.metrics.items():
+            if metric_name in complete_metrics:
+                continue
+            if len(metric.values) == 1:
+                current_body[metric_name] = metric.values[0]
+                complete_metrics.add(metric_name)
+            else:
+                start_index = i * MAX_DATAPOINTS_PER_METRIC
+                end_index = (i + 1) * MAX_DATAPOINTS_PER_METRIC
+                current_body[metric_name] = metric.values[start_index:end_index].tolist()
+                if len(metric.values) > end_index:
+                    remaining_data = True
+                else:
+                    complete_metrics.add(metric_name)
+
+            metric_body = {"Name": metric_name, "Unit": metric.unit}
+            if metric.storage_resolution == StorageResolution.HIGH:
+                metric_body["StorageResolution"] = metric.storage_resolution.value
+            if not config.disable_metric_extraction:
+                current_body["_aws"]["CloudWatchMetrics"][0]["Metrics"].append(metric_body)
+            num_metrics_in_current_body += 1
+
+            if num_metrics_in_current_body == MAX_METRICS_PER_EVENT:
+                event_batches.append(json.dumps(current_body))
+                current_body = create_body()
+                num_metrics_in_current_body = 0
+
+        i += 1
+        if not event_batches or num_metrics_in_current_body > 0:
+            event_batches.append(json.dumps(current_body))
+
+    return event_batches
+
+
+def run(datapoints: int, metrics: int, repeat: int, number: int) -> None:
+    context = create_skewed_context(datapoints, metrics)
+    assert list(rescan_plan_batches(context.metrics)) == list(plan_batches(context.metrics))
+    assert [json.loads(event) for event in rescan_serialize(context)] == [
+        json.loads(event) for event in LogSerializer.serialize(context)
+    ]
+    cases = {
+        "rescan plan": lambda: list(rescan_plan_batches(context.metrics)),
+        "plan_batches": lambda: list(plan_batches(context.metrics)),
+        "rescan serialize": lambda: rescan_serialize(context),
+        "serialize": lambda: LogSerializer.serialize(context),
+    }
+
+    print(f"skewed workload: 1 metric x {datapoints} datapoints + {metrics} single-value metrics")
+    for name, fn in cases.items():
+        best = min(timeit.repeat(fn, repeat=repeat, number=number)) / number
+        print(f"{name:>16}: {best * 1e6:10.1f} us/op")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--datapoints", type=int, default=10000)
+    parser.add_argument("--metrics", type=int, default=99)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+    run(args.datapoints, args.metrics, args.repeat, args.number)
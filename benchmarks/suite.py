@@ -0,0 +1,314 @@
+"""
+Benchmark suite for the serialization and flush paths.
+
+Each benchmark is run against a baseline workload and then swept along one
+parameter at a time: metric count, datapoints per metric, dimension-set count
+and property size. Results are written as JSON so runs of different releases
+can be compared. Benchmarks of APIs the installed release does not have
+are skipped, so the suite also runs against older releases.
+
+Usage:
+    python benchmarks/suite.py --output results.json
+    python benchmarks/suite.py --quick --filter serialize
+    python benchmarks/suite.py --compare baseline.json --output results.json
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from aws_embedded_metrics.config import get_config
+from aws_embedded_metrics.environment import Environment
+from aws_embedded_metrics.environment.environment_detector import EnvironmentCache
+from aws_embedded_metrics.logger.metrics_context import MetricsContext
+from aws_embedded_metrics.logger.metrics_logger import MetricsLogger
+from aws_embedded_metrics.serializers import Serializer
+from aws_embedded_metrics.serializers.log_serializer import LogSerializer
+from aws_embedded_metrics.sinks import Sink
+
+# optional APIs, missing from older releases
+try:
+    from aws_embedded_metrics.logger.metric_registry import MetricRegistry
+except ImportError:
+    MetricRegistry = None  # type: ignore
+
+try:
+    from aws_embedded_metrics.serializers.json_encoder import get_json_encoder
+except ImportError:
+    get_json_encoder = None  # type: ignore
+
+BASELINE = {"metrics": 10, "datapoints": 1, "dimension_sets": 1, "property_size": 0}
+SWEEPS = {
+    "metrics": [1, 10, 100, 1000],
+    "datapoints": [1, 10, 100, 1000],
+    "dimension_sets": [0, 1, 10, 30],
+    "property_size": [0, 1024, 16 * 1024, 64 * 1024],
+}
+QUICK_SWEEPS = {name: values[:3] for name, values in SWEEPS.items()}
+
+
+class StubSink(Sink):
+    """Serializes events like AgentSink but drops them instead of writing to a socket."""
+
+    def __init__(self, serializer: Serializer = LogSerializer()):
+        self.serializer = serializer
+        self.bytes_written = 0
+
+    def accept(self, context: MetricsContext) -> None:
+        for event in self.serializer.serialize(context):
+            self.bytes_written += len((event + "\n").encode("utf-8"))
+
+    @staticmethod
+    def name() -> str:
+        return "StubSink"
+
+
+class StubEnvironment(Environment):
+    def __init__(self) -> None:
+        self.sink = StubSink()
+
+    async def probe(self) -> bool:
+        return True
+
+    def get_name(self) -> str:
+        return "Benchmark"
+
+    def get_type(self) -> str:
+        return "Benchmark"
+
+    def get_log_group_name(self) -> str:
+        return "Benchmark-metrics"
+
+    def configure_context(self, context: MetricsContext) -> None:
+        pass
+
+    def get_sink(self) -> Sink:
+        return self.sink
+
+
+def create_context(metrics: int, datapoints: int, dimension_sets: int, property_size: int) -> MetricsContext:
+    context = MetricsContext.empty()
+    context.set_default_dimensions({"LogGroup": "Benchmark-metrics", "ServiceName": "Benchmark", "ServiceType": "Benchmark"})
+    put_dimension_sets(context, dimension_sets)
+    if property_size:
+        context.set_property("Payload", "x" * property_size)
+    put_metrics(context, metrics, datapoints)
+    return context
+
+
+def put_metrics(context: MetricsContext, metrics: int, datapoints: int) -> None:
+    for index in range(metrics):
+        key = f"Metric-{index}"
+        for i in range(datapoints):
+            context.put_metric(key, i, "Milliseconds")
+
+
+def put_dimension_sets(context: MetricsContext, dimension_sets: int) -> None:
+    for index in range(dimension_sets):
+        context.put_dimensions({"Operation": f"Operation-{index}", f"Dimension-{index}": "Value"})
+
+
+def measure(run: Callable[[], Any], setup: Callable[[], Any] = None, operations: int = 1,
+            repeat: int = 7, min_time: float = 0.05) -> Dict[str, Any]:
+    """
+    Times run() after calling setup(), which is excluded from the timing.
+    Each sample loops until min_time has elapsed and the per-operation time
+    of every sample is reported, along with the best and median.
+    """
+    samples = []
+    for _ in range(repeat):
+        elapsed = 0.0
+        loops = 0
+        while elapsed < min_time:
+            if setup is not None:
+                setup()
+            start = time.perf_counter()
+            run()
+            elapsed += time.perf_counter() - start
+            loops += 1
+        samples.append(elapsed / (loops * operations))
+
+    return {
+        "best_us": min(samples) * 1e6,
+        "median_us": statistics.median(samples) * 1e6,
+        "samples_us": [sample * 1e6 for sample in samples],
+        "operations": operations,
+    }
+
+
+def bench_serialize(params: Dict[str, int]) -> Dict[str, Any]:
+    context = create_context(**params)
+    result = measure(lambda: LogSerializer.serialize(context))
+    result["events"] = len(LogSerializer.serialize(context))
+    result["bytes"] = sum(len((event + "\n").encode("utf-8")) for event in LogSerializer.serialize(context))
+    return result
+
+
+def bench_put_metric(params: Dict[str, int]) -> Dict[str, Any]:
+    holder: Dict[str, MetricsContext] = {}
+
+    def setup() -> None:
+        holder["context"] = MetricsContext.empty()
+
+    def run() -> None:
+        put_metrics(holder["context"], params["metrics"], params["datapoints"])
+
+    return measure(run, setup, operations=params["metrics"] * params["datapoints"])
+
+
+def bench_put_metrics(params: Dict[str, int]) -> Optional[Dict[str, Any]]:
+    if not hasattr(MetricsContext, "put_metrics"):
+        return None
+
+    holder: Dict[str, MetricsContext] = {}
+    batch = {f"Metric-{index}": float(index) for index in range(params["metrics"])}
+
+    def setup() -> None:
+        holder["context"] = MetricsContext.empty()
+
+    def run() -> None:
+        context = holder["context"]
+        for _ in range(params["datapoints"]):
+            context.put_metrics(batch, "Milliseconds")
+
+    return measure(run, setup, operations=params["metrics"] * params["datapoints"])
+
+
+def bench_record(params: Dict[str, int]) -> Optional[Dict[str, Any]]:
+    if MetricRegistry is None:
+        return None
+
+    holder: Dict[str, MetricsContext] = {}
+    registry = MetricRegistry()
+    handles = [registry.declare(f"Metric-{index}", "Milliseconds") for index in range(params["metrics"])]
+
+    def setup() -> None:
+        holder["context"] = MetricsContext.empty()
+
+    def run() -> None:
+        context = holder["context"]
+        for handle in handles:
+            for i in range(params["datapoints"]):
+                context.record(handle, i)
+
+    return measure(run, setup, operations=params["metrics"] * params["datapoints"])
+
+
+def bench_put_dimensions(params: Dict[str, int]) -> Optional[Dict[str, Any]]:
+    if not params["dimension_sets"]:
+        return None
+
+    holder: Dict[str, MetricsContext] = {}
+
+    def setup() -> None:
+        holder["context"] = MetricsContext.empty()
+
+    def run() -> None:
+        put_dimension_sets(holder["context"], params["dimension_sets"])
+
+    return measure(run, setup, operations=params["dimension_sets"])
+
+
+def bench_flush_sync(params: Dict[str, int]) -> Dict[str, Any]:
+    environment = StubEnvironment()
+
+    async def resolve_environment() -> Environment:
+        return environment
+
+    # flush_sync resolves through the process-wide cache once it is populated,
+    # which is the steady state of a long-running application
+    EnvironmentCache.environment = environment
+    logger = MetricsLogger(resolve_environment)
+
+    def setup() -> None:
+        logger.context = create_context(**params)
+
+    try:
+        return measure(logger.flush_sync, setup)
+    finally:
+        EnvironmentCache.environment = None
+
+
+# benchmark name -> (function, parameters that affect it)
+BENCHMARKS: Dict[str, Tuple[Callable[[Dict[str, int]], Optional[Dict[str, Any]]], List[str]]] = {
+    "serialize": (bench_serialize, list(SWEEPS)),
+    "put_metric": (bench_put_metric, ["metrics", "datapoints"]),
+    "put_metrics": (bench_put_metrics, ["metrics", "datapoints"]),
+    "record": (bench_record, ["metrics", "datapoints"]),
+    "put_dimensions": (bench_put_dimensions, ["dimension_sets"]),
+    "flush_sync": (bench_flush_sync, list(SWEEPS)),
+}
+
+
+def iter_cases(sweeps: Dict[str, List[int]], swept_params: List[str]) -> Iterator[Dict[str, int]]:
+    """Yields the baseline followed by each sweep, without repeating the baseline."""
+    yield dict(BASELINE)
+    for name in swept_params:
+        for value in sweeps[name]:
+            if value != BASELINE[name]:
+                yield {**BASELINE, name: value}
+
+
+def case_id(benchmark: str, params: Dict[str, int]) -> str:
+    return benchmark + "[" + ",".join(f"{name}={value}" for name, value in params.items()) + "]"
+
+
+def run_suite(sweeps: Dict[str, List[int]], name_filter: Optional[str]) -> Dict[str, Any]:
+    results = []
+    for benchmark, (fn, swept_params) in BENCHMARKS.items():
+        if name_filter and name_filter not in benchmark:
+            continue
+        for params in iter_cases(sweeps, swept_params):
+            result = fn(params)
+            if result is None:
+                continue
+            result = {"id": case_id(benchmark, params), "benchmark": benchmark, "params": params, **result}
+            results.append(result)
+            print(f"{result['id']:<90} {result['best_us']:12.2f} us/op", file=sys.stderr)
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        # releases without an encoder registry always use the standard library
+        "json_encoder": get_json_encoder(get_config().json_encoder).name() if get_json_encoder else "json",
+        "results": results,
+    }
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any]) -> None:
+    baseline_results = {result["id"]: result for result in baseline["results"]}
+    for result in current["results"]:
+        previous = baseline_results.get(result["id"])
+        if previous is None:
+            continue
+        ratio = result["best_us"] / previous["best_us"]
+        print(f"{result['id']:<90} {previous['best_us']:12.2f} -> {result['best_us']:12.2f} us/op ({ratio:.2f}x)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", help="file to write the JSON results to, defaults to stdout")
+    parser.add_argument("--filter", help="only run benchmarks whose name contains this string")
+    parser.add_argument("--quick", action="store_true", help="skip the largest value of each sweep")
+    parser.add_argument("--compare", help="JSON results of a previous run to compare against")
+    args = parser.parse_args()
+
+    report = run_suite(QUICK_SWEEPS if args.quick else SWEEPS, args.filter)
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(json.load(f), report)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    elif not args.compare:
+        json.dump(report, sys.stdout, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Benchmarks the validator functions called on every put_metric, put_dimensions
+and set_namespace, next to the cost of storing a value for reference.
+
+Dimension sets and metric names are validated on first use and then served
+from a cache, so both the cached and the uncached cost are reported.
+
+Usage:
+    python benchmarks/validator_benchmark.py [--number 100000]
+"""
+import argparse
+import timeit
+
+from aws_embedded_metrics import validator
+from aws_embedded_metrics.logger.metric import Metric
+from aws_embedded_metrics.storage_resolution import StorageResolution
+
+DIMENSION_SET = {"Region": "us-east-1", "Service": "Api", "Operation": "GetItem"}
+
+
+def run(repeat: int, number: int) -> None:
+    metric = Metric(1.0, "Milliseconds")
+    metrics = {"Latency": metric}
+    dimensions = tuple(DIMENSION_SET.items())
+    cases = {
+        "store value": lambda: metric.add_value(1.0),
+        "validate_metric": lambda: validator.validate_metric(
+            "Latency", 1.0, "Milliseconds", StorageResolution.STANDARD, metrics),
+        "validate_metric_name_string uncached": lambda: validator.validate_metric_name_string.__wrapped__("Latency"),
+        "validate_metric_unit_and_resolution": lambda: validator.validate_metric_unit_and_resolution(
+            "Milliseconds", StorageResolution.STANDARD),
+        "validate_dimension_set": lambda: validator.validate_dimension_set(DIMENSION_SET),
+        "validate_dimensions uncached": lambda: validator.validate_dimensions.__wrapped__(dimensions),
+        "validate_namespace": lambda: validator.validate_namespace("aws-embedded-metrics"),
+    }
+
+    for name, fn in cases.items():
+        best = min(timeit.repeat(fn, repeat=repeat, number=number)) / number
+        print(f"{name:>36}: {best * 1e9:8.0f} ns/op")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=100000)
+    args = parser.parse_args()
+    run(args.repeat, args.number)
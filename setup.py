@@ -27,6 +27,7 @@ setup(
     },
     include_package_data=True,
     install_requires=["aiohttp"],
+    extras_require={"orjson": ["orjson"]},
     test_suite="tests",
     python_requires=">=3.6"
 )
@@ -1,4 +1,5 @@
 from aws_embedded_metrics import config
+from aws_embedded_metrics.validation_mode import ValidationMode
 from faker import Faker
 from importlib import reload
 
@@ -25,6 +26,12 @@ def test_can_get_config_from_environment(monkeypatch):
     namespace = fake.word()
     disable_metric_extraction = True
     environment_override = fake.word()
+    json_encoder = fake.word()
+    max_event_size = fake.pyint(min_value=1)
+    compress_values = True
+    validation_mode = ValidationMode.LENIENT
+    aggregation_flush_interval = fake.pyint(min_value=1)
+    aggregation_socket = fake.file_path()
 
     monkeypatch.setenv("AWS_EMF_ENABLE_DEBUG_LOGGING", str(debug_enabled))
     monkeypatch.setenv("AWS_EMF_SERVICE_NAME", service_name)
@@ -36,6 +43,12 @@ def test_can_get_config_from_environment(monkeypatch):
     monkeypatch.setenv("AWS_EMF_NAMESPACE", namespace)
     monkeypatch.setenv("AWS_EMF_DISABLE_METRIC_EXTRACTION", str(disable_metric_extraction))
     monkeypatch.setenv("AWS_EMF_ENVIRONMENT", environment_override)
+    monkeypatch.setenv("AWS_EMF_JSON_ENCODER", json_encoder)
+    monkeypatch.setenv("AWS_EMF_MAX_EVENT_SIZE", str(max_event_size))
+    monkeypatch.setenv("AWS_EMF_COMPRESS_VALUES", str(compress_values))
+    monkeypatch.setenv("AWS_EMF_VALIDATION", "Lenient")
+    monkeypatch.setenv("AWS_EMF_AGGREGATION_FLUSH_INTERVAL", str(aggregation_flush_interval))
+    monkeypatch.setenv("AWS_EMF_AGGREGATION_SOCKET", aggregation_socket)
 
     # act
     result = get_config()
@@ -51,6 +64,12 @@ def test_can_get_config_from_environment(monkeypatch):
     assert result.namespace == namespace
     assert result.disable_metric_extraction == disable_metric_extraction
     assert result.environment == environment_override
+    assert result.json_encoder == json_encoder
+    assert result.max_event_size == max_event_size
+    assert result.compress_values == compress_values
+    assert result.validation_mode == validation_mode
+    assert result.aggregation_flush_interval == aggregation_flush_interval
+    assert result.aggregation_socket == aggregation_socket
 
 
 def test_can_override_config(monkeypatch):
@@ -65,6 +84,10 @@ def test_can_override_config(monkeypatch):
     monkeypatch.setenv("AWS_EMF_NAMESPACE", fake.word())
     monkeypatch.setenv("AWS_EMF_DISABLE_METRIC_EXTRACTION", str(True))
     monkeypatch.setenv("AWS_EMF_ENVIRONMENT", fake.word())
+    monkeypatch.setenv("AWS_EMF_JSON_ENCODER", fake.word())
+    monkeypatch.setenv("AWS_EMF_MAX_EVENT_SIZE", str(fake.pyint(min_value=1)))
+    monkeypatch.setenv("AWS_EMF_COMPRESS_VALUES", str(True))
+    monkeypatch.setenv("AWS_EMF_VALIDATION", "lenient")
 
     config = get_config()
 
@@ -78,6 +101,10 @@ def test_can_override_config(monkeypatch):
     namespace = fake.word()
     disable_metric_extraction = False
     environment = fake.word()
+    json_encoder = fake.word()
+    max_event_size = fake.pyint(min_value=1)
+    compress_values = False
+    validation_mode = ValidationMode.OFF
 
     # act
     config.debug_logging_enabled = debug_enabled
@@ -90,6 +117,10 @@ def test_can_override_config(monkeypatch):
     config.namespace = namespace
     config.disable_metric_extraction = disable_metric_extraction
     config.environment = environment
+    config.json_encoder = json_encoder
+    config.max_event_size = max_event_size
+    config.compress_values = compress_values
+    config.validation_mode = validation_mode
 
     # assert
     assert config.debug_logging_enabled == debug_enabled
@@ -102,3 +133,40 @@ def test_can_override_config(monkeypatch):
     assert config.namespace == namespace
     assert config.disable_metric_extraction == disable_metric_extraction
     assert config.environment == environment
+    assert config.json_encoder == json_encoder
+    assert config.max_event_size == max_event_size
+    assert config.compress_values == compress_values
+    assert config.validation_mode == validation_mode
+
+
+def test_max_event_size_defaults_to_cloudwatch_logs_limit(monkeypatch):
+    # arrange
+    monkeypatch.setenv("AWS_EMF_MAX_EVENT_SIZE", "not a number")
+
+    # act
+    result = get_config()
+
+    # assert
+    assert result.max_event_size == 256 * 1024
+
+
+def test_aggregation_flush_interval_defaults_to_one_minute(monkeypatch):
+    # arrange
+    monkeypatch.delenv("AWS_EMF_AGGREGATION_FLUSH_INTERVAL", raising=False)
+
+    # act
+    result = get_config()
+
+    # assert
+    assert result.aggregation_flush_interval == 60
+
+
+def test_validation_mode_defaults_to_strict(monkeypatch):
+    # arrange
+    monkeypatch.setenv("AWS_EMF_VALIDATION", fake.word())
+
+    # act
+    result = get_config()
+
+    # assert
+    assert result.validation_mode == ValidationMode.STRICT
@@ -0,0 +1,200 @@
+from aws_embedded_metrics.environment import Environment
+from aws_embedded_metrics.logger.flush_scheduler import AsyncFlushScheduler, ThreadFlushScheduler
+from aws_embedded_metrics.logger.metrics_logger import MetricsLogger
+from aws_embedded_metrics.sinks import Sink
+import asyncio
+import pytest
+import threading
+
+
+def test_scheduler_logger_uses_context_of_given_logger(mocker):
+    # arrange
+    logger, sink = get_logger_and_sink(mocker)
+    logger.flush_preserve_dimensions = True
+
+    # act
+    scheduler = ThreadFlushScheduler(logger)
+
+    # assert
+    assert scheduler.logger.context is logger.context
+    assert scheduler.logger.flush_preserve_dimensions
+
+
+def test_thread_scheduler_flushes_on_interval(mocker):
+    # arrange
+    logger, sink = get_logger_and_sink(mocker)
+    scheduler = ThreadFlushScheduler(logger, interval=0.01)
+    flushed = threading.Event()
+    sink.accept.side_effect = lambda context: flushed.set()
+
+    # act
+    scheduler.logger.put_metric("Latency", 1)
+    scheduler.start()
+
+    # assert
+    assert flushed.wait(5)
+    scheduler.stop()
+
+
+def test_thread_scheduler_flushes_when_datapoints_cross_threshold(mocker):
+    # arrange
+    logger, sink = get_logger_and_sink(mocker)
+    scheduler = ThreadFlushScheduler(logger, interval=3600, max_datapoints=10).start()
+    flushed = threading.Event()
+    sink.accept.side_effect = lambda context: flushed.set()
+
+    # act
+    scheduler.logger.put_metrics({"Latency": 1, "Count": 1})
+    scheduler.logger.put_metric_values("Latency", iter(range(7)))
+    assert not flushed.is_set()
+    scheduler.logger.put_metric("Latency", 1)
+
+    # assert
+    assert flushed.wait(5)
+    scheduler.stop()
+    assert scheduler.logger.datapoints == 0
+
+
+def test_thread_scheduler_keeps_every_value_put_while_flushing(mocker):
+    # arrange
+    logger, sink = get_logger_and_sink(mocker)
+    scheduler = ThreadFlushScheduler(logger, interval=0.001, max_datapoints=50).start()
+    threads = 4
+    values_per_thread = 1000
+
+    def put_metrics():
+        for i in range(values_per_thread):
+            scheduler.logger.put_metric("Count", 1)
+
+    # act
+    workers = [threading.Thread(target=put_metrics) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    scheduler.stop()
+
+    # assert
+    contexts = [call[0][0] for call in sink.accept.call_args_list]
+    assert len(contexts) > 1
+    assert sum(len(context.metrics["Count"].values) for context in contexts) == threads * values_per_thread
+
+
+def test_thread_scheduler_does_not_block_logger_while_sink_accepts(mocker):
+    # arrange
+    logger, sink = get_logger_and_sink(mocker)
+    accepting = threading.Event()
+    release = threading.Event()
+
+    def accept(context):
+        accepting.set()
+        release.wait(5)
+
+    sink.accept.side_effect = accept
+    scheduler = ThreadFlushScheduler(logger, interval=3600, max_datapoints=1).start()
+    scheduler.logger.put_metric("Latency", 1)
+    assert accepting.wait(5)
+
+    # act
+    putter = threading.Thread(target=scheduler.logger.put_metric, args=("Latency", 2))
+    putter.start()
+    putter.join(1)
+    blocked = putter.is_alive()
+    release.set()
+    scheduler.stop()
+
+    # assert
+    assert not blocked
+    contexts = [call[0][0] for call in sink.accept.call_args_list]
+    assert [context.metrics["Latency"].values.tolist() for context in contexts] == [[1], [2]]
+
+
+def test_thread_scheduler_stop_flushes_remaining_metrics(mocker):
+    # arrange
+    logger, sink = get_logger_and_sink(mocker)
+    scheduler = ThreadFlushScheduler(logger, interval=3600).start()
+    scheduler.logger.put_metric("Latency", 1)
+
+    # act
+    scheduler.stop()
+
+    # assert
+    sink.accept.assert_called_once()
+    assert sink.accept.call_args[0][0].metrics["Latency"].values.tolist() == [1]
+
+
+def test_thread_scheduler_does_not_flush_without_metrics(mocker):
+    # arrange
+    logger, sink = get_logger_and_sink(mocker)
+    scheduler = ThreadFlushScheduler(logger, interval=3600).start()
+
+    # act
+    scheduler.stop()
+
+    # assert
+    sink.accept.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_scheduler_flushes_on_interval(mocker):
+    # arrange
+    logger, sink = get_logger_and_sink(mocker)
+    scheduler = AsyncFlushScheduler(logger, interval=0.01)
+
+    # act
+    scheduler.logger.put_metric("Latency", 1)
+    scheduler.start()
+    await wait_for_flush(sink)
+
+    # assert
+    sink.accept.assert_called_once()
+    await scheduler.stop()
+
+
+@pytest.mark.asyncio
+async def test_async_scheduler_flushes_when_datapoints_cross_threshold(mocker):
+    # arrange
+    logger, sink = get_logger_and_sink(mocker)
+    scheduler = AsyncFlushScheduler(logger, interval=3600, max_datapoints=2).start()
+
+    # act
+    scheduler.logger.put_metric("Latency", 1)
+    scheduler.logger.put_metric("Latency", 2)
+    await wait_for_flush(sink)
+
+    # assert
+    assert sink.accept.call_args[0][0].metrics["Latency"].values.tolist() == [1, 2]
+    await scheduler.stop()
+
+
+@pytest.mark.asyncio
+async def test_async_scheduler_stop_flushes_remaining_metrics(mocker):
+    # arrange
+    logger, sink = get_logger_and_sink(mocker)
+    scheduler = AsyncFlushScheduler(logger, interval=3600).start()
+    scheduler.logger.put_metric("Latency", 1)
+
+    # act
+    await scheduler.stop()
+
+    # assert
+    sink.accept.assert_called_once()
+
+
+def get_logger_and_sink(mocker):
+    env = mocker.create_autospec(spec=Environment)
+
+    async def env_provider():
+        return env
+
+    sink = mocker.create_autospec(spec=Sink)
+    env.get_sink.return_value = sink
+
+    return MetricsLogger(env_provider), sink
+
+
+async def wait_for_flush(sink, timeout=5):
+    for _ in range(int(timeout / 0.01)):
+        if sink.accept.called:
+            return
+        await asyncio.sleep(0.01)
@@ -0,0 +1,129 @@
+from aws_embedded_metrics.aggregation_type import AggregationType
+from aws_embedded_metrics.exceptions import InvalidMetricError
+from aws_embedded_metrics.logger.metric import StatisticSetMetric
+from aws_embedded_metrics.logger.metric_registry import MetricRegistry
+from aws_embedded_metrics.logger.metrics_logger import MetricsLogger
+from aws_embedded_metrics.storage_resolution import StorageResolution
+from faker import Faker
+import pytest
+
+fake = Faker()
+
+
+async def resolve_environment():
+    return None
+
+
+def test_declare_returns_handle_with_definition():
+    # arrange
+    registry = MetricRegistry()
+    name = fake.word()
+
+    # act
+    handle = registry.declare(name, "Milliseconds", StorageResolution.HIGH)
+
+    # assert
+    assert handle.name == name
+    assert handle.unit == "Milliseconds"
+    assert handle.storage_resolution == StorageResolution.HIGH
+    assert handle.aggregation_type is None
+
+
+def test_declare_same_definition_returns_same_handle():
+    # arrange
+    registry = MetricRegistry()
+
+    # act
+    first = registry.declare("Latency", "Milliseconds")
+    second = registry.declare("Latency", "Milliseconds")
+
+    # assert
+    assert first is second
+
+
+def test_declare_with_storage_resolution_value_returns_same_handle():
+    # arrange
+    registry = MetricRegistry()
+
+    # act
+    first = registry.declare("Latency", "Milliseconds", 1)
+    second = registry.declare("Latency", "Milliseconds", StorageResolution.HIGH)
+
+    # assert
+    assert first is second
+    assert first.storage_resolution is StorageResolution.HIGH
+
+
+@pytest.mark.parametrize(
+    "unit, storage_resolution",
+    [
+        ("Seconds", StorageResolution.STANDARD),
+        ("Milliseconds", StorageResolution.HIGH),
+    ],
+)
+def test_declare_conflicting_definition_raises_exception(unit, storage_resolution):
+    # arrange
+    registry = MetricRegistry()
+    registry.declare("Latency", "Milliseconds")
+
+    # act / assert
+    with pytest.raises(InvalidMetricError):
+        registry.declare("Latency", unit, storage_resolution)
+
+
+@pytest.mark.parametrize(
+    "name, unit, storage_resolution",
+    [
+        ("", "Seconds", StorageResolution.STANDARD),
+        ("Latency", "Fahrenheit", StorageResolution.STANDARD),
+        ("Latency", "Seconds", 30),
+    ],
+)
+def test_declare_invalid_metric_raises_exception(name, unit, storage_resolution):
+    # arrange
+    registry = MetricRegistry()
+
+    # act / assert
+    with pytest.raises(InvalidMetricError):
+        registry.declare(name, unit, storage_resolution)
+
+
+def test_handle_records_values_through_registry_logger():
+    # arrange
+    logger = MetricsLogger(resolve_environment)
+    registry = MetricRegistry(logger)
+    handle = registry.declare("Latency", "Milliseconds")
+
+    # act
+    handle.record(10)
+    handle.record(20)
+
+    # assert
+    metric = logger.context.metrics["Latency"]
+    assert metric.values.tolist() == [10, 20]
+    assert metric.unit == "Milliseconds"
+
+
+def test_handle_creates_statistic_set_for_declared_aggregation_type():
+    # arrange
+    logger = MetricsLogger(resolve_environment)
+    registry = MetricRegistry(logger)
+    handle = registry.declare("Latency", aggregation_type=AggregationType.STATISTIC_SET)
+
+    # act
+    handle.record(10)
+    handle.record(20)
+
+    # assert
+    metric = logger.context.metrics["Latency"]
+    assert isinstance(metric, StatisticSetMetric)
+    assert metric.get_statistic_set() == {"Max": 20, "Min": 10, "Count": 2, "Sum": 30}
+
+
+def test_handle_record_without_logger_raises_exception():
+    # arrange
+    handle = MetricRegistry().declare("Latency")
+
+    # act / assert
+    with pytest.raises(ValueError):
+        handle.record(1)
@@ -0,0 +1,234 @@
+from aws_embedded_metrics.aggregation_type import AggregationType
+from aws_embedded_metrics.environment import Environment
+from aws_embedded_metrics.exceptions import InvalidNamespaceError
+from aws_embedded_metrics.logger import metrics_aggregator
+from aws_embedded_metrics.logger.metric_registry import MetricRegistry
+from aws_embedded_metrics.logger.metrics_aggregator import MetricsAggregator, get_metrics_aggregator
+from aws_embedded_metrics.sinks import Sink
+from faker import Faker
+import pytest
+import threading
+
+fake = Faker()
+
+
+def test_put_metric_merges_values_by_dimension_set(mocker):
+    # arrange
+    aggregator, sink = get_aggregator_and_sink(mocker)
+    dimensions = {"Operation": "GetItem"}
+
+    # act
+    aggregator.put_metric("Latency", 1, "Milliseconds", dimensions=dimensions)
+    aggregator.put_metric("Latency", 2, "Milliseconds", dimensions=dict(dimensions))
+    aggregator.put_metric("Latency", 3, "Milliseconds", dimensions={"Operation": "PutItem"})
+    aggregator.put_metric("Latency", 4, "Milliseconds")
+    aggregator.flush()
+
+    # assert
+    contexts = get_flushed_contexts(sink)
+    assert [context.metrics["Latency"].values.tolist() for context in contexts] == [[1, 2], [3], [4]]
+    assert contexts[0].get_dimensions()[0]["Operation"] == "GetItem"
+    assert contexts[1].get_dimensions()[0]["Operation"] == "PutItem"
+    assert "Operation" not in contexts[2].get_dimensions()[0]
+
+
+def test_put_metric_merges_values_by_namespace(mocker):
+    # arrange
+    aggregator, sink = get_aggregator_and_sink(mocker)
+    namespace = fake.word()
+
+    # act
+    aggregator.put_metric("Latency", 1)
+    aggregator.put_metric("Latency", 2, namespace=namespace)
+    aggregator.flush()
+
+    # assert
+    contexts = get_flushed_contexts(sink)
+    assert len(contexts) == 2
+    assert contexts[1].namespace == namespace
+
+
+def test_put_metric_with_invalid_namespace_raises_exception(mocker):
+    # arrange
+    aggregator, sink = get_aggregator_and_sink(mocker)
+
+    # act / assert
+    with pytest.raises(InvalidNamespaceError):
+        aggregator.put_metric("Latency", 1, namespace="Invalid Namespace")
+
+
+def test_record_merges_values_of_handle(mocker):
+    # arrange
+    aggregator, sink = get_aggregator_and_sink(mocker)
+    handle = MetricRegistry().declare("Latency", "Milliseconds")
+
+    # act
+    aggregator.record(handle, 1)
+    aggregator.record(handle, 2)
+    aggregator.flush()
+
+    # assert
+    contexts = get_flushed_contexts(sink)
+    assert contexts[0].metrics["Latency"].values.tolist() == [1, 2]
+
+
+def test_flush_without_metrics_does_not_send_events(mocker):
+    # arrange
+    aggregator, sink = get_aggregator_and_sink(mocker)
+    aggregator.put_metric("Latency", 1)
+    aggregator.flush()
+    sink.accept.reset_mock()
+
+    # act
+    aggregator.flush()
+
+    # assert
+    sink.accept.assert_not_called()
+
+
+def test_put_metric_from_many_threads_keeps_every_value(mocker):
+    # arrange
+    aggregator, sink = get_aggregator_and_sink(mocker)
+    threads = 8
+    values_per_thread = 1000
+
+    def put_metrics():
+        for i in range(values_per_thread):
+            aggregator.put_metric("Count", 1)
+
+    # act
+    workers = [threading.Thread(target=put_metrics) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    aggregator.flush()
+
+    # assert
+    contexts = get_flushed_contexts(sink)
+    assert len(contexts[0].metrics["Count"].values) == threads * values_per_thread
+
+
+def test_sharded_aggregator_merges_values_of_every_thread(mocker):
+    # arrange
+    aggregator, sink = get_aggregator_and_sink(mocker, shard_by_thread=True)
+    threads = 8
+    values_per_thread = 1000
+
+    def put_metrics():
+        for i in range(values_per_thread):
+            aggregator.put_metric("Count", 1, dimensions={"Operation": "GetItem"})
+            aggregator.put_metric("Latency", i, aggregation_type=AggregationType.STATISTIC_SET)
+
+    # act
+    workers = [threading.Thread(target=put_metrics) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    aggregator.flush()
+
+    # assert
+    contexts = get_flushed_contexts(sink)
+    assert len(contexts) == 2
+    assert len(contexts[0].metrics["Count"].values) == threads * values_per_thread
+    assert contexts[1].metrics["Latency"].get_statistic_set() == {
+        "Max": values_per_thread - 1,
+        "Min": 0,
+        "Count": threads * values_per_thread,
+        "Sum": threads * sum(range(values_per_thread)),
+    }
+
+
+def test_sharded_aggregator_keeps_shard_of_running_thread_across_flushes(mocker):
+    # arrange
+    aggregator, sink = get_aggregator_and_sink(mocker, shard_by_thread=True)
+    aggregator.put_metric("Latency", 1)
+    aggregator.flush()
+    sink.accept.reset_mock()
+
+    # act
+    aggregator.put_metric("Latency", 2)
+    aggregator.flush()
+
+    # assert
+    contexts = get_flushed_contexts(sink)
+    assert contexts[0].metrics["Latency"].values.tolist() == [2]
+
+
+def test_started_aggregator_flushes_on_interval(mocker):
+    # arrange
+    aggregator, sink = get_aggregator_and_sink(mocker, flush_interval=0.01)
+    flushed = threading.Event()
+    sink.accept.side_effect = lambda context: flushed.set()
+
+    # act
+    aggregator.put_metric("Latency", 1)
+    aggregator.start()
+
+    # assert
+    assert flushed.wait(5)
+    aggregator.stop()
+
+
+def test_stop_flushes_remaining_metrics(mocker):
+    # arrange
+    aggregator, sink = get_aggregator_and_sink(mocker, flush_interval=3600)
+    aggregator.start()
+    aggregator.put_metric("Latency", 1)
+
+    # act
+    aggregator.stop()
+
+    # assert
+    contexts = get_flushed_contexts(sink)
+    assert contexts[0].metrics["Latency"].values.tolist() == [1]
+
+
+def test_reset_after_fork_drops_metrics_inherited_from_parent(mocker):
+    # arrange
+    aggregator, sink = get_aggregator_and_sink(mocker, flush_interval=3600)
+    aggregator.start()
+    aggregator.put_metric("Latency", 1)
+
+    # act
+    aggregator.reset_after_fork()
+    aggregator.put_metric("Latency", 2)
+    aggregator.stop()
+
+    # assert
+    contexts = get_flushed_contexts(sink)
+    assert [context.metrics["Latency"].values.tolist() for context in contexts] == [[2]]
+
+
+def test_get_metrics_aggregator_returns_started_process_wide_aggregator(mocker):
+    # arrange
+    mocker.patch.object(metrics_aggregator, "aggregator", None)
+    register = mocker.patch("atexit.register")
+
+    # act
+    aggregator = get_metrics_aggregator()
+
+    # assert
+    try:
+        assert get_metrics_aggregator() is aggregator
+        assert aggregator.shard_by_thread
+        register.assert_called_once_with(aggregator.stop)
+    finally:
+        aggregator.stop()
+
+
+def get_aggregator_and_sink(mocker, flush_interval=None, shard_by_thread=False):
+    env = mocker.create_autospec(spec=Environment)
+
+    async def env_provider():
+        return env
+
+    sink = mocker.create_autospec(spec=Sink)
+    env.get_sink.return_value = sink
+
+    return MetricsAggregator(env_provider, flush_interval, shard_by_thread=shard_by_thread), sink
+
+
+def get_flushed_contexts(sink):
+    return [call[0][0] for call in sink.accept.call_args_list]
@@ -1,14 +1,18 @@
+from array import array
 from faker import Faker
 from importlib import reload
 from datetime import datetime, timedelta
 import pytest
 import math
 import random
-from aws_embedded_metrics import constants, utils
+from aws_embedded_metrics import constants, utils, validator
 from aws_embedded_metrics.unit import Unit
 from aws_embedded_metrics.storage_resolution import StorageResolution
+from aws_embedded_metrics.aggregation_type import AggregationType
+from aws_embedded_metrics.validation_mode import ValidationMode
 from aws_embedded_metrics import config
 from aws_embedded_metrics.logger.metrics_context import MetricsContext
+from aws_embedded_metrics.logger.metric_registry import MetricRegistry
 from aws_embedded_metrics.constants import DEFAULT_NAMESPACE, MAX_TIMESTAMP_FUTURE_AGE, MAX_TIMESTAMP_PAST_AGE
 from aws_embedded_metrics.exceptions import DimensionSetExceededError, InvalidDimensionError, InvalidMetricError
 from aws_embedded_metrics.exceptions import InvalidTimestampError
@@ -61,6 +65,23 @@ def test_put_dimension_adds_to_dimensions():
     assert context.dimensions == [dimension_set]
 
 
+def test_dimensions_cannot_be_modified_in_place():
+    # arrange
+    context = MetricsContext()
+    dimension_set = {fake.word(): fake.word()}
+    context.put_dimensions(dimension_set)
+
+    # act
+    with pytest.raises(TypeError):
+        context.dimensions.append({fake.word(): fake.word()})
+    dimensions = list(context.dimensions)
+    dimensions.append({"Region": "us-east-1"})
+    context.dimensions = dimensions
+
+    # assert
+    assert context.dimensions == [dimension_set, {"Region": "us-east-1"}]
+
+
 def test_put_dimensions_accept_multiple_unique_dimensions():
     # arrange
     context = MetricsContext()
@@ -132,6 +153,36 @@ def test_put_dimensions_use_most_recent_dimension_value():
     assert context.get_dimensions()[2] == dimension6
 
 
+def test_put_dimensions_matches_dimension_sets_regardless_of_key_order():
+    # arrange
+    context = MetricsContext()
+    dimension1 = {"Region": "us-east-1", "Service": "Api"}
+    dimension2 = {"Tenant": "tenant-1"}
+    dimension3 = {"Service": "Worker", "Region": "us-west-2"}
+
+    # act
+    context.put_dimensions(dimension1)
+    context.put_dimensions(dimension2)
+    context.put_dimensions(dimension3)
+
+    # assert
+    assert context.dimensions == [dimension2, dimension3]
+
+
+def test_set_dimensions_keeps_latest_of_duplicate_dimension_sets():
+    # arrange
+    context = MetricsContext()
+    dimension1 = {"Region": "us-east-1"}
+    dimension2 = {"Tenant": "tenant-1"}
+    dimension3 = {"Region": "us-west-2"}
+
+    # act
+    context.set_dimensions([dimension1, dimension2, dimension3])
+
+    # assert
+    assert context.dimensions == [dimension2, dimension3]
+
+
 def test_put_dimensions_with_set_dimensions():
     # arrange
     context = MetricsContext()
@@ -162,6 +213,36 @@ def test_put_dimensions_with_set_dimensions():
     assert context.get_dimensions()[2] == dimension6
 
 
+def test_put_dimensions_validates_repeated_dimension_sets_once():
+    # arrange
+    validator.validate_dimensions.cache_clear()
+    context = MetricsContext()
+
+    # act
+    context.put_dimensions({"Region": "us-east-1", "Service": "Api"})
+    context.put_dimensions({"Service": "Api", "Region": "us-east-1"})
+
+    # assert
+    cache_info = validator.validate_dimensions.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 1
+
+
+def test_put_metric_validates_repeated_names_once():
+    # arrange
+    validator.validate_metric_name_string.cache_clear()
+    context = MetricsContext()
+
+    # act
+    for value in range(3):
+        context.put_metric("Latency", value)
+
+    # assert
+    cache_info = validator.validate_metric_name_string.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 2
+
+
 def test_get_dimensions_returns_only_custom_dimensions_if_no_default_dimensions_not_set():
     # arrange
     context = MetricsContext()
@@ -235,6 +316,54 @@ def test_get_dimensions_returns_merged_custom_and_default_dimensions():
     assert [expected_dimensions] == actual_dimensions
 
 
+def test_get_dimensions_is_cached_until_dimensions_change():
+    # arrange
+    context = MetricsContext()
+    context.set_default_dimensions({"ServiceName": "Api"})
+    context.put_dimensions({"Region": "us-east-1"})
+    dimensions = context.get_dimensions()
+
+    # act
+    context.set_default_dimensions({"ServiceName": "Api"})
+    unchanged_dimensions = context.get_dimensions()
+    context.put_dimensions({"Tenant": "tenant-1"})
+    changed_dimensions = context.get_dimensions()
+
+    # assert
+    assert unchanged_dimensions is dimensions
+    assert changed_dimensions == [
+        {"ServiceName": "Api", "Region": "us-east-1"},
+        {"ServiceName": "Api", "Tenant": "tenant-1"},
+    ]
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda context: context.put_dimensions({"Region": "us-west-2"}),
+        lambda context: context.set_dimensions([{"Region": "us-west-2"}]),
+        lambda context: context.reset_dimensions(False),
+        lambda context: context.set_default_dimensions({"ServiceName": "Worker"}),
+    ]
+)
+def test_get_dimension_properties_is_invalidated_by_dimension_changes(change):
+    # arrange
+    context = MetricsContext()
+    context.set_default_dimensions({"ServiceName": "Api"})
+    context.put_dimensions({"Region": "us-east-1"})
+    context.get_dimension_properties()
+
+    # act
+    change(context)
+
+    # assert
+    expected = {}
+    for dimension_set in context.get_dimensions():
+        expected.update(dimension_set)
+    assert context.get_dimension_properties() == expected
+    assert context.get_dimension_properties() is context.get_dimension_properties()
+
+
 @pytest.mark.parametrize(
     "name, value",
     [
@@ -248,6 +377,8 @@ def test_get_dimensions_returns_merged_custom_and_default_dimensions():
         ("dim", " "),
         ("dim", "a" * (constants.MAX_DIMENSION_VALUE_LENGTH + 1)),
         ("dim", "ṽɑɭʊɛ"),
+        ("dim", 5),
+        (5, "value"),
     ]
 )
 def test_add_invalid_dimensions_raises_exception(name, value):
@@ -274,8 +405,23 @@ def test_put_metric_adds_metrics():
     # assert
     metric = context.metrics[metric_key]
     assert metric.unit == metric_unit
-    assert metric.values == [metric_value]
-    assert metric.storage_resolution == metric_storage_resolution
+    assert metric.values.tolist() == [metric_value]
+    assert metric.storage_resolution is StorageResolution(metric_storage_resolution)
+
+
+def test_put_metric_with_storage_resolution_value_keeps_adding_to_metric():
+    # arrange
+    context = MetricsContext()
+
+    # act
+    context.put_metric("Latency", 1, "Milliseconds", 1)
+    context.put_metric("Latency", 2, "Milliseconds", 1)
+    context.put_metric_values("Latency", [3], "Milliseconds", StorageResolution.HIGH)
+
+    # assert
+    metric = context.metrics["Latency"]
+    assert metric.storage_resolution is StorageResolution.HIGH
+    assert metric.values.tolist() == [1, 2, 3]
 
 
 def test_put_metric_uses_none_unit_if_not_provided():
@@ -306,6 +452,248 @@ def test_put_metric_uses_standard_storage_resolution_if_not_provided():
     assert metric.storage_resolution == StorageResolution.STANDARD
 
 
+def test_put_metric_with_statistic_set_keeps_only_statistics():
+    # arrange
+    context = MetricsContext()
+    metric_key = fake.word()
+
+    # act
+    for value in [5, 1, 9, 3]:
+        context.put_metric(metric_key, value, "Milliseconds", aggregation_type=AggregationType.STATISTIC_SET)
+
+    # assert
+    metric = context.metrics[metric_key]
+    assert metric.values.tolist() == []
+    assert metric.unit == "Milliseconds"
+    assert metric.get_statistic_set() == {"Max": 9, "Min": 1, "Count": 4, "Sum": 18}
+
+
+def test_put_metric_uses_default_aggregation_type():
+    # arrange
+    context = MetricsContext()
+    context.set_default_aggregation_type(AggregationType.STATISTIC_SET)
+
+    # act
+    context.put_metric("Aggregated", 1)
+    context.put_metric("Listed", 1, aggregation_type=AggregationType.LIST)
+
+    # assert
+    assert context.metrics["Aggregated"].get_statistic_set()["Count"] == 1
+    assert context.metrics["Listed"].values.tolist() == [1]
+
+
+def test_put_metric_stores_values_as_doubles():
+    # arrange
+    context = MetricsContext()
+    metric_key = fake.word()
+
+    # act
+    context.put_metric(metric_key, 1)
+    context.put_metric(metric_key, 2.5)
+
+    # assert
+    metric = context.metrics[metric_key]
+    assert metric.values == array("d", [1, 2.5])
+    assert not hasattr(metric, "__dict__")
+
+
+def test_put_metric_values_with_different_storage_resolution_raises_exception():
+    # arrange
+    context = MetricsContext()
+    context.put_metric("metric", 1, storage_resolution=StorageResolution.HIGH)
+
+    # act
+    with pytest.raises(InvalidMetricError):
+        context.put_metric_values("metric", [2, 3], storage_resolution=StorageResolution.STANDARD)
+
+    # assert
+    assert context.metrics["metric"].values.tolist() == [1]
+
+
+def test_put_metrics_adds_metrics():
+    # arrange
+    context = MetricsContext()
+    context.put_metric("Existing", 1, "Milliseconds")
+
+    # act
+    context.put_metrics({"Existing": 2, "New": 3}, "Milliseconds", StorageResolution.STANDARD)
+
+    # assert
+    assert context.metrics["Existing"].values.tolist() == [1, 2]
+    assert context.metrics["New"].values.tolist() == [3]
+    assert context.metrics["New"].unit == "Milliseconds"
+    assert context.metrics["New"].storage_resolution == StorageResolution.STANDARD
+
+
+def test_put_metrics_with_statistic_set():
+    # arrange
+    context = MetricsContext()
+
+    # act
+    context.put_metrics({"A": 5, "B": 1}, aggregation_type=AggregationType.STATISTIC_SET)
+    context.put_metrics({"A": 9})
+
+    # assert
+    assert context.metrics["A"].get_statistic_set() == {"Max": 9, "Min": 5, "Count": 2, "Sum": 14}
+    assert context.metrics["B"].get_statistic_set() == {"Max": 1, "Min": 1, "Count": 1, "Sum": 1}
+
+
+@pytest.mark.parametrize(
+    "metrics, unit, storage_resolution",
+    [
+        ({"valid": 1, "": 1}, "None", StorageResolution.STANDARD),
+        ({"valid": 1, "a" * (constants.MAX_METRIC_NAME_LENGTH + 1): 1}, "None", StorageResolution.STANDARD),
+        ({"valid": 1, "invalid": math.nan}, "None", StorageResolution.STANDARD),
+        ({"valid": 1, "invalid": math.inf}, "None", StorageResolution.STANDARD),
+        ({"valid": 1}, "Kilometers/Fahrenheit", StorageResolution.STANDARD),
+        ({"valid": 1}, "None", None),
+        ({"valid": 1, "High": 1}, "None", StorageResolution.STANDARD),
+    ]
+)
+def test_put_invalid_metrics_raises_exception_without_adding_any(metrics, unit, storage_resolution):
+    # arrange
+    context = MetricsContext()
+    context.put_metric("High", 1, storage_resolution=StorageResolution.HIGH)
+
+    # act
+    with pytest.raises(InvalidMetricError):
+        context.put_metrics(metrics, unit, storage_resolution)
+
+    # assert
+    assert list(context.metrics) == ["High"]
+
+
+def test_put_metric_values_appends_values():
+    # arrange
+    context = MetricsContext()
+    metric_key = fake.word()
+
+    # act
+    context.put_metric(metric_key, 1, "Milliseconds")
+    context.put_metric_values(metric_key, array("d", [2, 3]))
+    context.put_metric_values(metric_key, (value for value in [4, 5]))
+
+    # assert
+    metric = context.metrics[metric_key]
+    assert metric.values.tolist() == [1, 2, 3, 4, 5]
+    assert metric.unit == "Milliseconds"
+
+
+def test_put_metric_values_with_numpy_array():
+    # arrange
+    numpy = pytest.importorskip("numpy")
+    context = MetricsContext()
+    metric_key = fake.word()
+
+    # act
+    context.put_metric_values(metric_key, numpy.array([1.5, 2.5, 3.5]), "Seconds", StorageResolution.HIGH)
+
+    # assert
+    metric = context.metrics[metric_key]
+    assert metric.values.tolist() == [1.5, 2.5, 3.5]
+    assert metric.storage_resolution == StorageResolution.HIGH
+
+
+@pytest.mark.parametrize("dtype", ["float64", "float32", "int64", ">f8"])
+def test_put_metric_values_with_numpy_array_of_any_numeric_dtype(dtype):
+    # arrange
+    numpy = pytest.importorskip("numpy")
+    context = MetricsContext()
+    metric_key = fake.word()
+    values = numpy.arange(0, 20, 2, dtype=dtype)[::2]
+
+    # act
+    context.put_metric_values(metric_key, values)
+
+    # assert
+    assert context.metrics[metric_key].values.tolist() == [0, 4, 8, 12, 16]
+
+
+@pytest.mark.parametrize("dtype", ["complex128", "object", "datetime64[s]"])
+def test_put_metric_values_with_numpy_array_of_non_numeric_dtype_raises_exception(dtype):
+    # arrange
+    numpy = pytest.importorskip("numpy")
+    context = MetricsContext()
+    values = numpy.array([1, 2], dtype=dtype)
+
+    # act
+    with pytest.raises(InvalidMetricError):
+        context.put_metric_values(fake.word(), values)
+
+    # assert
+    assert context.metrics == {}
+
+
+def test_lenient_validation_drops_numpy_array_of_complex_values():
+    # arrange
+    numpy = pytest.importorskip("numpy")
+    context = MetricsContext()
+    context.validation_mode = ValidationMode.LENIENT
+
+    # act
+    context.put_metric_values("Latency", numpy.array([1 + 1j, 2 + 0j]))
+
+    # assert
+    assert context.metrics == {}
+    assert context.invalid_count == 2
+
+
+def test_put_metric_values_with_statistic_set():
+    # arrange
+    context = MetricsContext()
+    metric_key = fake.word()
+
+    # act
+    context.put_metric_values(metric_key, [5, 1], aggregation_type=AggregationType.STATISTIC_SET)
+    context.put_metric_values(metric_key, array("d", [9, 3]))
+
+    # assert
+    assert context.metrics[metric_key].get_statistic_set() == {"Max": 9, "Min": 1, "Count": 4, "Sum": 18}
+
+
+def test_put_metric_values_with_no_values_does_not_add_metric():
+    # arrange
+    context = MetricsContext()
+
+    # act
+    context.put_metric_values(fake.word(), [])
+
+    # assert
+    assert context.metrics == {}
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [1, float("nan")],
+        array("d", [float("inf"), 1]),
+        (value for value in [1, -math.inf]),
+    ]
+)
+def test_put_metric_values_with_non_finite_value_raises_exception(values):
+    # arrange
+    context = MetricsContext()
+
+    # act
+    with pytest.raises(InvalidMetricError):
+        context.put_metric_values("metric", values)
+
+    # assert
+    assert context.metrics == {}
+
+
+def test_create_copy_with_context_copies_default_aggregation_type():
+    # arrange
+    context = MetricsContext()
+    context.set_default_aggregation_type(AggregationType.STATISTIC_SET)
+
+    # act
+    new_context = context.create_copy_with_context()
+
+    # assert
+    assert new_context.default_aggregation_type == AggregationType.STATISTIC_SET
+
+
 @pytest.mark.parametrize(
     "name, value, unit, storage_resolution",
     [
@@ -318,7 +706,13 @@ def test_put_metric_uses_standard_storage_resolution_if_not_provided():
         ("metric", math.inf, "Seconds", StorageResolution.STANDARD),
         ("metric", -math.inf, "Seconds", StorageResolution.STANDARD),
         ("metric", math.nan, "Seconds", StorageResolution.STANDARD),
+        ("metric", None, "Count", StorageResolution.STANDARD),
+        ("metric", "12", "Count", StorageResolution.STANDARD),
+        (5, 1, "Count", StorageResolution.STANDARD),
+        (["metric"], 1, "Count", StorageResolution.STANDARD),
         ("metric", 1, "Kilometers/Fahrenheit", StorageResolution.STANDARD),
+        ("metric", 1, ["Count"], StorageResolution.STANDARD),
+        ("metric", 1, "Seconds", [1]),
         ("metric", 1, "Seconds", 2),
         ("metric", 1, "Seconds", 0),
         ("metric", 1, "Seconds", None)
@@ -331,6 +725,120 @@ def test_put_invalid_metric_raises_exception(name, value, unit, storage_resoluti
         context.put_metric(name, value, unit, storage_resolution)
 
 
+def test_lenient_validation_drops_and_counts_invalid_metrics():
+    # arrange
+    context = MetricsContext()
+    context.validation_mode = ValidationMode.LENIENT
+
+    # act
+    context.put_metric("Valid", 1)
+    context.put_metric("Invalid", math.nan)
+    context.put_metric("", 1)
+    context.put_metrics({"Batched": 1, "Infinite": math.inf})
+    context.put_metric_values("Values", [1, math.nan, 2, -math.inf])
+    context.put_metric_values(" ", [1, 2])
+
+    # assert
+    assert sorted(context.metrics) == ["Batched", "Valid", "Values"]
+    assert context.metrics["Values"].values.tolist() == [1, 2]
+    assert context.invalid_count == 7
+
+
+def test_lenient_validation_drops_and_counts_values_that_are_not_numbers():
+    # arrange
+    context = MetricsContext()
+    context.validation_mode = ValidationMode.LENIENT
+    handle = MetricRegistry().declare("Recorded")
+
+    # act
+    context.put_metric("Latency", None)
+    context.put_metric("Latency", "12")
+    context.put_metrics({"Batched": 1, "Text": "1"})
+    context.put_metric_values("Values", [1, "2", None, 3])
+    context.put_metric_values("Generated", (value for value in [1, "2"]))
+    context.record(handle, "1")
+
+    # assert
+    assert sorted(context.metrics) == ["Batched", "Generated", "Values"]
+    assert context.metrics["Values"].values.tolist() == [1, 3]
+    assert context.metrics["Generated"].values.tolist() == [1]
+    assert context.invalid_count == 7
+
+
+def test_lenient_validation_drops_and_counts_unhashable_definitions():
+    # arrange
+    context = MetricsContext()
+    context.validation_mode = ValidationMode.LENIENT
+
+    # act
+    context.put_metric(["Latency"], 1)
+    context.put_metric("Latency", 1, ["Count"])
+    context.put_metric("Latency", 1, "Count", [1])
+    context.put_metrics({"Batched": 1}, {"Count"})
+    context.put_metric_values(["Values"], [1, 2])
+
+    # assert
+    assert context.metrics == {}
+    assert context.invalid_count == 6
+
+
+def test_lenient_validation_drops_dimension_sets_that_are_not_strings():
+    # arrange
+    context = MetricsContext()
+    context.validation_mode = ValidationMode.LENIENT
+    valid_dimension_set = {"Region": "us-east-1"}
+
+    # act
+    context.put_dimensions({"k": 5})
+    context.set_dimensions([valid_dimension_set, {5: "value"}])
+
+    # assert
+    assert context.dimensions == [valid_dimension_set]
+    assert context.invalid_count == 2
+
+
+def test_lenient_validation_drops_and_counts_invalid_dimension_sets():
+    # arrange
+    context = MetricsContext()
+    context.validation_mode = ValidationMode.LENIENT
+    valid_dimension_set = {"Region": "us-east-1"}
+
+    # act
+    context.put_dimensions({":Invalid": "value"})
+    context.set_dimensions([valid_dimension_set, {"Invalid": ""}])
+
+    # assert
+    assert context.dimensions == [valid_dimension_set]
+    assert context.invalid_count == 2
+
+
+def test_validation_off_does_not_validate():
+    # arrange
+    context = MetricsContext()
+    context.validation_mode = ValidationMode.OFF
+
+    # act
+    context.put_metric("Metric", 1, "Kilometers/Fahrenheit")
+    context.put_dimensions({"": ""})
+
+    # assert
+    assert context.metrics["Metric"].unit == "Kilometers/Fahrenheit"
+    assert context.dimensions == [{"": ""}]
+    assert context.invalid_count == 0
+
+
+def test_context_uses_configured_validation_mode():
+    # arrange
+    config.get_config().validation_mode = ValidationMode.LENIENT
+
+    # act
+    context = MetricsContext()
+    config.get_config().validation_mode = ValidationMode.STRICT
+
+    # assert
+    assert context.validation_mode == ValidationMode.LENIENT
+
+
 def test_create_copy_with_context_creates_new_instance():
     # arrange
     context = MetricsContext()
@@ -369,6 +877,55 @@ def test_create_copy_with_context_copies_properties():
     assert context.properties is not new_context.properties
 
 
+def test_create_copy_with_context_shares_properties_until_written():
+    # arrange
+    context = MetricsContext()
+    context.set_property("Shared", "value")
+    context.set_default_dimensions({"ServiceName": "Api"})
+
+    # act
+    new_context = context.create_copy_with_context()
+    is_shared = new_context.get_properties() is context.get_properties()
+    context.set_property("Parent", "value")
+    new_context.set_property("Child", "value")
+    new_context.default_dimensions["Region"] = "us-east-1"
+
+    # assert
+    assert is_shared
+    assert context.properties == {"Shared": "value", "Parent": "value"}
+    assert new_context.properties == {"Shared": "value", "Child": "value"}
+    assert context.default_dimensions == {"ServiceName": "Api"}
+    assert new_context.get_dimensions() == [{"ServiceName": "Api", "Region": "us-east-1"}]
+
+
+def test_set_property_to_unchanged_value_keeps_properties_shared():
+    # arrange
+    context = MetricsContext()
+    context.set_property("instanceId", "i-1234")
+    new_context = context.create_copy_with_context()
+
+    # act
+    new_context.set_property("instanceId", "".join(["i-", "1234"]))
+
+    # assert
+    assert new_context.get_properties() is context.get_properties()
+    assert new_context.properties == {"instanceId": "i-1234"}
+
+
+def test_reading_default_dimensions_keeps_cached_dimensions():
+    # arrange
+    context = MetricsContext()
+    context.set_default_dimensions({"ServiceName": "Api"})
+    dimensions = context.get_dimensions()
+
+    # act
+    default_dimensions = context.default_dimensions
+
+    # assert
+    assert default_dimensions == {"ServiceName": "Api"}
+    assert context.get_dimensions() is dimensions
+
+
 def test_create_copy_with_context_does_not_copy_dimensions():
     # arrange
     context = MetricsContext()
@@ -410,6 +967,49 @@ def test_create_copy_with_context_does_not_copy_metrics():
     assert len(new_context.metrics) == 0
 
 
+@pytest.mark.parametrize("preserve_dimensions", [True, False])
+def test_reset_clears_metrics_and_keeps_context(preserve_dimensions):
+    # arrange
+    context = MetricsContext("Namespace")
+    context.set_property("Prop", "Value")
+    context.set_default_dimensions({"ServiceName": "Api"})
+    context.put_dimensions({"Region": "us-east-1"})
+    context.put_metric("Metric", 1)
+    context.meta[constants.TIMESTAMP] = 0
+
+    # act
+    context.reset(preserve_dimensions)
+
+    # assert
+    assert context.metrics == {}
+    assert context.meta[constants.TIMESTAMP] > 0
+    assert context.namespace == "Namespace"
+    assert context.properties == {"Prop": "Value"}
+    assert context.default_dimensions == {"ServiceName": "Api"}
+    assert context.dimensions == ([{"Region": "us-east-1"}] if preserve_dimensions else [])
+
+
+def test_clear_resets_context_to_empty():
+    # arrange
+    context = MetricsContext("Namespace")
+    context.set_property("Prop", "Value")
+    context.set_default_dimensions({"ServiceName": "Api"})
+    context.set_dimensions([{"Region": "us-east-1"}])
+    context.set_default_aggregation_type(AggregationType.STATISTIC_SET)
+    context.put_metric("Metric", 1)
+
+    # act
+    context.clear()
+
+    # assert
+    assert context.namespace == DEFAULT_NAMESPACE
+    assert context.properties == {}
+    assert context.metrics == {}
+    assert context.get_dimensions() == []
+    assert context.should_use_default_dimensions
+    assert context.default_aggregation_type == AggregationType.LIST
+
+
 def test_set_dimensions_overwrites_all_dimensions():
     # arrange
     context = MetricsContext()
@@ -507,3 +1107,154 @@ def generate_dimension_set(dimensions_to_add):
         dimension_set[f"{i}"] = fake.word()
 
     return dimension_set
+
+
+def test_record_adds_value_to_existing_metric():
+    # arrange
+    context = MetricsContext()
+    handle = MetricRegistry().declare("Latency", "Milliseconds")
+    context.put_metric("Latency", 1, "Milliseconds")
+
+    # act
+    context.record(handle, 2)
+
+    # assert
+    assert context.metrics["Latency"].values.tolist() == [1, 2]
+
+
+def test_record_invalid_value_raises_exception():
+    # arrange
+    context = MetricsContext()
+    handle = MetricRegistry().declare("Latency")
+
+    # act / assert
+    with pytest.raises(InvalidMetricError):
+        context.record(handle, math.inf)
+
+
+def test_record_invalid_value_is_dropped_in_lenient_mode():
+    # arrange
+    context = MetricsContext()
+    context.validation_mode = ValidationMode.LENIENT
+    handle = MetricRegistry().declare("Latency")
+
+    # act
+    context.record(handle, math.nan)
+
+    # assert
+    assert context.metrics == {}
+    assert context.invalid_count == 1
+
+
+def test_record_with_different_storage_resolution_raises_exception():
+    # arrange
+    context = MetricsContext()
+    handle = MetricRegistry().declare("Latency", storage_resolution=StorageResolution.HIGH)
+    context.put_metric("Latency", 1)
+
+    # act / assert
+    with pytest.raises(InvalidMetricError):
+        context.record(handle, 2)
+
+
+def test_merge_metrics_adds_values_of_other_context():
+    # arrange
+    context = MetricsContext()
+    other = MetricsContext()
+    context.put_metric("Latency", 1)
+    other.put_metric("Latency", 2)
+    other.put_metric("Count", 3)
+
+    # act
+    context.merge_metrics(other)
+
+    # assert
+    assert context.metrics["Latency"].values.tolist() == [1, 2]
+    assert context.metrics["Count"].values.tolist() == [3]
+
+
+@pytest.mark.parametrize("first_aggregation_type", [AggregationType.LIST, AggregationType.STATISTIC_SET])
+def test_merge_metrics_combines_values_into_statistic_set(first_aggregation_type):
+    # arrange
+    context = MetricsContext()
+    other = MetricsContext()
+    context.put_metric("Latency", 1, aggregation_type=first_aggregation_type)
+    other.put_metric("Latency", 5, aggregation_type=AggregationType.STATISTIC_SET)
+    other.put_metric("Latency", 3)
+
+    # act
+    context.merge_metrics(other)
+
+    # assert
+    assert context.metrics["Latency"].get_statistic_set() == {"Max": 5, "Min": 1, "Count": 3, "Sum": 9}
+
+
+def test_merge_metrics_adds_invalid_count_of_other_context():
+    # arrange
+    context = MetricsContext()
+    other = MetricsContext()
+    other.validation_mode = ValidationMode.LENIENT
+    other.put_metric("Latency", math.nan)
+
+    # act
+    context.merge_metrics(other)
+
+    # assert
+    assert context.invalid_count == 1
+
+
+def test_put_metric_with_histogram_counts_values_in_buckets():
+    # arrange
+    context = MetricsContext()
+    values = [random.lognormvariate(3, 1) for _ in range(10000)]
+
+    # act
+    for value in values:
+        context.put_metric("Latency", value, aggregation_type=AggregationType.HISTOGRAM)
+
+    # assert
+    metric = context.metrics["Latency"]
+    bucket_values, counts = metric.get_buckets()
+    assert len(bucket_values) < 1000
+    assert sum(counts) == len(values)
+    assert metric.get_statistic_set() == {"Max": max(values), "Min": min(values), "Count": len(values), "Sum": sum(values)}
+    # percentiles computed from the buckets stay within the relative error of the exact ones
+    sorted_values = sorted(values)
+    for percentile in [0.5, 0.9, 0.99]:
+        rank = int(percentile * len(values))
+        cumulative = 0
+        for bucket_value, count in zip(bucket_values, counts):
+            cumulative += count
+            if cumulative > rank:
+                break
+        assert bucket_value == pytest.approx(sorted_values[rank], rel=0.0101)
+
+
+def test_put_metric_values_with_histogram_counts_values_in_buckets():
+    # arrange
+    context = MetricsContext()
+
+    # act
+    context.put_metric_values("Latency", [1, 1, 2, -1, 0], aggregation_type=AggregationType.HISTOGRAM)
+
+    # assert
+    bucket_values, counts = context.metrics["Latency"].get_buckets()
+    assert counts == [1, 1, 2, 1]
+    assert bucket_values[1] == 0
+
+
+def test_merge_metrics_combines_histogram_buckets():
+    # arrange
+    context = MetricsContext()
+    other = MetricsContext()
+    context.put_metric("Latency", 10, aggregation_type=AggregationType.HISTOGRAM)
+    other.put_metric("Latency", 10, aggregation_type=AggregationType.HISTOGRAM)
+    other.put_metric("Latency", 20)
+
+    # act
+    context.merge_metrics(other)
+
+    # assert
+    bucket_values, counts = context.metrics["Latency"].get_buckets()
+    assert counts == [2, 1]
+    assert context.metrics["Latency"].get_statistic_set() == {"Max": 20, "Min": 10, "Count": 3, "Sum": 40}
@@ -5,7 +5,10 @@ from aws_embedded_metrics.sinks import Sink
 from aws_embedded_metrics.environment import Environment
 from aws_embedded_metrics.exceptions import InvalidNamespaceError, InvalidMetricError
 from aws_embedded_metrics.storage_resolution import StorageResolution
+from aws_embedded_metrics.aggregation_type import AggregationType
+from aws_embedded_metrics.validation_mode import ValidationMode
 import aws_embedded_metrics.constants as constants
+import math
 import pytest
 from faker import Faker
 from importlib import reload
@@ -50,7 +53,7 @@ async def test_can_put_metric(mocker):
 
     # assert
     context = get_flushed_context(sink)
-    assert context.metrics[expected_key].values == [expected_value]
+    assert context.metrics[expected_key].values.tolist() == [expected_value]
     assert context.metrics[expected_key].unit == "None"
 
 
@@ -68,7 +71,7 @@ async def test_can_put_metric_with_different_storage_resolution_different_flush(
 
     # assert
     context = sink.accept.call_args[0][0]
-    assert context.metrics[expected_key].values == [expected_value]
+    assert context.metrics[expected_key].values.tolist() == [expected_value]
     assert context.metrics[expected_key].unit == "None"
     assert context.metrics[expected_key].storage_resolution == StorageResolution.HIGH
 
@@ -77,7 +80,7 @@ async def test_can_put_metric_with_different_storage_resolution_different_flush(
     logger.put_metric(expected_key, expected_value, None)
     await logger.flush()
     context = sink.accept.call_args[0][0]
-    assert context.metrics[expected_key].values == [expected_value]
+    assert context.metrics[expected_key].values.tolist() == [expected_value]
     assert context.metrics[expected_key].unit == "None"
     assert context.metrics[expected_key].storage_resolution == StorageResolution.STANDARD
 
@@ -215,7 +218,7 @@ async def test_put_metric_appends_values_to_array(mocker):
 
     # assert
     context = get_flushed_context(sink)
-    assert context.metrics[expected_key].values == [expected_value_1, expected_value_2]
+    assert context.metrics[expected_key].values.tolist() == [expected_value_1, expected_value_2]
 
 
 @pytest.mark.asyncio
@@ -429,7 +432,7 @@ async def test_context_is_preserved_across_flushes(mocker):
     context = sink.accept.call_args[0][0]
     assert context.namespace == expected_namespace
     assert context.properties[expected_property_key] == expected_value
-    assert context.metrics[metric_key].values == [0]
+    assert context.metrics[metric_key].values.tolist() == [0]
 
     logger.put_metric(metric_key, 1)
     await logger.flush()
@@ -437,7 +440,7 @@ async def test_context_is_preserved_across_flushes(mocker):
     context = sink.accept.call_args[0][0]
     assert context.namespace == expected_namespace
     assert context.properties[expected_property_key] == expected_value
-    assert context.metrics[metric_key].values == [1]
+    assert context.metrics[metric_key].values.tolist() == [1]
 
 
 @pytest.mark.asyncio
@@ -509,6 +512,89 @@ async def test_can_set_timestamp(mocker):
     assert context.meta[constants.TIMESTAMP] == utils.convert_to_milliseconds(expected_value)
 
 
+@pytest.mark.asyncio
+async def test_put_metric_with_statistic_set(mocker):
+    # arrange
+    expected_key = fake.word()
+    logger, sink, env = get_logger_and_sink(mocker)
+
+    # act
+    logger.put_metric(expected_key, 10, "Milliseconds", aggregation_type=AggregationType.STATISTIC_SET)
+    logger.put_metric(expected_key, 20, "Milliseconds")
+    await logger.flush()
+
+    # assert
+    context = get_flushed_context(sink)
+    assert context.metrics[expected_key].get_statistic_set() == {"Max": 20, "Min": 10, "Count": 2, "Sum": 30}
+
+
+@pytest.mark.asyncio
+async def test_put_metrics_adds_each_metric(mocker):
+    # arrange
+    logger, sink, env = get_logger_and_sink(mocker)
+
+    # act
+    logger.put_metrics({"DbLatency": 12, "CacheLatency": 3}, "Milliseconds")
+    await logger.flush()
+
+    # assert
+    context = get_flushed_context(sink)
+    assert context.metrics["DbLatency"].values.tolist() == [12]
+    assert context.metrics["CacheLatency"].values.tolist() == [3]
+    assert context.metrics["CacheLatency"].unit == "Milliseconds"
+
+
+@pytest.mark.asyncio
+async def test_flush_logs_count_of_values_dropped_by_lenient_validation(mocker, caplog):
+    # arrange
+    logger, sink, env = get_logger_and_sink(mocker)
+    logger.context.validation_mode = ValidationMode.LENIENT
+
+    # act
+    logger.put_metric("Valid", 1)
+    logger.put_metric("Invalid", math.nan)
+    await logger.flush()
+
+    # assert
+    context = get_flushed_context(sink)
+    assert list(context.metrics) == ["Valid"]
+    assert "Dropped 1 invalid metric values or dimension sets" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_put_metric_values_appends_values_to_array(mocker):
+    # arrange
+    expected_key = fake.word()
+    logger, sink, env = get_logger_and_sink(mocker)
+
+    # act
+    logger.put_metric_values(expected_key, [1, 2], "Count").put_metric_values(expected_key, [3])
+    await logger.flush()
+
+    # assert
+    context = get_flushed_context(sink)
+    assert context.metrics[expected_key].values.tolist() == [1, 2, 3]
+    assert context.metrics[expected_key].unit == "Count"
+
+
+@pytest.mark.asyncio
+async def test_default_aggregation_type_is_preserved_across_flushes(mocker):
+    # arrange
+    expected_key = fake.word()
+    logger, sink, env = get_logger_and_sink(mocker)
+    logger.set_default_aggregation_type(AggregationType.STATISTIC_SET)
+
+    # act
+    await logger.flush()
+    logger.put_metric(expected_key, 10)
+    logger.put_metric(expected_key, 20)
+    await logger.flush()
+
+    # assert
+    context = sink.accept.call_args[0][0]
+    assert context.metrics[expected_key].get_statistic_set() == {"Max": 20, "Min": 10, "Count": 2, "Sum": 30}
+
+
 def test_flush_sync_sends_context_to_sink(mocker):
     # arrange
     expected_key = fake.word()
@@ -535,6 +621,29 @@ def before():
     os.environ["AWS_EMF_LOG_GROUP_NAME"] = ""
 
 
+@pytest.mark.asyncio
+async def test_flush_does_not_modify_context_passed_to_sink(mocker):
+    # arrange
+    logger, sink, env = get_logger_and_sink(mocker)
+    logger.set_property("Prop", "Value")
+    logger.put_dimensions({"Dim": "Value"})
+    logger.put_metric("Metric", 1)
+
+    # act
+    await logger.flush()
+    logger.put_metric("Other", 2)
+    logger.set_property("Prop", "Other")
+    await logger.flush()
+
+    # assert
+    first, second = [call[0][0] for call in sink.accept.call_args_list]
+    assert first is not second
+    assert list(first.metrics) == ["Metric"]
+    assert list(second.metrics) == ["Other"]
+    assert first.properties == {"Prop": "Value"}
+    assert first.dimensions == [{"Dim": "Value"}]
+
+
 def get_logger_and_sink(mocker):
     env = mocker.create_autospec(spec=Environment)
 
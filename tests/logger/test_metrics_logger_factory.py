@@ -0,0 +1,42 @@
+from aws_embedded_metrics.logger import metrics_logger_factory
+from aws_embedded_metrics.logger.metrics_logger_factory import create_metrics_logger, release_metrics_logger
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def empty_logger_pool():
+    metrics_logger_factory.logger_pool.clear()
+    yield
+    metrics_logger_factory.logger_pool.clear()
+
+
+def test_create_metrics_logger_reuses_released_logger():
+    # arrange
+    logger = create_metrics_logger()
+    logger.set_namespace("Namespace")
+    logger.set_property("Prop", "Value")
+    logger.put_metric("Metric", 1)
+    logger.flush_preserve_dimensions = True
+
+    # act
+    release_metrics_logger(logger)
+    reused_logger = create_metrics_logger()
+
+    # assert
+    assert reused_logger is logger
+    assert reused_logger.context.properties == {}
+    assert reused_logger.context.metrics == {}
+    assert reused_logger.context.namespace != "Namespace"
+    assert not reused_logger.flush_preserve_dimensions
+
+
+def test_release_metrics_logger_keeps_pool_bounded():
+    # arrange
+    loggers = [create_metrics_logger() for _ in range(metrics_logger_factory.LOGGER_POOL_SIZE + 1)]
+
+    # act
+    for logger in loggers:
+        release_metrics_logger(logger)
+
+    # assert
+    assert len(metrics_logger_factory.logger_pool) == metrics_logger_factory.LOGGER_POOL_SIZE
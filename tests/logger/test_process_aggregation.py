@@ -0,0 +1,193 @@
+from aws_embedded_metrics.aggregation_type import AggregationType
+from aws_embedded_metrics.environment import Environment
+from aws_embedded_metrics.logger.metric import HistogramMetric, StatisticSetMetric
+from aws_embedded_metrics.logger.metrics_aggregator import MetricsAggregator
+from aws_embedded_metrics.logger.metrics_context import MetricsContext
+from aws_embedded_metrics.logger.process_aggregation import decode_contexts, encode_contexts
+from aws_embedded_metrics.sinks import Sink
+from aws_embedded_metrics.storage_resolution import StorageResolution
+import multiprocessing
+import pytest
+import sys
+import time
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="requires Unix domain sockets")
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    return str(tmp_path / "metrics.sock")
+
+
+def test_encode_contexts_round_trips_every_aggregation_type():
+    # arrange
+    context = MetricsContext.empty()
+    context.put_metric("List", 1, "Milliseconds", StorageResolution.HIGH)
+    context.put_metric("List", 2, "Milliseconds", StorageResolution.HIGH)
+    context.put_metric_values("StatisticSet", [1, 5], aggregation_type=AggregationType.STATISTIC_SET)
+    context.put_metric_values("Histogram", [-1, 0, 10, 10], aggregation_type=AggregationType.HISTOGRAM)
+    key = ("Namespace", frozenset({"Operation": "GetItem"}.items()))
+
+    # act
+    [(namespace, dimensions, decoded)] = list(decode_contexts(encode_contexts({key: context})))
+
+    # assert
+    assert namespace == "Namespace"
+    assert dimensions == {"Operation": "GetItem"}
+    assert decoded.metrics["List"].values.tolist() == [1, 2]
+    assert decoded.metrics["List"].unit == "Milliseconds"
+    assert decoded.metrics["List"].storage_resolution == StorageResolution.HIGH
+    assert isinstance(decoded.metrics["StatisticSet"], StatisticSetMetric)
+    assert decoded.metrics["StatisticSet"].get_statistic_set() == {"Max": 5, "Min": 1, "Count": 2, "Sum": 6}
+    histogram = decoded.metrics["Histogram"]
+    assert isinstance(histogram, HistogramMetric)
+    assert histogram.get_buckets() == context.metrics["Histogram"].get_buckets()
+    assert histogram.get_statistic_set() == {"Max": 10, "Min": -1, "Count": 4, "Sum": 19}
+
+
+def test_encode_contexts_accepts_storage_resolution_values():
+    # arrange
+    context = MetricsContext.empty()
+    context.put_metric("High", 1, "Count", 1)
+    context.put_metric("Standard", 1, "Count", 60)
+    key = ("Namespace", frozenset())
+
+    # act
+    [(_, _, decoded)] = list(decode_contexts(encode_contexts({key: context})))
+
+    # assert
+    assert decoded.metrics["High"].storage_resolution is StorageResolution.HIGH
+    assert decoded.metrics["Standard"].storage_resolution is StorageResolution.STANDARD
+
+
+def test_first_started_aggregator_is_elected(mocker, socket_path):
+    # arrange
+    elected, _ = get_aggregator_and_sink(mocker, socket_path)
+    other, _ = get_aggregator_and_sink(mocker, socket_path)
+
+    # act
+    elected.start()
+    other.start()
+
+    # assert
+    try:
+        assert elected.process_aggregation.is_elected
+        assert not other.process_aggregation.is_elected
+    finally:
+        other.stop()
+        elected.stop()
+
+
+def test_aggregator_forwards_metrics_to_elected_aggregator(mocker, socket_path):
+    # arrange
+    elected, elected_sink = get_aggregator_and_sink(mocker, socket_path)
+    other, other_sink = get_aggregator_and_sink(mocker, socket_path)
+    elected.start()
+    other.start()
+    dimensions = {"Operation": "GetItem"}
+    # the elected aggregator merges forwarded metrics into its own contexts as they are received
+    merge_metrics = mocker.spy(MetricsContext, "merge_metrics")
+
+    # act
+    elected.put_metric("Latency", 1, dimensions=dimensions)
+    other.put_metric("Latency", 2, dimensions=dimensions)
+    other.flush()
+
+    # assert
+    try:
+        wait_until(lambda: merge_metrics.call_count == 1)
+        elected.flush()
+        contexts = [call[0][0] for call in elected_sink.accept.call_args_list]
+        assert len(contexts) == 1
+        assert contexts[0].metrics["Latency"].values.tolist() == [1, 2]
+        assert contexts[0].get_dimensions()[0]["Operation"] == "GetItem"
+        other_sink.accept.assert_not_called()
+    finally:
+        other.stop()
+        elected.stop()
+
+
+def test_aggregator_is_elected_when_elected_aggregator_stops(mocker, socket_path):
+    # arrange
+    elected, _ = get_aggregator_and_sink(mocker, socket_path)
+    other, other_sink = get_aggregator_and_sink(mocker, socket_path)
+    elected.start()
+    other.start()
+    elected.stop()
+
+    # act
+    other.put_metric("Latency", 1)
+    other.flush()
+
+    # assert
+    try:
+        assert other.process_aggregation.is_elected
+        contexts = [call[0][0] for call in other_sink.accept.call_args_list]
+        assert contexts[0].metrics["Latency"].values.tolist() == [1]
+    finally:
+        other.stop()
+
+
+def test_aggregator_flushes_metrics_itself_after_giving_up_election(mocker, socket_path):
+    # arrange
+    aggregator, sink = get_aggregator_and_sink(mocker, socket_path)
+    aggregator.start()
+    aggregator.put_metric("Latency", 1)
+
+    # act
+    aggregator.stop()
+
+    # assert
+    contexts = [call[0][0] for call in sink.accept.call_args_list]
+    assert contexts[0].metrics["Latency"].values.tolist() == [1]
+
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="requires fork")
+def test_forked_process_forwards_metrics_to_elected_aggregator(mocker, socket_path):
+    # arrange
+    elected, elected_sink = get_aggregator_and_sink(mocker, socket_path)
+    elected.start()
+    merge_metrics = mocker.spy(MetricsContext, "merge_metrics")
+
+    # act
+    child = multiprocessing.get_context("fork").Process(target=put_metric_in_child, args=(socket_path,))
+    child.start()
+    child.join(10)
+
+    # assert
+    try:
+        assert child.exitcode == 0
+        wait_until(lambda: merge_metrics.call_count == 1)
+        elected.flush()
+        contexts = [call[0][0] for call in elected_sink.accept.call_args_list]
+        assert contexts[0].metrics["Requests"].values.tolist() == [1]
+    finally:
+        elected.stop()
+
+
+def put_metric_in_child(socket_path):
+    aggregator = MetricsAggregator(socket_path=socket_path).start()
+    aggregator.put_metric("Requests", 1)
+    aggregator.flush()
+    # exits without releasing the election of the parent
+    if aggregator.process_aggregation.is_elected:
+        sys.exit(1)
+
+
+def get_aggregator_and_sink(mocker, socket_path):
+    env = mocker.create_autospec(spec=Environment)
+
+    async def env_provider():
+        return env
+
+    sink = mocker.create_autospec(spec=Sink)
+    env.get_sink.return_value = sink
+
+    return MetricsAggregator(env_provider, socket_path=socket_path), sink
+
+
+def wait_until(condition, timeout=5):
+    """Waits for metrics forwarded by another aggregator, which are received asynchronously."""
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
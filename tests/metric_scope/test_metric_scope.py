@@ -363,6 +363,55 @@ async def test_sync_generator_works_inside_running_event_loop(mock_logger):
     assert InvocationTracker.invocations == 4  # 3 yields + 1 final flush
 
 
+def test_sync_scope_does_not_reuse_logger_by_default(mock_logger):
+    # arrange
+    loggers = []
+
+    @metric_scope
+    def my_handler(metrics):
+        loggers.append(metrics)
+
+    # act
+    my_handler()
+    my_handler()
+
+    # assert
+    assert loggers[0] is not loggers[1]
+
+
+def test_sync_scope_reuses_logger_when_enabled(mock_logger):
+    # arrange
+    loggers = []
+
+    @metric_scope(reuse_logger=True)
+    def my_handler(metrics):
+        loggers.append(metrics)
+
+    # act
+    my_handler()
+    my_handler()
+
+    # assert
+    assert loggers[0] is loggers[1]
+
+
+@pytest.mark.asyncio
+async def test_async_scope_reuses_logger_when_enabled(mock_logger):
+    # arrange
+    loggers = []
+
+    @metric_scope(reuse_logger=True)
+    async def my_handler(metrics):
+        loggers.append(metrics)
+
+    # act
+    await my_handler()
+    await my_handler()
+
+    # assert
+    assert loggers[0] is loggers[1]
+
+
 # Test helpers
 
 
@@ -1,8 +1,10 @@
 from aws_embedded_metrics.config import get_config
 from aws_embedded_metrics.exceptions import DimensionSetExceededError
 from aws_embedded_metrics.logger.metrics_context import MetricsContext
-from aws_embedded_metrics.serializers.log_serializer import LogSerializer
+from aws_embedded_metrics.serializers.json_encoder import get_json_encoder
+from aws_embedded_metrics.serializers.log_serializer import LogSerializer, encode_metric_directive, plan_batches
 from aws_embedded_metrics.storage_resolution import StorageResolution
+from aws_embedded_metrics.aggregation_type import AggregationType
 from collections import Counter
 from faker import Faker
 import json
@@ -13,6 +15,17 @@ fake = Faker()
 serializer = LogSerializer()
 
 
+@pytest.fixture(autouse=True, params=["json", "orjson"])
+def json_encoder(request):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    config = get_config()
+    previous_encoder = config.json_encoder
+    config.json_encoder = request.param
+    yield request.param
+    config.json_encoder = previous_encoder
+
+
 def test_serialize_dimensions():
     # arrange
     expected_key = fake.word()
@@ -116,7 +129,8 @@ def test_serialize_metrics_with_standard_storage_resolution():
     assert_json_equality(result_json, expected)
 
 
-def test_serialize_metrics_with_high_storage_resolution():
+@pytest.mark.parametrize("storage_resolution", [StorageResolution.HIGH, 1])
+def test_serialize_metrics_with_high_storage_resolution(storage_resolution):
     # arrange
     expected_key = fake.word()
     expected_value = fake.random.randrange(0, 100)
@@ -130,7 +144,7 @@ def test_serialize_metrics_with_high_storage_resolution():
     )
 
     context = get_context()
-    context.put_metric(expected_key, expected_value, "None", StorageResolution.HIGH)
+    context.put_metric(expected_key, expected_value, "None", storage_resolution)
 
     # act
     result_json = serializer.serialize(context)[0]
@@ -283,7 +297,7 @@ def test_serialize_with_multiple_metrics():
 
     for index in range(metrics):
         expected_key = f"Metric-{index}"
-        expected_value = fake.random.randrange(0, 100)
+        expected_value = float(fake.random.randrange(0, 100))
         context.put_metric(expected_key, expected_value)
 
         expected_metric_definition = {"Name": expected_key, "Unit": "None"}
@@ -297,13 +311,13 @@ def test_serialize_with_multiple_metrics():
 
     # assert
     assert len(results) == 1
-    assert results == [json.dumps(expected)]
+    assert results == [encode(expected)]
 
 
 def test_serialize_metrics_with_multiple_datapoints():
     # arrange
     expected_key = fake.word()
-    expected_values = [fake.random.randrange(0, 100), fake.random.randrange(0, 100)]
+    expected_values = [float(fake.random.randrange(0, 100)), float(fake.random.randrange(0, 100))]
     expected_metric_definition = {"Name": expected_key, "Unit": "None"}
     expected = {**get_empty_payload()}
     expected[expected_key] = expected_values
@@ -320,7 +334,453 @@ def test_serialize_metrics_with_multiple_datapoints():
 
     # assert
     assert len(results) == 1
-    assert results == [json.dumps(expected)]
+    assert results == [encode(expected)]
+
+
+def test_serialize_iter_yields_same_events_as_serialize():
+    # arrange
+    context = get_context()
+    for index in range(250):
+        context.put_metric(f"Metric-{index}", index)
+    for i in range(150):
+        context.put_metric("Metric-many", i)
+
+    # act
+    results = serializer.serialize_iter(context)
+
+    # assert
+    assert not isinstance(results, list)
+    assert list(results) == serializer.serialize(context)
+
+
+def test_serialize_iter_builds_events_lazily():
+    # arrange
+    context = get_context()
+    for i in range(1000):
+        context.put_metric("Metric-many", i)
+
+    # act
+    results = serializer.serialize_iter(context)
+    first_event = json.loads(next(results))
+
+    # assert
+    assert first_event["Metric-many"] == list(range(100))
+    assert len(list(results)) == 9
+
+
+def test_serialize_iter_yields_empty_event_for_empty_context():
+    # arrange
+    context = get_context()
+
+    # act
+    results = list(serializer.serialize_iter(context))
+
+    # assert
+    assert len(results) == 1
+    assert_json_equality(results[0], get_empty_payload())
+
+
+def test_serialize_to_bytes_yields_newline_terminated_events():
+    # arrange
+    context = get_context()
+    context.put_dimensions({"Region": "us-west-2"})
+    context.set_property("Owner", "\u00e9quipe")
+    for index in range(150):
+        context.put_metric(f"Metric-{index}", index)
+
+    # act
+    results = list(serializer.serialize_to_bytes(context))
+
+    # assert
+    assert results == [(event + "\n").encode("utf-8") for event in serializer.serialize(context)]
+
+
+def test_serialize_into_appends_to_buffer():
+    # arrange
+    context = get_context()
+    for index in range(150):
+        context.put_metric(f"Metric-{index}", index)
+    buffer = bytearray(b"existing\n")
+
+    # act
+    serializer.serialize_into(context, buffer)
+
+    # assert
+    lines = bytes(buffer).split(b"\n")
+    assert lines[0] == b"existing"
+    assert lines[1:] == [event.encode("utf-8") for event in serializer.serialize(context)] + [b""]
+
+
+def test_serialize_reuses_cached_envelope_for_same_schema():
+    # arrange
+    encode_metric_directive.cache_clear()
+    expected_key = fake.word()
+
+    # act
+    for i in range(3):
+        context = get_context()
+        context.put_dimensions({"Operation": "Get"})
+        context.put_metric(expected_key, i, "Milliseconds")
+        result_json = serializer.serialize(context)[0]
+
+    # assert
+    cache_info = encode_metric_directive.cache_info()
+    assert (cache_info.misses, cache_info.hits) == (1, 2)
+    assert json.loads(result_json)[expected_key] == 2
+
+
+def test_serialize_with_property_shadowing_metric_name():
+    # arrange
+    expected_metric_definition = {"Name": "Latency", "Unit": "None"}
+    expected = {"Latency": 10.0, **get_empty_payload()}
+    expected["_aws"]["CloudWatchMetrics"][0]["Metrics"].append(expected_metric_definition)
+
+    context = get_context()
+    context.set_property("Latency", "slow")
+    context.put_metric("Latency", 10)
+
+    # act
+    results = serializer.serialize(context)
+
+    # assert
+    assert results == [encode(expected)]
+
+
+def test_serialize_with_property_shadowing_envelope():
+    # arrange
+    expected = {"_aws": None, "Count": 1.0}
+    expected.update(get_empty_payload())
+    expected["_aws"]["CloudWatchMetrics"][0]["Metrics"].append({"Name": "Count", "Unit": "None"})
+
+    context = get_context()
+    context.set_property("_aws", "ignored")
+    context.put_metric("Count", 1)
+
+    # act
+    results = serializer.serialize(context)
+
+    # assert
+    assert results == [encode(expected)]
+
+
+def test_plan_batches_only_revisits_metrics_with_remaining_data():
+    # arrange
+    context = get_context()
+    for i in range(1000):
+        context.put_metric("Metric-many", i)
+    for index in range(99):
+        context.put_metric(f"Metric-{index}", index)
+
+    # act
+    batches = list(plan_batches(context.metrics))
+
+    # assert
+    assert len(batches) == 10
+    assert len(batches[0]) == 100
+    for batch_index, batch in enumerate(batches[1:], start=1):
+        assert [entry.name for entry in batch] == ["Metric-many"]
+        assert (batch[0].start, batch[0].end) == (batch_index * 100, (batch_index + 1) * 100)
+
+
+def test_plan_batches_returns_single_empty_batch_without_metrics():
+    # arrange
+    context = get_context()
+
+    # act
+    batches = list(plan_batches(context.metrics))
+
+    # assert
+    assert batches == [[]]
+
+
+def test_serialize_splits_events_exceeding_max_event_size():
+    # arrange
+    config = get_config()
+    max_event_size = 4096
+    metrics = 80
+    context = get_context()
+    context.set_property("Payload", "x" * 2048)
+    for index in range(metrics):
+        for i in range(10):
+            context.put_metric(f"Metric-{index}", i)
+
+    # act
+    config.max_event_size = max_event_size
+    try:
+        results = serializer.serialize(context)
+    finally:
+        config.max_event_size = 256 * 1024
+
+    # assert
+    assert len(results) > 1
+    metric_names = []
+    for result_json in results:
+        assert len(result_json.encode("utf-8")) <= max_event_size
+        result_obj = json.loads(result_json)
+        assert result_obj["Payload"] == "x" * 2048
+        definitions = [d["Name"] for d in result_obj["_aws"]["CloudWatchMetrics"][0]["Metrics"]]
+        assert definitions == [key for key in result_obj if key.startswith("Metric-")]
+        metric_names += definitions
+    assert metric_names == [f"Metric-{index}" for index in range(metrics)]
+
+
+def test_serialize_to_bytes_matches_serialize_for_split_and_shadowed_events():
+    # arrange
+    config = get_config()
+    context = get_context()
+    context.set_property("Payload", "\u00e9" * 1024)
+    context.set_property("Metric-0", "shadowed")
+    for index in range(80):
+        for i in range(10):
+            context.put_metric(f"Metric-{index}", i)
+
+    # act
+    config.max_event_size = 4096
+    try:
+        results = list(serializer.serialize_to_bytes(context))
+        expected = [(event + "\n").encode("utf-8") for event in serializer.serialize(context)]
+    finally:
+        config.max_event_size = 256 * 1024
+
+    # assert
+    assert len(results) > 1
+    assert results == expected
+
+
+def test_serialize_does_not_split_events_within_max_event_size():
+    # arrange
+    context = get_context()
+    context.set_property("Payload", "x" * 2048)
+    for index in range(80):
+        context.put_metric(f"Metric-{index}", index)
+
+    # act
+    results = serializer.serialize(context)
+
+    # assert
+    assert len(results) == 1
+
+
+def test_serialize_emits_single_metric_exceeding_max_event_size(caplog):
+    # arrange
+    config = get_config()
+    context = get_context()
+    context.set_property("Payload", "x" * 2048)
+    context.put_metric("Metric", 1)
+
+    # act
+    config.max_event_size = 1024
+    try:
+        results = serializer.serialize(context)
+    finally:
+        config.max_event_size = 256 * 1024
+
+    # assert
+    assert len(results) == 1
+    assert json.loads(results[0])["Metric"] == 1
+    assert "exceeds the maximum event size" in caplog.text
+
+
+def test_serialize_splits_datapoints_of_single_metric_exceeding_max_event_size(caplog):
+    # arrange
+    config = get_config()
+    max_event_size = 1024
+    expected_values = [1000000.0 + i / 7 for i in range(100)]
+    context = get_context()
+    for value in expected_values:
+        context.put_metric("Latency", value)
+
+    # act
+    config.max_event_size = max_event_size
+    try:
+        results = serializer.serialize(context)
+    finally:
+        config.max_event_size = 256 * 1024
+
+    # assert
+    assert len(results) > 1
+    values = []
+    for result_json in results:
+        assert len(result_json.encode("utf-8")) <= max_event_size
+        values += json.loads(result_json)["Latency"]
+    assert values == expected_values
+    assert "exceeds the maximum event size" not in caplog.text
+
+
+def test_serialize_splits_values_and_counts_of_single_metric_exceeding_max_event_size(compress_values):
+    # arrange
+    config = get_config()
+    max_event_size = 1024
+    context = get_context()
+    for i in range(100):
+        context.put_metric("Latency", 1000000.0 + i / 7)
+        context.put_metric("Latency", 1000000.0 + i / 7)
+
+    # act
+    config.max_event_size = max_event_size
+    try:
+        results = serializer.serialize(context)
+    finally:
+        config.max_event_size = 256 * 1024
+
+    # assert
+    assert len(results) > 1
+    count = 0
+    for result_json in results:
+        assert len(result_json.encode("utf-8")) <= max_event_size
+        result = json.loads(result_json)["Latency"]
+        assert result["Count"] == sum(result["Counts"])
+        assert result["Max"] == max(result["Values"])
+        count += result["Count"]
+    assert count == 200
+
+
+def test_serialize_statistic_set_metric():
+    # arrange
+    expected_metric_definition = {"Name": "Latency", "Unit": "Milliseconds"}
+    expected = {**get_empty_payload()}
+    expected["Latency"] = {"Max": 999, "Min": 0, "Count": 1000, "Sum": sum(range(1000))}
+    expected["_aws"]["CloudWatchMetrics"][0]["Metrics"].append(expected_metric_definition)
+
+    context = get_context()
+    for i in range(1000):
+        context.put_metric("Latency", i, "Milliseconds", aggregation_type=AggregationType.STATISTIC_SET)
+
+    # act
+    results = serializer.serialize(context)
+
+    # assert
+    assert len(results) == 1
+    assert_json_equality(results[0], expected)
+
+
+@pytest.fixture
+def compress_values():
+    config = get_config()
+    config.compress_values = True
+    yield
+    config.compress_values = False
+
+
+def test_serialize_compresses_repeated_values(compress_values):
+    # arrange
+    context = get_context()
+    for i in range(5000):
+        context.put_metric("Counter", 1)
+    for value in [3, 1, 3, 3, 2]:
+        context.put_metric("Latency", value)
+
+    # act
+    results = serializer.serialize(context)
+
+    # assert
+    assert len(results) == 1
+    result_obj = json.loads(results[0])
+    assert result_obj["Counter"] == {"Values": [1], "Counts": [5000], "Max": 1, "Min": 1, "Count": 5000, "Sum": 5000}
+    assert result_obj["Latency"] == {"Values": [3, 1, 2], "Counts": [3, 1, 1], "Max": 3, "Min": 1, "Count": 5, "Sum": 12}
+
+
+def test_serialize_does_not_compress_distinct_values(compress_values):
+    # arrange
+    context = get_context()
+    context.put_metric("Single", 1)
+    for value in range(3):
+        context.put_metric("Distinct", value)
+
+    # act
+    results = serializer.serialize(context)
+
+    # assert
+    result_obj = json.loads(results[0])
+    assert result_obj["Single"] == 1
+    assert result_obj["Distinct"] == [0, 1, 2]
+
+
+def test_serialize_splits_compressed_values_by_distinct_values(compress_values):
+    # arrange
+    context = get_context()
+    for value in range(250):
+        context.put_metric("Latency", value)
+        context.put_metric("Latency", value)
+
+    # act
+    results = serializer.serialize(context)
+
+    # assert
+    assert len(results) == 3
+    compressed = [json.loads(result_json)["Latency"] for result_json in results]
+    assert [len(c["Values"]) for c in compressed] == [100, 100, 50]
+    assert sum(c["Count"] for c in compressed) == 500
+    assert sum(c["Sum"] for c in compressed) == 2 * sum(range(250))
+
+
+def test_serialize_histogram_metric_as_values_and_counts():
+    # arrange
+    context = get_context()
+    for value in [0, 10, 10, 10.01, 100, -5]:
+        context.put_metric("Latency", value, "Milliseconds", aggregation_type=AggregationType.HISTOGRAM)
+
+    # act
+    results = serializer.serialize(context)
+
+    # assert
+    assert len(results) == 1
+    histogram = json.loads(results[0])["Latency"]
+    assert histogram["Counts"] == [1, 1, 3, 1]
+    assert histogram["Values"][0] == pytest.approx(-5, rel=0.01)
+    assert histogram["Values"][1:] == [0, pytest.approx(10, rel=0.01), pytest.approx(100, rel=0.01)]
+    assert (histogram["Max"], histogram["Min"], histogram["Count"], histogram["Sum"]) == (100, -5, 6, pytest.approx(125.01))
+
+
+def test_serialize_splits_histogram_by_buckets():
+    # arrange
+    context = get_context()
+    for value in range(1, 1001):
+        context.put_metric("Latency", value, aggregation_type=AggregationType.HISTOGRAM)
+
+    # act
+    results = serializer.serialize(context)
+
+    # assert
+    histograms = [json.loads(result_json)["Latency"] for result_json in results]
+    assert len(histograms) > 1
+    assert all(len(h["Values"]) <= 100 for h in histograms)
+    assert sum(h["Count"] for h in histograms) == 1000
+    assert sum(h["Sum"] for h in histograms) == pytest.approx(sum(range(1, 1001)), rel=0.01)
+
+
+def test_get_json_encoder_falls_back_to_stdlib_for_unknown_encoder():
+    # act
+    encoder = get_json_encoder("not-an-encoder")
+
+    # assert
+    assert encoder.name() == "json"
+
+
+def test_get_json_encoder_prefers_orjson_when_installed():
+    # arrange
+    pytest.importorskip("orjson")
+
+    # act
+    encoder = get_json_encoder("auto")
+
+    # assert
+    assert encoder.name() == "orjson"
+    assert get_json_encoder() is encoder
+
+
+def test_serialize_with_values_unsupported_by_orjson():
+    # arrange
+    expected_value = {1: 2 ** 70}
+    context = get_context()
+    context.set_property("Large", expected_value)
+    context.put_metric("Count", 1)
+
+    # act
+    result_json = serializer.serialize(context)[0]
+
+    # assert
+    assert json.loads(result_json)["Large"] == {"1": 2 ** 70}
 
 
 def test_serialize_metrics_with_aggregation_disabled():
@@ -364,6 +824,10 @@ def get_empty_payload():
     }
 
 
+def encode(obj):
+    return get_json_encoder(get_config().json_encoder).encode(obj)
+
+
 def assert_json_equality(actual_json, expected_obj):
     actual_obj = json.loads(actual_json)
     print("Expected: ", expected_obj)
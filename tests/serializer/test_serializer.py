@@ -0,0 +1,58 @@
+from aws_embedded_metrics.logger.metrics_context import MetricsContext
+from aws_embedded_metrics.serializers import Serializer
+from faker import Faker
+from typing import List
+
+fake = Faker()
+
+
+class InstanceSerializer(Serializer):
+    def __init__(self, prefix: str):
+        self.prefix = prefix
+
+    def serialize(self, context: MetricsContext) -> List[str]:
+        return [self.prefix + key for key in context.metrics]
+
+
+def create_context(*keys):
+    context = MetricsContext.empty()
+    for key in keys:
+        context.put_metric(key, fake.random.randint(1, 100))
+    return context
+
+
+def test_serialize_iter_calls_instance_serialize():
+    # arrange
+    serializer = InstanceSerializer("event-")
+    context = create_context("Latency", "Errors")
+
+    # act
+    events = list(serializer.serialize_iter(context))
+
+    # assert
+    assert events == ["event-Latency", "event-Errors"]
+
+
+def test_serialize_to_bytes_calls_instance_serialize():
+    # arrange
+    serializer = InstanceSerializer("event-")
+    context = create_context("Latency", "Errors")
+
+    # act
+    payloads = list(serializer.serialize_to_bytes(context))
+
+    # assert
+    assert payloads == [b"event-Latency\n", b"event-Errors\n"]
+
+
+def test_serialize_into_calls_instance_serialize():
+    # arrange
+    serializer = InstanceSerializer("event-")
+    context = create_context("Latency")
+    buffer = bytearray(b"previous\n")
+
+    # act
+    serializer.serialize_into(context, buffer)
+
+    # assert
+    assert buffer == b"previous\nevent-Latency\n"
@@ -1,6 +1,7 @@
 from aws_embedded_metrics.logger.metrics_context import MetricsContext
 from aws_embedded_metrics.sinks.agent_sink import AgentSink
 from aws_embedded_metrics.config import get_config
+from aws_embedded_metrics.serializers import Serializer
 from unittest.mock import patch, Mock
 
 
@@ -93,3 +94,42 @@ def test_more_than_max_number_of_metrics(mock_get_socket_client):
 
     # assert
     assert expected_send_message_calls == mock_tcp_client.send_message.call_count
+
+
+@patch("aws_embedded_metrics.sinks.agent_sink.get_socket_client")
+def test_accept_sends_newline_terminated_bytes(mock_get_socket_client):
+    # arrange
+    context = MetricsContext.empty()
+    context.put_metric("Latency", 1)
+
+    mock_tcp_client = Mock()
+    mock_get_socket_client.return_value = mock_tcp_client
+
+    # act
+    sink = AgentSink("logGroup")
+    sink.accept(context)
+
+    # assert
+    message = mock_tcp_client.send_message.call_args.args[0]
+    assert isinstance(message, bytes)
+    assert message.endswith(b"}\n")
+    assert message.count(b"\n") == 1
+
+
+@patch("aws_embedded_metrics.sinks.agent_sink.get_socket_client")
+def test_accept_supports_serializers_without_serialize_iter(mock_get_socket_client):
+    # arrange
+    class ListSerializer(Serializer):
+        @staticmethod
+        def serialize(context):
+            return ["a", "b"]
+
+    mock_tcp_client = Mock()
+    mock_get_socket_client.return_value = mock_tcp_client
+
+    # act
+    sink = AgentSink("", serializer=ListSerializer())
+    sink.accept(MetricsContext.empty())
+
+    # assert
+    assert [c.args[0] for c in mock_tcp_client.send_message.call_args_list] == [b"a\n", b"b\n"]
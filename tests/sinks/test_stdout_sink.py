@@ -5,13 +5,15 @@ from aws_embedded_metrics.sinks.stdout_sink import StdoutSink
 from aws_embedded_metrics.logger.metrics_context import MetricsContext
 from faker import Faker
 from unittest.mock import patch
+import pytest
 
 
 fake = Faker()
 
 
-def test_accept_writes_to_stdout(capfd):
+def test_accept_writes_to_stdout(capfd, monkeypatch):
     # arrange
+    monkeypatch.setenv("AWS_EMF_JSON_ENCODER", "json")
     reload(config)
 
     sink = StdoutSink()
@@ -27,7 +29,7 @@ def test_accept_writes_to_stdout(capfd):
     assert (
         out
         == '{"_aws": {"Timestamp": 1, "CloudWatchMetrics": [{"Dimensions": [], "Metrics": [{"Name": "Dummy", "Unit": "None"}], '
-           '"Namespace": "aws-embedded-metrics"}]}, "Dummy": 1}\n'
+           '"Namespace": "aws-embedded-metrics"}]}, "Dummy": 1.0}\n'
     )
 
 
@@ -35,7 +37,7 @@ def test_accept_writes_to_stdout(capfd):
 def test_accept_writes_multiple_messages_to_stdout(mock_serializer, capfd):
     # arrange
     expected_messages = [fake.word() for _ in range(10)]
-    mock_serializer.serialize.return_value = expected_messages
+    mock_serializer.serialize_iter.return_value = iter(expected_messages)
     sink = StdoutSink(serializer=mock_serializer)
     context = MetricsContext.empty()
     context.meta["Timestamp"] = 1
@@ -47,3 +49,26 @@ def test_accept_writes_multiple_messages_to_stdout(mock_serializer, capfd):
     out, err = capfd.readouterr()
     assert len(out.split()) == len(expected_messages)
     assert out.split() == expected_messages
+
+
+def test_accept_writes_compact_json_with_orjson(capfd, monkeypatch):
+    # arrange
+    pytest.importorskip("orjson")
+    monkeypatch.setenv("AWS_EMF_JSON_ENCODER", "orjson")
+    reload(config)
+
+    sink = StdoutSink()
+    context = MetricsContext.empty()
+    context.meta["Timestamp"] = 1
+    context.put_metric("Dummy", 1)
+
+    # act
+    sink.accept(context)
+
+    # assert
+    out, err = capfd.readouterr()
+    assert (
+        out
+        == '{"_aws":{"Timestamp":1,"CloudWatchMetrics":[{"Dimensions":[],"Metrics":[{"Name":"Dummy","Unit":"None"}],'
+           '"Namespace":"aws-embedded-metrics"}]},"Dummy":1.0}\n'
+    )